@@ -0,0 +1 @@
+"""Performance benchmarks for Hoot Scrapper (run with ``python -m benchmarks.run``)."""
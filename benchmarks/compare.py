@@ -0,0 +1,94 @@
+"""
+Compare two benchmark result files and flag regressions.
+
+Usage:
+    python -m benchmarks.compare baseline.json results.json --threshold 0.15
+
+Metrics ending in ``_per_sec`` are throughputs (higher is better) and metrics
+ending in ``_ms`` are latencies (lower is better); everything else is
+informational. Exits with status 1 if any metric regressed by more than the
+threshold.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+def flatten(document: dict, prefix: str = "") -> Dict[str, float]:
+    """Flatten nested results into ``{"sizes.1m.insert.rows_per_sec": value}``."""
+    metrics = {}
+    for key, value in document.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            metrics.update(flatten(value, name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[name] = float(value)
+    return metrics
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float = 0.15
+) -> List[Tuple[str, float, float, float, bool]]:
+    """
+    Compare the metrics present in both documents.
+
+    Args:
+        baseline: Results of the reference run
+        current: Results of the run under test
+        threshold: Relative change counted as a regression (0.15 = 15%)
+
+    Returns:
+        ``(metric, baseline, current, change, regressed)`` tuples, where
+        ``change`` is relative and positive means better
+    """
+    rows = []
+    old, new = flatten(baseline), flatten(current)
+    for name in sorted(old.keys() & new.keys()):
+        if name.startswith("meta."):
+            continue
+        if name.endswith("_per_sec"):
+            sign = 1
+        elif name.endswith("_ms"):
+            sign = -1
+        else:
+            continue
+        if old[name] == 0:
+            continue
+        change = sign * (new[name] - old[name]) / old[name]
+        rows.append((name, old[name], new[name], change, change < -threshold))
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare Hoot Scrapper benchmark results")
+    parser.add_argument("baseline", help="Results JSON of the reference run")
+    parser.add_argument("current", help="Results JSON of the run under test")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="Relative slowdown counted as a regression (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    rows = compare(baseline, current, args.threshold)
+
+    width = max((len(row[0]) for row in rows), default=10)
+    for name, old, new, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<{width}}  {old:>14,.1f}  {new:>14,.1f}  {change:+7.1%}{flag}")
+
+    regressions = sum(1 for row in rows if row[4])
+    if regressions:
+        print(f"\n{regressions} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
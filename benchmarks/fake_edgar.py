@@ -0,0 +1,145 @@
+"""Local stand-in for the EDGAR endpoints the scrapers hit."""
+
+import gzip
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.synthetic import feed_page, generate_filings, master_index
+from hootscrapper.models import Filing
+
+ROBOTS_TXT = b"User-agent: *\nDisallow: /cgi-bin/srch-edgar\nAllow: /\n"
+
+INDEX_RE = re.compile(r"^/Archives/edgar/full-index/(\d{4})/QTR([1-4])/master\.(idx|gz)$")
+
+
+class FakeEdgar(ThreadingHTTPServer):
+    """
+    HTTP server answering ``getcurrent`` feed pages, full-index files and robots.txt.
+
+    Responses are rendered from a fixed pool of synthetic filings and cached,
+    so the server costs little next to the client being measured. Every request
+    sleeps ``latency`` seconds first to model the network round trip.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        filings: int = 10_000,
+        index_rows: int = 50_000,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Generate the filing pool and bind the server.
+
+        Args:
+            filings: Filings available through the paginated feed
+            index_rows: Rows in every quarterly full-index file
+            latency: Seconds to wait before answering each request
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        self.latency = latency
+        self.feed: List[Filing] = list(generate_filings(filings, seed=1))
+        self.index_rows = index_rows
+        self.requests = 0
+        self.bytes_sent = 0
+        self._rendered: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        super().__init__((host, port), _Handler)
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the running server."""
+        return f"http://{self.server_address[0]}:{self.server_port}"
+
+    def feed_url(self) -> str:
+        """``getcurrent`` URL template with ``{start}``/``{count}`` placeholders."""
+        query = "action=getcurrent&start={start}&count={count}"
+        return f"{self.base_url}/cgi-bin/browse-edgar?{query}"
+
+    def index_url(self, year: int, quarter: int, compression: str = "gz") -> str:
+        """URL of one quarterly master index."""
+        return f"{self.base_url}/Archives/edgar/full-index/{year}/QTR{quarter}/master.{compression}"
+
+    def body(self, key: str, render) -> bytes:
+        """Return a rendered response body, rendering it once."""
+        with self._lock:
+            cached = self._rendered.get(key)
+        if cached is None:
+            cached = render()
+            with self._lock:
+                self._rendered[key] = cached
+        return cached
+
+    def route(self, path: str, params: Dict[str, List[str]]) -> Optional[bytes]:
+        """Build the body for a request path (None if nothing lives there)."""
+        if path == "/robots.txt":
+            return ROBOTS_TXT
+
+        if path == "/cgi-bin/browse-edgar":
+            start = int(params.get("start", ["0"])[0])
+            count = min(int(params.get("count", ["100"])[0]), 100)
+            return self.body(
+                f"feed:{start}:{count}",
+                lambda: feed_page(self.feed[start : start + count]),
+            )
+
+        match = INDEX_RE.match(path)
+        if match:
+            year, quarter, suffix = int(match[1]), int(match[2]), match[3]
+
+            def render() -> bytes:
+                seed = year * 10 + quarter
+                text = master_index(list(generate_filings(self.index_rows, seed=seed)))
+                return gzip.compress(text, compresslevel=1) if suffix == "gz" else text
+
+            return self.body(path, render)
+        return None
+
+    def __enter__(self) -> "FakeEdgar":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def _content_type(path: str) -> str:
+    if path.endswith(".gz"):
+        return "application/x-gzip"
+    return "text/html" if path.startswith("/cgi-bin/") else "text/plain"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: FakeEdgar
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        url = urlparse(self.path)
+        body = self.server.route(url.path, parse_qs(url.query))
+        status = HTTPStatus.OK if body is not None else HTTPStatus.NOT_FOUND
+        body = body if body is not None else b"Not Found"
+
+        with self.server._lock:
+            self.server.requests += 1
+            self.server.bytes_sent += len(body)
+        self.send_response(status)
+        self.send_header("Content-Type", _content_type(url.path))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
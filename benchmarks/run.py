@@ -0,0 +1,280 @@
+"""
+Benchmark the scraping, parsing, storage and reporting hot paths.
+
+Usage:
+    python -m benchmarks.run --sizes 10k,1m,10m --out results.json
+    python -m benchmarks.compare baseline.json results.json
+
+Network benchmarks run against ``benchmarks.fake_edgar`` on localhost, so
+results measure the client (pooling, prefetch, parsing) plus the configured
+``--latency`` rather than the SEC's servers.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from importlib.metadata import PackageNotFoundError, version
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+from benchmarks.fake_edgar import FakeEdgar
+from benchmarks.synthetic import feed_page, generate_filings
+from hootscrapper.scrapers.sec_edgar import SECEdgarScraper
+from hootscrapper.scrapers.sec_full_index import FullIndexSource
+from hootscrapper.storage import FilingQuery, FilingStorage
+from hootscrapper.utils import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = ("fetch", "parse", "insert", "export", "summary")
+SIZE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+INSERT_CHUNK = 100_000
+
+
+def parse_size(value: str) -> int:
+    """Parse "10k", "1m" or "2500" into a row count."""
+    value = value.strip().lower()
+    if value[-1:] in SIZE_SUFFIXES:
+        return int(float(value[:-1]) * SIZE_SUFFIXES[value[-1]])
+    return int(value)
+
+
+def _timed(func: Callable, repeat: int = 1) -> float:
+    """Median wall time of ``repeat`` calls, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _rate(count: float, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else 0.0
+
+
+class _LocalScraper(SECEdgarScraper):
+    """Scraper whose feed URL points at the fake server."""
+
+    def __init__(self, feed_url: str, **kwargs):
+        super().__init__(rate_limiter=RateLimiter(delay=0), **kwargs)
+        self.feed_url = feed_url
+
+    def _page_url(self, start: int) -> str:
+        return self.feed_url.format(start=start, count=100)
+
+
+def bench_fetch(server: FakeEdgar, pages: int) -> dict:
+    """Feed pages/sec per engine, and full-index rows/sec."""
+    results = {}
+    for engine in ("sync", "async"):
+        scraper = _LocalScraper(server.feed_url(), engine=engine)
+        sent = server.bytes_sent
+        filings: List = []
+        seconds = _timed(lambda f=filings, s=scraper: f.extend(s.scrape(limit=pages * 100)))
+        results[engine] = {
+            "pages": scraper.pages_fetched,
+            "pages_per_sec": _rate(scraper.pages_fetched, seconds),
+            "filings_per_sec": _rate(len(filings), seconds),
+            "mb_per_sec": _rate((server.bytes_sent - sent) / 1e6, seconds),
+        }
+
+    source = FullIndexSource(rate_limiter=RateLimiter(delay=0))
+    rows = 0
+
+    def stream() -> None:
+        nonlocal rows
+        rows = sum(1 for _ in source.iter_url(server.index_url(2025, 1)))
+
+    seconds = _timed(stream)
+    results["full_index"] = {"rows": rows, "rows_per_sec": _rate(rows, seconds)}
+    return results
+
+
+def bench_parse(repeat: int) -> dict:
+    """Rows/sec of both feed parsers on a full 100-row page."""
+    page = feed_page(list(generate_filings(100, seed=2)))
+    scraper = SECEdgarScraper(parser="lxml")
+    stamp = "2026-02-06T00:00:00"
+    rows = len(scraper.parse_page(page, 100, stamp))
+
+    bs4_seconds = _timed(
+        lambda: scraper._parse_filings_table(BeautifulSoup(page, "lxml"), 100, stamp), repeat
+    )
+    lxml_seconds = _timed(lambda: scraper._parse_filings_lxml(page, 100, stamp), repeat)
+    return {
+        "rows_per_page": rows,
+        "bs4_rows_per_sec": _rate(rows, bs4_seconds),
+        "lxml_rows_per_sec": _rate(rows, lxml_seconds),
+    }
+
+
+def bench_insert(storage: FilingStorage, size: int) -> dict:
+    """Rows/sec of ``insert_filings`` into an empty database (generation not timed)."""
+    filings = generate_filings(size, seed=3)
+    seconds = 0.0
+    inserted = 0
+    while chunk := list(islice(filings, INSERT_CHUNK)):
+        start = time.perf_counter()
+        inserted += storage.insert_filings(chunk)
+        seconds += time.perf_counter() - start
+    return {"rows": inserted, "rows_per_sec": _rate(inserted, seconds)}
+
+
+def bench_export(storage: FilingStorage, workdir: Path) -> dict:
+    """MB/s and rows/sec of a full CSV export."""
+    out = workdir / "export.csv"
+    count = 0
+
+    def export() -> None:
+        nonlocal count
+        count = storage.export_to_csv(str(out), watermark="benchmark")
+
+    seconds = _timed(export)
+    megabytes = out.stat().st_size / 1e6
+    out.unlink()
+    return {
+        "rows": count,
+        "mb": round(megabytes, 2),
+        "mb_per_sec": _rate(megabytes, seconds),
+        "rows_per_sec": _rate(count, seconds),
+    }
+
+
+def bench_summary(storage: FilingStorage, repeat: int) -> dict:
+    """Median latency of the summary and keyset query paths, in milliseconds."""
+    cik = storage.conn.execute("SELECT cik FROM filings LIMIT 1").fetchone()[0]
+
+    def ms(func: Callable) -> float:
+        return round(_timed(func, repeat) * 1000, 3)
+
+    return {
+        "summary_ms": ms(lambda: storage.get_summary()),
+        "summary_30d_ms": ms(lambda: storage.get_summary(days=30)),
+        "query_cik_page_ms": ms(lambda: storage.query_page(FilingQuery(cik=cik))),
+        "query_type_page_ms": ms(
+            lambda: storage.query_page(FilingQuery(filing_types=["10-K"]), page_size=100)
+        ),
+    }
+
+
+def run(
+    sizes: List[int],
+    sections: List[str],
+    workdir: Path,
+    latency: float = 0.0,
+    feed_pages: int = 50,
+    repeat: int = 5,
+) -> dict:
+    """
+    Run the selected benchmarks.
+
+    Args:
+        sizes: Table sizes (rows) for the insert/export/summary benchmarks
+        sections: Benchmarks to run (subset of ``SECTIONS``)
+        workdir: Directory for the benchmark databases
+        latency: Simulated per-request latency of the fake server (seconds)
+        feed_pages: Feed pages fetched per engine (the full index has 10x their rows)
+        repeat: Repetitions for the short benchmarks (the median is reported)
+
+    Returns:
+        Results document
+    """
+    try:
+        package_version = version("hootscrapper")
+    except PackageNotFoundError:
+        package_version = "unknown"
+
+    results: Dict[str, object] = {
+        "meta": {
+            "version": package_version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.utcnow().isoformat(),
+            "latency": latency,
+        }
+    }
+
+    if "fetch" in sections:
+        with FakeEdgar(feed_pages * 100, feed_pages * 1_000, latency) as server:
+            results["fetch"] = bench_fetch(server, feed_pages)
+    if "parse" in sections:
+        results["parse"] = bench_parse(repeat * 20)
+
+    per_size = [s for s in sections if s in ("insert", "export", "summary")]
+    if per_size:
+        results["sizes"] = {}
+    for size in sizes if per_size else []:
+        db_path = workdir / f"bench_{size}.db"
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+        logger.info(f"Benchmarking {size} rows")
+        with FilingStorage(str(db_path)) as storage:
+            entry = {"insert": bench_insert(storage, size)}
+            if "export" in sections:
+                entry["export"] = bench_export(storage, workdir)
+            if "summary" in sections:
+                entry["summary"] = bench_summary(storage, repeat)
+        if "insert" not in sections:
+            del entry["insert"]
+        entry["db_mb"] = round(db_path.stat().st_size / 1e6, 2)
+        results["sizes"][_label(size)] = entry
+    return results
+
+
+def _label(size: int) -> str:
+    for suffix, factor in sorted(SIZE_SUFFIXES.items(), key=lambda item: -item[1]):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{suffix}"
+    return str(size)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Hoot Scrapper benchmarks")
+    parser.add_argument(
+        "--sizes", default="10k,1m,10m", help="Table sizes, e.g. 10k,1m,10m (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--only", help=f"Comma-separated benchmarks to run ({', '.join(SECTIONS)}; default: all)"
+    )
+    parser.add_argument("--out", help="Write results JSON here (default: stdout)")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Fake server latency per request (seconds)"
+    )
+    parser.add_argument("--feed-pages", type=int, default=50, help="Feed pages per fetch engine")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions for short benchmarks")
+    parser.add_argument("--workdir", help="Directory for benchmark databases (default: temp dir)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    sections = args.only.split(",") if args.only else list(SECTIONS)
+    unknown = set(sections) - set(SECTIONS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+
+    with tempfile.TemporaryDirectory(prefix="hoot-bench-") as tmp:
+        workdir = Path(args.workdir or tmp)
+        workdir.mkdir(parents=True, exist_ok=True)
+        results = run(sizes, sections, workdir, args.latency, args.feed_pages, args.repeat)
+
+    document = json.dumps(results, indent=2)
+    if args.out:
+        Path(args.out).write_text(document + "\n")
+    else:
+        print(document)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Deterministic synthetic filings, feed pages and full-index files."""
+
+import random
+from datetime import date, timedelta
+from html import escape
+from typing import Iterator, List
+
+from hootscrapper.models import Filing
+
+# Roughly EDGAR's mix: ownership forms dominate, then current/periodic reports
+FILING_TYPES = ["4", "8-K", "10-Q", "SC 13G/A", "424B2", "10-K", "S-1", "D", "6-K", "13F-HR"]
+TYPE_WEIGHTS = [40, 15, 8, 8, 8, 3, 1, 7, 6, 4]
+
+WORDS = [
+    "Apple", "Global", "Capital", "Holdings", "Energy", "Partners", "Bio", "Pharma",
+    "Trust", "Financial", "Systems", "Technologies", "Realty", "Acquisition", "Growth",
+    "Pacific", "Atlantic", "Resources", "Networks", "Therapeutics",
+]  # fmt: skip
+SUFFIXES = ["Inc", "Corp", "LLC", "LP", "Ltd", "Co"]
+
+
+def company_names(count: int, seed: int = 0) -> List[str]:
+    """Generate ``count`` distinct-looking company names."""
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(WORDS)} {rng.choice(WORDS)} {rng.choice(SUFFIXES)} {i}" for i in range(count)
+    ]
+
+
+def generate_filings(
+    count: int,
+    seed: int = 0,
+    companies: int = 50_000,
+    start: date = date(2026, 2, 6),
+    days: int = 3650,
+) -> Iterator[Filing]:
+    """
+    Yield ``count`` synthetic filings, newest first, without holding them in memory.
+
+    Args:
+        count: Number of filings
+        seed: Random seed (the same seed always yields the same filings)
+        companies: Size of the company pool (filing counts per company are skewed)
+        start: Date of the newest filing
+        days: Number of days the filings are spread over
+
+    Yields:
+        Filing objects with unique accession numbers
+    """
+    rng = random.Random(seed)
+    names = company_names(companies, seed)
+    per_day = max(1, count // days)
+    for n in range(count):
+        # Pareto-skewed company choice: a few filers account for most filings
+        company = min(int(rng.paretovariate(1.2)) - 1, companies - 1)
+        cik = str(1_000_000 + company)
+        filed = start - timedelta(days=n // per_day)
+        accession = f"{1_000_000 + company:010d}-{filed.year % 100:02d}-{n:06d}"[:20]
+        yield Filing(
+            cik=cik,
+            company_name=names[company],
+            filing_type=rng.choices(FILING_TYPES, TYPE_WEIGHTS)[0],
+            filing_date=filed.isoformat(),
+            accession_number=accession,
+            document_url=f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}.txt",
+            scraped_at="2026-02-06T00:00:00",
+        )
+
+
+def feed_page(filings: List[Filing]) -> bytes:
+    """Render filings as a getcurrent page (same markup the scraper parses)."""
+    link = "/cgi-bin/browse-edgar?action=getcompany&amp;CIK={cik:010d}&amp;accession-number={a}"
+    rows = "".join(f"""<tr><td nowrap="nowrap">{escape(f.filing_type)}</td>
+<td><a href="{link.format(cik=int(f.cik), a=f.accession_number)}">{escape(f.company_name)}</a></td>
+<td>Documents</td><td>{f.filing_date}</td><td>{f.accession_number}</td></tr>
+""" for f in filings)
+    return (
+        "<html><head><title>Latest Filings</title></head><body>"
+        '<table class="header"><tr><td>EDGAR</td></tr></table>'
+        '<table class="tableFile2" summary="Results">'
+        "<tr><th>Form</th><th>Description</th><th></th><th>Accepted</th><th>Filing Date</th></tr>"
+        f"{rows}</table></body></html>"
+    ).encode()
+
+
+def master_index(filings: List[Filing]) -> bytes:
+    """Render filings as a master.idx file."""
+    header = (
+        "Description:           Master Index of EDGAR Dissemination Feed\n"
+        "Last Data Received:    February 6, 2026\n\n"
+        "CIK|Company Name|Form Type|Date Filed|Filename\n"
+        "--------------------------------------------------------------------------------\n"
+    )
+    lines = "".join(
+        f"{f.cik}|{f.company_name}|{f.filing_type}|{f.filing_date}|"
+        f"edgar/data/{f.cik}/{f.accession_number}.txt\n"
+        for f in filings
+    )
+    return (header + lines).encode("latin-1", "replace")
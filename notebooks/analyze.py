@@ -1,72 +1,116 @@
 """Simple analysis script for scraped SEC filings."""
 
 import sqlite3
-from collections import Counter
+import sys
 from pathlib import Path
+from typing import Optional
 
 
-def analyze_filings(db_path: str = "data/hoot.sqlite") -> None:
-    """Analyze scraped filings and print summary."""
-    
-    if not Path(db_path).exists():
-        print(f"❌ Database not found: {db_path}")
-        print("Run 'hoot scrape' first to collect data.")
-        return
+def load_from_parquet(parquet_path: str) -> tuple:
+    """Aggregate a Parquet dataset written by 'hoot export --format parquet' with Arrow."""
+    from hootscrapper.columnar import read_filings
 
-    conn = sqlite3.connect(db_path)
+    # Only the three columns used below are decoded
+    table = read_filings(parquet_path, columns=["company_name", "filing_type", "filing_date"])
+
+    def counts(column: str, top: Optional[int] = None) -> list:
+        grouped = table.group_by(column).aggregate([(column, "count")])
+        grouped = grouped.sort_by([(f"{column}_count", "descending")])
+        if top is not None:
+            grouped = grouped.slice(0, top)
+        return list(zip(grouped[column].to_pylist(), grouped[f"{column}_count"].to_pylist()))
+
+    recent = table.sort_by([("filing_date", "descending")]).slice(0, 5)
+    return (
+        table.num_rows,
+        counts("filing_type"),
+        counts("company_name", top=10),
+        list(zip(*(recent[c].to_pylist() for c in ("company_name", "filing_type", "filing_date")))),
+    )
+
+
+def load_from_sqlite(db_path: str) -> tuple:
+    """Read the summary counters hoot maintains in the SQLite database."""
+    # Read-only, so analysis never blocks a running scrape
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
     cursor = conn.cursor()
 
+    # Counts come from the summary counters hoot maintains on every insert
     # Total filings
-    cursor.execute("SELECT COUNT(*) FROM filings")
+    cursor.execute("SELECT COALESCE(SUM(count), 0) FROM summary_by_type")
     total = cursor.fetchone()[0]
 
     # Filing types distribution
-    cursor.execute("SELECT filing_type, COUNT(*) FROM filings GROUP BY filing_type")
+    cursor.execute("SELECT filing_type, count FROM summary_by_type")
     filing_types = cursor.fetchall()
 
     # Most active companies
     cursor.execute("""
-        SELECT company_name, COUNT(*) as count 
-        FROM filings 
-        GROUP BY company_name 
-        ORDER BY count DESC 
+        SELECT company_name, count
+        FROM summary_by_company
+        ORDER BY count DESC
         LIMIT 10
     """)
     top_companies = cursor.fetchall()
 
     # Recent filings
     cursor.execute("""
-        SELECT company_name, filing_type, filing_date 
-        FROM filings 
-        ORDER BY filing_date DESC 
+        SELECT company_name, filing_type, filing_date
+        FROM filings
+        ORDER BY filing_date DESC
         LIMIT 5
     """)
     recent = cursor.fetchall()
 
     conn.close()
+    return total, filing_types, top_companies, recent
+
+
+def analyze_filings(db_path: str = "data/hoot.sqlite", parquet_path: str = "data/parquet") -> None:
+    """
+    Analyze scraped filings and print summary.
+
+    The Parquet export is used when there is one and pyarrow is installed, since
+    Arrow aggregates millions of rows far faster than row-by-row SQLite.
+    """
+    if Path(parquet_path).is_dir():
+        try:
+            total, filing_types, top_companies, recent = load_from_parquet(parquet_path)
+        except ImportError:
+            print("pyarrow is not installed, reading the SQLite database instead.")
+            parquet_path = None
+    else:
+        parquet_path = None
+
+    if parquet_path is None:
+        if not Path(db_path).exists():
+            print(f"❌ Database not found: {db_path}")
+            print("Run 'hoot scrape' first to collect data.")
+            return
+        total, filing_types, top_companies, recent = load_from_sqlite(db_path)
 
     # Print analysis
     print("\n" + "="*60)
     print("📊 SEC EDGAR FILINGS ANALYSIS")
     print("="*60)
-    
+
     print(f"\n📈 Total Filings Collected: {total}")
-    
+
     print("\n📋 Filing Types Distribution:")
     for filing_type, count in sorted(filing_types, key=lambda x: x[1], reverse=True):
         percentage = (count / total * 100) if total > 0 else 0
         print(f"  {filing_type:15s} {count:4d} ({percentage:5.1f}%)")
-    
+
     print("\n🏢 Top 10 Most Active Companies:")
     for i, (company, count) in enumerate(top_companies, 1):
         print(f"  {i:2d}. {company[:50]:50s} {count:3d} filings")
-    
+
     print("\n🕒 5 Most Recent Filings:")
     for company, filing_type, date in recent:
         print(f"  {date} - {filing_type:10s} - {company[:40]}")
-    
+
     print("\n" + "="*60)
 
 
 if __name__ == "__main__":
-    analyze_filings()
+    analyze_filings(*sys.argv[1:])
@@ -0,0 +1,238 @@
+"""Content-addressed archive of raw fetched pages, and offline replay."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from hootscrapper.config import DEFAULT_ARCHIVE_PATH, INSERT_BATCH_SIZE, SEC_CURRENT_PAGE_SIZE
+from hootscrapper.scrapers.sec_edgar import Filing, SECEdgarScraper
+from hootscrapper.storage import FilingStorage, InsertResult
+
+logger = logging.getLogger(__name__)
+
+# Pages handed to each replay worker per round trip
+REPLAY_CHUNK_SIZE = 16
+
+
+@dataclass
+class ArchivedPage:
+    """One archived fetch of a URL (the body lives in the blob store)."""
+
+    url: str
+    digest: str
+    fetched_at: str
+    source: str
+
+
+class PageArchive:
+    """
+    Archive of raw pages, stored once per distinct body.
+
+    Bodies are zlib-compressed and keyed by their SHA-256 digest, so refetching
+    an unchanged page costs only a row in ``pages`` recording the URL and fetch
+    time. ``replay`` feeds the archive back through the parser without touching
+    the network.
+    """
+
+    def __init__(self, path: str = DEFAULT_ARCHIVE_PATH):
+        """Initialize archive, creating the database file if needed."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    digest TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    raw_size INTEGER NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT NOT NULL,
+                    digest TEXT NOT NULL REFERENCES blobs(digest),
+                    fetched_at TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    UNIQUE (url, digest)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_pages_fetched_at ON pages(fetched_at)
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def put(
+        self,
+        url: str,
+        content: bytes,
+        fetched_at: Optional[str] = None,
+        source: str = "sec-edgar",
+    ) -> str:
+        """
+        Archive a fetched page.
+
+        Args:
+            url: URL the page was fetched from
+            content: Raw page bytes
+            fetched_at: Fetch timestamp (defaults to now)
+            source: Name of the source whose parser understands the page
+
+        Returns:
+            SHA-256 hex digest of the content
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        fetched_at = fetched_at or datetime.utcnow().isoformat()
+
+        with self._lock, closing(self._connect()) as conn, conn:
+            stored = conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if stored is None:
+                body = zlib.compress(content)
+                conn.execute(
+                    "INSERT INTO blobs (digest, body, size, raw_size) VALUES (?, ?, ?, ?)",
+                    (digest, body, len(body), len(content)),
+                )
+            # An unchanged refetch keeps the first fetch time
+            conn.execute(
+                "INSERT OR IGNORE INTO pages (url, digest, fetched_at, source) "
+                "VALUES (?, ?, ?, ?)",
+                (url, digest, fetched_at, source),
+            )
+        return digest
+
+    def get(self, digest: str) -> Optional[bytes]:
+        """Return the archived body with the given digest."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT body FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        return zlib.decompress(row[0]) if row else None
+
+    def _page_filter(self, source: Optional[str], since: Optional[str]) -> Tuple[str, list]:
+        clauses, params = [], []
+        if source:
+            clauses.append("p.source = ?")
+            params.append(source)
+        if since:
+            clauses.append("p.fetched_at >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def iter_pages(
+        self, source: Optional[str] = None, since: Optional[str] = None
+    ) -> Iterator[ArchivedPage]:
+        """Yield archived fetches, oldest first."""
+        where, params = self._page_filter(source, since)
+        with closing(self._connect()) as conn:
+            yield from (
+                ArchivedPage(*row)
+                for row in conn.execute(
+                    f"SELECT url, digest, fetched_at, source FROM pages p {where} "
+                    "ORDER BY p.fetched_at, p.id",
+                    params,
+                )
+            )
+
+    def iter_compressed(
+        self, source: Optional[str] = None, since: Optional[str] = None
+    ) -> Iterator[Tuple[str, bytes]]:
+        """Yield ``(fetched_at, compressed body)`` for archived fetches, oldest first."""
+        where, params = self._page_filter(source, since)
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                f"SELECT p.fetched_at, b.body FROM pages p JOIN blobs b USING (digest) {where} "
+                "ORDER BY p.fetched_at, p.id",
+                params,
+            )
+            while rows := cursor.fetchmany(REPLAY_CHUNK_SIZE):
+                yield from rows
+
+    def stats(self) -> dict:
+        """Get archive statistics."""
+        with closing(self._connect()) as conn:
+            pages = conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            blobs, size, raw_size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(raw_size), 0) FROM blobs"
+            ).fetchone()
+        return {"pages": pages, "blobs": blobs, "bytes": size, "raw_bytes": raw_size}
+
+
+_scrapers: Dict[str, SECEdgarScraper] = {}
+
+
+def _parse_archived(parser: str, pages: List[Tuple[str, bytes]]) -> List[Filing]:
+    """Process-pool worker: decompress and parse a chunk of archived feed pages."""
+    scraper = _scrapers.get(parser)
+    if scraper is None:
+        scraper = _scrapers[parser] = SECEdgarScraper(parser=parser)
+
+    filings: List[Filing] = []
+    for fetched_at, body in pages:
+        filings.extend(
+            scraper.parse_page(zlib.decompress(body), SEC_CURRENT_PAGE_SIZE, scraped_at=fetched_at)
+        )
+    return filings
+
+
+def replay(
+    archive: PageArchive,
+    storage: FilingStorage,
+    parser: str = "lxml",
+    workers: Optional[int] = None,
+    since: Optional[str] = None,
+    batch_size: int = INSERT_BATCH_SIZE,
+    upsert: bool = False,
+) -> InsertResult:
+    """
+    Re-parse archived feed pages and load the filings into storage.
+
+    Chunks of pages are parsed in parallel across a process pool while the
+    parent process streams results, in archive order, into ``bulk_insert``.
+    Only a few chunks per worker are in flight, so memory stays bounded for any
+    archive size. Filings are stamped with the time their page was fetched,
+    not the time of the replay.
+
+    Args:
+        archive: Archive to read
+        storage: Destination storage
+        parser: Parser to run ("lxml" or "bs4")
+        workers: Worker processes (default: one per CPU)
+        since: Only replay pages fetched at or after this ISO timestamp
+        batch_size: Rows per insert transaction
+        upsert: Refresh existing rows instead of skipping them
+
+    Returns:
+        InsertResult from the load
+    """
+    workers = workers or os.cpu_count() or 1
+    pages = archive.iter_compressed(source="sec-edgar", since=since)
+    chunks = iter(lambda: list(islice(pages, REPLAY_CHUNK_SIZE)), [])
+
+    def parsed(pool: ProcessPoolExecutor) -> Iterator[Filing]:
+        window: deque = deque()
+        for chunk in chunks:
+            window.append(pool.submit(_parse_archived, parser, chunk))
+            if len(window) >= 2 * workers:
+                yield from window.popleft().result()
+        while window:
+            yield from window.popleft().result()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        result = storage.bulk_insert(parsed(pool), batch_size=batch_size, upsert=upsert)
+
+    logger.info(f"Replayed archive {archive.path} into {storage.db_path}")
+    return result
@@ -0,0 +1,156 @@
+"""On-disk HTTP response cache for conditional GETs."""
+
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+from hootscrapper.config import CACHE_MAX_BYTES, DEFAULT_CACHE_PATH
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    HTTP response cache keyed by URL.
+
+    Stores zlib-compressed bodies together with their ``ETag``/``Last-Modified``
+    validators. ``make_request`` sends the validators back and, when the server
+    answers 304 Not Modified, serves the cached body instead. Only responses with
+    a validator are stored, and the least recently used entries are evicted once
+    the compressed bodies exceed ``max_bytes``.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = CACHE_MAX_BYTES):
+        """Initialize cache, creating the database file if needed."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    raw_size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_http_cache_accessed ON http_cache(accessed_at)
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """
+        Get conditional request headers for a cached URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            ``If-None-Match``/``If-Modified-Since`` headers (empty if not cached)
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+
+        headers = {}
+        if row:
+            etag, last_modified = row
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Return the cached body for a URL and mark it as recently used."""
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT body FROM http_cache WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE http_cache SET accessed_at = ?, hits = hits + 1 WHERE url = ?",
+                (time.time(), url),
+            )
+        return zlib.decompress(row[0])
+
+    def put(self, url: str, response: "requests.Response") -> None:
+        """Store a 200 response if it carries a validator, then enforce the size bound."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+
+        body = zlib.compress(response.content)
+        now = time.time()
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO http_cache
+                (url, etag, last_modified, body, size, raw_size, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (url, etag, last_modified, body, len(body), len(response.content), now, now),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries until the cache fits in ``max_bytes``."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for url, size in conn.execute(
+            "SELECT url, size FROM http_cache ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM http_cache WHERE url = ?", (url,))
+            total -= size
+            evicted += 1
+        logger.debug(f"Evicted {evicted} cached responses")
+
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        with closing(self._connect()) as conn:
+            entries, size, raw_size, hits = conn.execute("""
+                SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(raw_size), 0),
+                       COALESCE(SUM(hits), 0)
+                FROM http_cache
+            """).fetchone()
+
+        return {
+            "entries": entries,
+            "bytes": size,
+            "raw_bytes": raw_size,
+            "hits": hits,
+            "max_bytes": self.max_bytes,
+        }
+
+    def purge(self) -> int:
+        """Remove all entries, returning how many were deleted."""
+        with self._lock, closing(self._connect()) as conn:
+            with conn:
+                deleted = conn.execute("DELETE FROM http_cache").rowcount
+            conn.execute("VACUUM")
+        logger.info(f"Purged {deleted} cached responses")
+        return deleted
@@ -1,12 +1,48 @@
-"""Command-line interface for Hoot Scrapper."""
+"""
+Command-line interface for Hoot Scrapper.
+
+The parser is built from configuration only; each subcommand lives in
+``hootscrapper.commands.<name>`` and is imported when it runs.
+"""
 
 import argparse
+import importlib
 import logging
 import sys
-
-from hootscrapper.config import DEFAULT_CSV_PATH, DEFAULT_DB_PATH, LOG_FORMAT, LOG_LEVEL
-from hootscrapper.scrapers.sec_edgar import SECEdgarScraper
-from hootscrapper.storage import FilingStorage
+from typing import Dict, List, Optional, Tuple
+
+from hootscrapper.config import (
+    CACHE_MAX_BYTES,
+    DEFAULT_ARCHIVE_PATH,
+    DEFAULT_CACHE_PATH,
+    DEFAULT_CSV_PATH,
+    DEFAULT_DB_PATH,
+    DEFAULT_PARQUET_PATH,
+    DEFAULT_SHARD_PATH,
+    DEFAULT_STATUS_PATH,
+    INSERT_BATCH_SIZE,
+    LOG_FORMAT,
+    LOG_LEVEL,
+    MAX_CONCURRENCY,
+    MIGRATE_BATCH_SIZE,
+    RATE_BURST,
+    RATE_LIMIT_DB_NAME,
+    SERVE_CACHE_ENTRIES,
+    SERVE_HOST,
+    SERVE_POOL_SIZE,
+    SERVE_PORT,
+    SHARD_CLOSE_AFTER_DAYS,
+    SHARD_PERIOD,
+    SHARD_PERIODS,
+    SQLITE_PROFILE,
+    SQLITE_PROFILES,
+    WATCH_MAX_INTERVAL,
+    WATCH_MIN_INTERVAL,
+    WATCHLIST_MAX_REQUESTS,
+)
+
+# Modules listed by --import-profile
+IMPORT_PROFILE_TOP = 25
 
 
 def setup_logging(level: str = LOG_LEVEL) -> None:
@@ -14,64 +50,88 @@ def setup_logging(level: str = LOG_LEVEL) -> None:
     logging.basicConfig(level=getattr(logging, level.upper()), format=LOG_FORMAT)
 
 
-def cmd_scrape(args: argparse.Namespace) -> None:
-    """Run the scraper."""
-    setup_logging(args.log_level)
-    logger = logging.getLogger(__name__)
+def run_command(args: argparse.Namespace) -> None:
+    """Import the subcommand's module and run it."""
+    module = importlib.import_module(f"hootscrapper.commands.{args.command}")
+    if not args.metrics_out:
+        module.run(args)
+        return
 
-    logger.info(f"Starting scrape: source={args.source}, limit={args.limit}")
+    from hootscrapper import metrics
 
-    if args.source == "sec-edgar":
-        scraper = SECEdgarScraper(delay=args.delay)
-        filings = scraper.scrape(limit=args.limit)
+    metrics.enable()
+    try:
+        module.run(args)
+    finally:
+        metrics.REGISTRY.write_report(args.metrics_out, command=args.command, argv=sys.argv[1:])
 
-        if not filings:
-            logger.error("No filings scraped")
-            sys.exit(1)
 
-        storage = FilingStorage(args.out)
-        inserted = storage.insert_filings(filings)
+def parse_importtime(lines: List[str]) -> List[Tuple[str, int, int, int]]:
+    """
+    Parse ``python -X importtime`` output.
 
-        logger.info(f"✅ Scrape complete: {inserted} new filings saved to {args.out}")
-    else:
-        logger.error(f"Unknown source: {args.source}")
-        sys.exit(1)
+    Args:
+        lines: stderr lines of the profiled process
 
+    Returns:
+        ``(module, self_us, cumulative_us, depth)`` per imported module, in import order
+    """
+    entries = []
+    for line in lines:
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
 
-def cmd_export(args: argparse.Namespace) -> None:
-    """Export data to CSV."""
-    setup_logging(args.log_level)
-    logger = logging.getLogger(__name__)
 
-    storage = FilingStorage(args.db)
-    storage.export_to_csv(args.out)
-
-    logger.info(f"✅ Export complete: {args.out}")
-
-
-def cmd_summary(args: argparse.Namespace) -> None:
-    """Show data summary."""
-    setup_logging(args.log_level)
+def import_profile(argv: List[str]) -> int:
+    """
+    Re-run ``hoot`` under ``-X importtime`` and report where startup time goes.
 
-    storage = FilingStorage(args.db)
-    summary = storage.get_summary()
+    The command's own output passes through unchanged; the report goes to stderr.
 
-    print("\n📊 Hoot Scrapper Summary")
-    print("=" * 50)
-    print(f"\nTotal filings: {summary['total_filings']}")
+    Args:
+        argv: Command-line arguments without ``--import-profile``
 
-    print("\n🔝 Top filing types:")
-    for filing_type, count in summary["top_filing_types"]:
-        print(f"  {filing_type}: {count}")
+    Returns:
+        Exit status of the profiled command
+    """
+    import subprocess
 
-    print("\n🏢 Top companies:")
-    for company, count in summary["top_companies"]:
-        print(f"  {company}: {count}")
-
-    print()
-
-
-def main() -> None:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "hootscrapper.cli", *argv],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    stderr = process.stderr.splitlines()
+    for line in stderr:
+        if not line.startswith("import time:"):
+            print(line, file=sys.stderr)
+
+    entries = parse_importtime(stderr)
+    total = sum(cumulative for _, _, cumulative, depth in entries if depth == 0)
+    packages: Dict[str, int] = {}
+    for name, self_us, _, _ in entries:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    out = sys.stderr
+    print(f"\n⏱️  Import profile: {len(entries)} modules, {total / 1000:.1f} ms", file=out)
+    print("=" * 50, file=out)
+    print(f"{'cumulative':>12} {'self':>10}  module", file=out)
+    for name, self_us, cumulative, depth in sorted(entries, key=lambda e: -e[2])[
+        :IMPORT_PROFILE_TOP
+    ]:
+        print(f"{cumulative / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {name}", file=out)
+    print("\nBy top-level package (self time):", file=out)
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:10]:
+        print(f"{self_us / 1000:>10.1f}ms  {package}", file=out)
+    return process.returncode
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
         description="Hoot Scrapper - Portfolio-ready SEC EDGAR scraper",
@@ -79,41 +139,460 @@ def main() -> None:
     )
 
     parser.add_argument("--log-level", default=LOG_LEVEL, help="Logging level")
+    parser.add_argument(
+        "--metrics-out",
+        help="Record timings and counters and write them to this JSON file on exit",
+    )
+    parser.add_argument(
+        "--import-profile",
+        action="store_true",
+        help="Run the command under 'python -X importtime' and report import time per module",
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # scrape command
     scrape_parser = subparsers.add_parser("scrape", help="Scrape data from a source")
     scrape_parser.add_argument(
-        "--source", default="sec-edgar", help="Data source (default: sec-edgar)"
+        "--source",
+        default="sec-edgar",
+        help="Data source: sec-edgar, sec-full-index or sec-submissions (default: sec-edgar)",
     )
     scrape_parser.add_argument(
-        "--limit", type=int, default=100, help="Max number of items to scrape"
+        "--limit",
+        type=int,
+        default=None,
+        help="Max number of items to scrape (default: 100 for sec-edgar, no limit otherwise)",
     )
     scrape_parser.add_argument("--out", default=DEFAULT_DB_PATH, help="Output database path")
     scrape_parser.add_argument(
         "--delay", type=float, default=0.5, help="Delay between requests (seconds)"
     )
-    scrape_parser.set_defaults(func=cmd_scrape)
+    scrape_parser.add_argument(
+        "--burst",
+        type=int,
+        default=RATE_BURST,
+        help=f"Requests allowed back-to-back before --delay applies (default: {RATE_BURST})",
+    )
+    scrape_parser.add_argument(
+        "--shared-rate-limit",
+        action="store_true",
+        help=f"Share the rate budget with other hoot processes via {RATE_LIMIT_DB_NAME} "
+        "next to the output database",
+    )
+    scrape_parser.add_argument(
+        "--engine",
+        choices=["sync", "async"],
+        default="sync",
+        help="Fetch engine: sync (one request at a time) or async (concurrent, pooled)",
+    )
+    scrape_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MAX_CONCURRENCY,
+        help=f"Max in-flight requests for the async engine (default: {MAX_CONCURRENCY})",
+    )
+    scrape_parser.add_argument(
+        "--parser",
+        choices=["lxml", "bs4"],
+        default="lxml",
+        help="Feed page parser: lxml (fast, streaming) or bs4 (BeautifulSoup)",
+    )
+    scrape_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="sec-edgar: ignore the stored high-water mark and page up to --limit",
+    )
+    scrape_parser.add_argument(
+        "--archive",
+        nargs="?",
+        const=DEFAULT_ARCHIVE_PATH,
+        help=f"Keep every fetched feed page for 'hoot replay' (default path: {DEFAULT_ARCHIVE_PATH})",
+    )
+    scrape_parser.add_argument(
+        "--cache", default=DEFAULT_CACHE_PATH, help="HTTP response cache path"
+    )
+    scrape_parser.add_argument(
+        "--no-cache", action="store_true", help="Disable conditional GETs via the response cache"
+    )
+    scrape_parser.add_argument(
+        "--years", help="sec-full-index: years to load, e.g. 2023 or 2015-2023"
+    )
+    scrape_parser.add_argument(
+        "--quarters", default="1,2,3,4", help="sec-full-index: quarters to load (default: all)"
+    )
+    scrape_parser.add_argument(
+        "--index-dir", help="sec-full-index: load .idx/.gz/.zip files from a local directory"
+    )
+    scrape_parser.add_argument(
+        "--index-kind",
+        choices=["master", "form"],
+        default="master",
+        help="sec-full-index: index flavor to download (default: master)",
+    )
+    scrape_parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=WATCHLIST_MAX_REQUESTS,
+        help="sec-submissions: max watchlist companies fetched per run "
+        f"(default: {WATCHLIST_MAX_REQUESTS})",
+    )
+    scrape_parser.add_argument(
+        "--submissions-zip",
+        help="sec-submissions: read a local bulk submissions.zip instead of data.sec.gov "
+        "(watchlist companies only, or every company if the watchlist is empty)",
+    )
+    scrape_parser.add_argument(
+        "--history",
+        action="store_true",
+        help="sec-submissions: also read paged files with filings beyond the ~1000 most recent",
+    )
+    scrape_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=INSERT_BATCH_SIZE,
+        help=f"Rows per insert transaction (default: {INSERT_BATCH_SIZE})",
+    )
+    scrape_parser.add_argument(
+        "--upsert",
+        action="store_true",
+        help="Refresh document_url/scraped_at of already-stored filings instead of skipping",
+    )
+    scrape_parser.add_argument(
+        "--sqlite-profile",
+        choices=sorted(SQLITE_PROFILES),
+        default=SQLITE_PROFILE,
+        help=f"SQLite pragma profile (default: {SQLITE_PROFILE}; 'bulk' for large loads)",
+    )
+
+    # watch command
+    watch_parser = subparsers.add_parser(
+        "watch", help="Poll the EDGAR feed continuously with an adaptive interval"
+    )
+    watch_parser.add_argument("--out", default=DEFAULT_DB_PATH, help="Output database path")
+    watch_parser.add_argument(
+        "--limit", type=int, default=1000, help="Max filings per cycle (default: 1000)"
+    )
+    watch_parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=WATCH_MIN_INTERVAL,
+        help=f"Shortest pause between polls in seconds (default: {WATCH_MIN_INTERVAL:g})",
+    )
+    watch_parser.add_argument(
+        "--max-interval",
+        type=float,
+        default=WATCH_MAX_INTERVAL,
+        help=f"Longest pause between polls in seconds (default: {WATCH_MAX_INTERVAL:g})",
+    )
+    watch_parser.add_argument(
+        "--status-file",
+        default=DEFAULT_STATUS_PATH,
+        help=f"Health/status JSON rewritten after every poll (default: {DEFAULT_STATUS_PATH})",
+    )
+    watch_parser.add_argument(
+        "--max-cycles", type=int, help="Exit after this many polls (default: run until stopped)"
+    )
+    watch_parser.add_argument(
+        "--delay", type=float, default=0.5, help="Delay between requests (seconds)"
+    )
+    watch_parser.add_argument(
+        "--burst",
+        type=int,
+        default=RATE_BURST,
+        help=f"Requests allowed back-to-back before --delay applies (default: {RATE_BURST})",
+    )
+    watch_parser.add_argument(
+        "--shared-rate-limit",
+        action="store_true",
+        help=f"Share the rate budget with other hoot processes via {RATE_LIMIT_DB_NAME}",
+    )
+    watch_parser.add_argument(
+        "--cache", default=DEFAULT_CACHE_PATH, help="HTTP response cache path"
+    )
+    watch_parser.add_argument(
+        "--no-cache", action="store_true", help="Disable conditional GETs via the response cache"
+    )
+    watch_parser.add_argument(
+        "--sqlite-profile",
+        choices=sorted(SQLITE_PROFILES),
+        default=SQLITE_PROFILE,
+        help=f"SQLite pragma profile (default: {SQLITE_PROFILE})",
+    )
+    watch_parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve Prometheus metrics at http://127.0.0.1:PORT/metrics",
+    )
+
+    # watchlist command
+    watchlist_parser = subparsers.add_parser(
+        "watchlist", help="Manage companies polled by 'scrape --source sec-submissions'"
+    )
+    watchlist_parser.add_argument("action", choices=["add", "remove", "list"], help="Action")
+    watchlist_parser.add_argument("ciks", nargs="*", help="Company CIKs (leading zeros optional)")
+    watchlist_parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Database path")
+    watchlist_parser.add_argument(
+        "--file", help="Read CIKs from this file (one per line, '#' starts a comment)"
+    )
+    watchlist_parser.add_argument(
+        "--priority",
+        type=int,
+        default=0,
+        help="add: poll priority; each level divides the poll interval (default: 0)",
+    )
 
     # export command
-    export_parser = subparsers.add_parser("export", help="Export data to CSV")
+    export_parser = subparsers.add_parser("export", help="Export data to CSV or Parquet")
     export_parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Database path")
-    export_parser.add_argument("--out", default=DEFAULT_CSV_PATH, help="Output CSV path")
-    export_parser.set_defaults(func=cmd_export)
+    export_parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Output format; parquet writes a dataset partitioned by year/month/filing_type",
+    )
+    export_parser.add_argument(
+        "--out",
+        help=f"Output path (default: {DEFAULT_CSV_PATH}, or {DEFAULT_PARQUET_PATH}/ for parquet)",
+    )
+    export_parser.add_argument(
+        "--since",
+        help="Only rows added since the last export ('last') or an ISO timestamp",
+    )
+    export_parser.add_argument(
+        "--compression",
+        choices=["gzip", "zstd"],
+        help="Compress CSV output (default: inferred from a .gz/.zst extension)",
+    )
+    export_parser.add_argument(
+        "--watermark",
+        help="Export watermark to read with --since last and advance; only --since last "
+        "exports advance one otherwise (default: the format name)",
+    )
 
     # summary command
     summary_parser = subparsers.add_parser("summary", help="Show data summary")
     summary_parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Database path")
-    summary_parser.set_defaults(func=cmd_summary)
+    summary_parser.add_argument(
+        "--parquet", help="Summarize a Parquet dataset (from 'hoot export --format parquet')"
+    )
+    summary_parser.add_argument(
+        "--days", type=int, help="Only count filings dated within the last N days, today included"
+    )
+    summary_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recompute the summary counters from the filings table first",
+    )
 
-    args = parser.parse_args()
+    # enrich command
+    enrich_parser = subparsers.add_parser(
+        "enrich", help="Fetch filing detail pages (period, primary document, sizes, SIC)"
+    )
+    enrich_parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Database path")
+    enrich_parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_CONCURRENCY,
+        help=f"Max detail pages in flight (default: {MAX_CONCURRENCY})",
+    )
+    enrich_parser.add_argument(
+        "--limit", type=int, help="Stop after this many filings (the rest stay queued)"
+    )
+    enrich_parser.add_argument(
+        "--filing-type",
+        action="append",
+        help="Only enrich this filing type (repeatable, default: all)",
+    )
+    enrich_parser.add_argument(
+        "--retry-failed", action="store_true", help="Requeue filings that failed earlier"
+    )
+    enrich_parser.add_argument(
+        "--delay", type=float, default=0.5, help="Delay between requests (seconds)"
+    )
+    enrich_parser.add_argument(
+        "--burst",
+        type=int,
+        default=RATE_BURST,
+        help=f"Requests allowed back-to-back before --delay applies (default: {RATE_BURST})",
+    )
+    enrich_parser.add_argument(
+        "--shared-rate-limit",
+        action="store_true",
+        help=f"Share the rate budget with other hoot processes via {RATE_LIMIT_DB_NAME}",
+    )
+    enrich_parser.add_argument(
+        "--sqlite-profile",
+        choices=sorted(SQLITE_PROFILES),
+        default=SQLITE_PROFILE,
+        help=f"SQLite pragma profile (default: {SQLITE_PROFILE})",
+    )
+
+    # replay command
+    replay_parser = subparsers.add_parser(
+        "replay", help="Re-parse archived pages offline into the database"
+    )
+    replay_parser.add_argument("--archive", default=DEFAULT_ARCHIVE_PATH, help="Page archive path")
+    replay_parser.add_argument("--out", default=DEFAULT_DB_PATH, help="Output database path")
+    replay_parser.add_argument(
+        "--parser", choices=["lxml", "bs4"], default="lxml", help="Feed page parser"
+    )
+    replay_parser.add_argument(
+        "--workers", type=int, help="Parser processes (default: one per CPU)"
+    )
+    replay_parser.add_argument(
+        "--since", help="Only replay pages fetched at or after this ISO timestamp"
+    )
+    replay_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=INSERT_BATCH_SIZE,
+        help=f"Rows per insert transaction (default: {INSERT_BATCH_SIZE})",
+    )
+    replay_parser.add_argument(
+        "--upsert",
+        action="store_true",
+        help="Refresh document_url/scraped_at of already-stored filings instead of skipping",
+    )
+    replay_parser.add_argument(
+        "--sqlite-profile",
+        choices=sorted(SQLITE_PROFILES),
+        default=SQLITE_PROFILE,
+        help=f"SQLite pragma profile (default: {SQLITE_PROFILE})",
+    )
+
+    # query command
+    query_parser = subparsers.add_parser(
+        "query", help="List filings by CIK, type, date range and company"
+    )
+    query_parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Database path")
+    query_parser.add_argument("--cik", help="Company CIK (leading zeros optional)")
+    query_parser.add_argument(
+        "--filing-type", action="append", help="Filing type, e.g. 8-K (repeatable)"
+    )
+    query_parser.add_argument(
+        "--from", dest="date_from", help="Earliest filing date, YYYY-MM-DD (inclusive)"
+    )
+    query_parser.add_argument(
+        "--to", dest="date_to", help="Latest filing date, YYYY-MM-DD (inclusive)"
+    )
+    query_parser.add_argument("--company", help="Company name words (prefix match)")
+    query_parser.add_argument("--limit", type=int, default=100, help="Rows per page (default: 100)")
+    query_parser.add_argument("--after", help="Cursor printed by the previous page")
+    query_parser.add_argument(
+        "--json", action="store_true", help="Print one JSON object per line (NDJSON)"
+    )
+
+    # search command
+    search_parser = subparsers.add_parser(
+        "search", help="Full-text search by company name and filing type"
+    )
+    search_parser.add_argument("query", nargs="+", help="Words to search for")
+    search_parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Database path")
+    search_parser.add_argument("--page", type=int, default=1, help="Result page (default: 1)")
+    search_parser.add_argument(
+        "--page-size", type=int, default=20, help="Results per page (default: 20)"
+    )
+    search_parser.add_argument(
+        "--fuzzy", action="store_true", help="Also match close spellings of each word"
+    )
+    search_parser.add_argument(
+        "--exact", action="store_true", help="Match whole words only (no prefix matching)"
+    )
+    search_parser.add_argument("--filing-type", help="Only show filings of this type")
+
+    # serve command
+    serve_parser = subparsers.add_parser(
+        "serve", help="Serve the database over a read-only HTTP API"
+    )
+    serve_parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Database path")
+    serve_parser.add_argument(
+        "--host", default=SERVE_HOST, help=f"Interface to bind (default: {SERVE_HOST})"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=SERVE_PORT, help=f"Port to listen on (default: {SERVE_PORT})"
+    )
+    serve_parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=SERVE_POOL_SIZE,
+        help=f"Read-only connections shared by requests (default: {SERVE_POOL_SIZE})",
+    )
+    serve_parser.add_argument(
+        "--cache-entries",
+        type=int,
+        default=SERVE_CACHE_ENTRIES,
+        help=f"Responses kept in the in-process LRU cache (default: {SERVE_CACHE_ENTRIES})",
+    )
+    serve_parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Record request timings and expose them in Prometheus format at /metrics",
+    )
+
+    # cache command
+    cache_parser = subparsers.add_parser("cache", help="Inspect or purge the HTTP cache")
+    cache_parser.add_argument("action", choices=["stats", "purge"], help="Cache action")
+    cache_parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="HTTP cache path")
+    cache_parser.add_argument(
+        "--max-bytes", type=int, default=CACHE_MAX_BYTES, help="Cache size bound in bytes"
+    )
+
+    # migrate command
+    migrate_parser = subparsers.add_parser(
+        "migrate", help="Convert a database to the compact schema while it stays in use"
+    )
+    migrate_parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Database path")
+    migrate_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=MIGRATE_BATCH_SIZE,
+        help=f"Rows copied per transaction (default: {MIGRATE_BATCH_SIZE})",
+    )
+    migrate_parser.add_argument(
+        "--vacuum",
+        action="store_true",
+        help="Rewrite the file afterwards to return the old table's space (blocks other access)",
+    )
+
+    # shards command
+    shards_parser = subparsers.add_parser(
+        "shards", help="Create, list or maintain a directory of per-period database shards"
+    )
+    shards_parser.add_argument("action", choices=["init", "list", "maintain"], help="Action")
+    shards_parser.add_argument("--db", default=DEFAULT_SHARD_PATH, help="Shard directory")
+    shards_parser.add_argument(
+        "--by",
+        choices=SHARD_PERIODS,
+        default=SHARD_PERIOD,
+        help=f"init: filing_date period per shard (default: {SHARD_PERIOD})",
+    )
+    shards_parser.add_argument(
+        "--from", dest="source", help="init: import an existing single-file database"
+    )
+    shards_parser.add_argument(
+        "--close-after-days",
+        type=int,
+        default=SHARD_CLOSE_AFTER_DAYS,
+        help="maintain: days after a period ends before its shard is closed "
+        f"(default: {SHARD_CLOSE_AFTER_DAYS})",
+    )
+    shards_parser.add_argument(
+        "--hot", action="store_true", help="list: print only the hot shard's file path"
+    )
+
+    argv = sys.argv[1:] if argv is None else argv
+    args = parser.parse_args(argv)
+
+    if args.import_profile:
+        sys.exit(import_profile([a for a in argv if a != "--import-profile"]))
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    args.func(args)
+    setup_logging(args.log_level)
+    run_command(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,223 @@
+"""Columnar Parquet export and Arrow-backed analytics.
+
+Requires the optional ``pyarrow`` dependency (``pip install 'hootscrapper[parquet]'``).
+"""
+
+import logging
+import uuid
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from hootscrapper.config import EXPORT_BATCH_SIZE
+from hootscrapper.storage import FilingStorage, export_watermark
+
+logger = logging.getLogger(__name__)
+
+
+def _pyarrow():
+    """Import pyarrow, with an actionable error if it is missing."""
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.dataset
+    except ImportError as e:
+        raise RuntimeError(
+            "Parquet support requires the 'pyarrow' package "
+            "(pip install 'hootscrapper[parquet]')"
+        ) from e
+    return pyarrow
+
+
+def filing_schema():
+    """Arrow schema of exported filings, including the partition columns."""
+    pa = _pyarrow()
+    return pa.schema(
+        [
+            ("id", pa.int64()),
+            ("cik", pa.string()),
+            ("company_name", pa.string()),
+            ("filing_type", pa.string()),
+            ("filing_date", pa.date32()),
+            ("accession_number", pa.string()),
+            ("document_url", pa.string()),
+            ("scraped_at", pa.string()),
+            ("created_at", pa.string()),
+            ("year", pa.int16()),
+            ("month", pa.int8()),
+        ]
+    )
+
+
+def _partitioning():
+    """Hive-style layout: year=2026/month=2/filing_type=10-K (values URI-encoded)."""
+    pa = _pyarrow()
+    return pa.dataset.partitioning(
+        pa.schema([("year", pa.int16()), ("month", pa.int8()), ("filing_type", pa.string())]),
+        flavor="hive",
+    )
+
+
+def _to_record_batch(rows: Sequence, schema):
+    """Convert a batch of sqlite3.Row objects to an Arrow RecordBatch."""
+    pa = _pyarrow()
+    pc = pa.compute
+    columns = dict(zip(rows[0].keys(), zip(*rows)))
+
+    parsed = pc.strptime(
+        pa.array(columns["filing_date"], pa.string()),
+        format="%Y-%m-%d",
+        unit="s",
+        error_is_null=True,
+    )
+    arrays = {
+        name: pa.array(values, schema.field(name).type)
+        for name, values in columns.items()
+        if name != "filing_date"
+    }
+    arrays["filing_date"] = parsed.cast(pa.date32())
+    arrays["year"] = pc.year(parsed).cast(pa.int16())
+    arrays["month"] = pc.month(parsed).cast(pa.int8())
+    return pa.RecordBatch.from_arrays([arrays[f.name] for f in schema], schema=schema)
+
+
+def export_to_parquet(
+    storage: FilingStorage,
+    out_dir: str,
+    since: Optional[str] = None,
+    watermark: Optional[str] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> int:
+    """
+    Export filings to a Parquet dataset partitioned by year, month and filing type.
+
+    Rows stream from SQLite in record batches straight into the dataset writer,
+    so the full table is never held in memory. A full export replaces the
+    partitions it writes. With ``since="last"`` the new rows are added next to
+    the existing ones. A ``since=<timestamp>`` export would repeat rows an
+    earlier export already wrote, so it needs an empty ``out_dir``.
+
+    Args:
+        storage: Source storage (a ``FilingStorage`` or a ``ShardedStorage``)
+        out_dir: Dataset root directory
+        since: None, "last" or an ISO timestamp (see ``FilingStorage.export_filter``)
+        watermark: Name of the watermark to read and advance (default "parquet"
+            for ``since="last"``; see ``export_watermark``)
+        batch_size: Rows per record batch
+
+    Returns:
+        Number of filings exported
+
+    Raises:
+        ValueError: ``since`` is a timestamp and ``out_dir`` already holds a dataset
+    """
+    if since and since != "last" and any(Path(out_dir).glob("**/*.parquet")):
+        raise ValueError(
+            f"{out_dir} already holds a dataset and a --since <timestamp> export would "
+            "duplicate rows in it; use --since last, or export into an empty directory"
+        )
+    pa = _pyarrow()
+    schema = filing_schema()
+    stats = {"rows": 0}
+    row_batches, commit = storage.export_batches(
+        since, export_watermark(since, watermark, "parquet"), batch_size=batch_size
+    )
+
+    def batches() -> Iterator:
+        for rows in row_batches:
+            batch = _to_record_batch(rows, schema)
+            stats["rows"] += batch.num_rows
+            yield batch
+
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    pa.dataset.write_dataset(
+        batches(),
+        out_dir,
+        schema=schema,
+        format="parquet",
+        partitioning=_partitioning(),
+        basename_template=f"part-{uuid.uuid4().hex[:12]}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore" if since == "last" else "delete_matching",
+        max_rows_per_group=max(batch_size, 64 * 1024),
+    )
+
+    if stats["rows"]:
+        commit()
+        logger.info(f"Exported {stats['rows']} filings to {out_dir}")
+    else:
+        logger.warning("No filings to export")
+    return stats["rows"]
+
+
+def read_filings(
+    path: str,
+    columns: Optional[List[str]] = None,
+    years: Optional[Iterable[int]] = None,
+    months: Optional[Iterable[int]] = None,
+    filing_types: Optional[Iterable[str]] = None,
+    ciks: Optional[Iterable[str]] = None,
+):
+    """
+    Load filings from a Parquet dataset written by ``export_to_parquet``.
+
+    Filters on ``years``, ``months`` and ``filing_types`` prune whole partition
+    directories before any file is opened, and only ``columns`` are decoded.
+
+    Args:
+        path: Dataset root directory
+        columns: Columns to load (default: all)
+        years: Keep only these filing years
+        months: Keep only these filing months
+        filing_types: Keep only these filing types
+        ciks: Keep only these CIKs (row-group statistics filter)
+
+    Returns:
+        pyarrow.Table
+    """
+    pa = _pyarrow()
+    field = pa.dataset.field
+
+    conditions = []
+    if years is not None:
+        conditions.append(field("year").isin(list(years)))
+    if months is not None:
+        conditions.append(field("month").isin(list(months)))
+    if filing_types is not None:
+        conditions.append(field("filing_type").isin(list(filing_types)))
+    if ciks is not None:
+        conditions.append(field("cik").isin(list(ciks)))
+
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    dataset = pa.dataset.dataset(path, format="parquet", partitioning=_partitioning())
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+def summarize(path: str, top: int = 10, **filters) -> dict:
+    """
+    Compute ``FilingStorage.get_summary``-style figures from a Parquet dataset.
+
+    Only the columns each aggregation needs are read, and ``filters`` (as in
+    ``read_filings``) prune partitions first.
+
+    Args:
+        path: Dataset root directory
+        top: Number of filing types/companies to return
+        **filters: Partition filters passed to ``read_filings``
+
+    Returns:
+        Summary dict with total_filings, top_filing_types and top_companies
+    """
+    table = read_filings(path, columns=["filing_type", "company_name"], **filters)
+
+    def top_counts(column: str) -> list:
+        counts = table.group_by(column).aggregate([(column, "count")])
+        counts = counts.sort_by([(f"{column}_count", "descending")]).slice(0, top)
+        return list(zip(counts[column].to_pylist(), counts[f"{column}_count"].to_pylist()))
+
+    return {
+        "total_filings": table.num_rows,
+        "top_filing_types": top_counts("filing_type"),
+        "top_companies": top_counts("company_name"),
+    }
@@ -0,0 +1,7 @@
+"""
+Subcommand implementations, one module per ``hoot`` command.
+
+Each module exposes ``run(args)``. ``hootscrapper.cli`` builds the argument
+parser from configuration alone and imports only the module of the command
+being run, so short commands never load the scraping stack.
+"""
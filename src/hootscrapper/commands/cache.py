@@ -0,0 +1,26 @@
+"""hoot cache: inspect or purge the HTTP response cache."""
+
+import argparse
+
+from hootscrapper.cache import ResponseCache
+
+
+def run(args: argparse.Namespace) -> None:
+    """Inspect or purge the HTTP response cache."""
+    cache = ResponseCache(args.cache, max_bytes=args.max_bytes)
+    if args.action == "purge":
+        deleted = cache.purge()
+        print(f"🧹 Purged {deleted} cached responses from {args.cache}")
+        return
+
+    stats = cache.stats()
+    ratio = stats["bytes"] / stats["raw_bytes"] if stats["raw_bytes"] else 0
+
+    print("\n🗄️  HTTP Cache")
+    print("=" * 50)
+    print(f"\nPath: {args.cache}")
+    print(f"Entries: {stats['entries']}")
+    print(f"Size: {stats['bytes']:,} / {stats['max_bytes']:,} bytes")
+    print(f"Uncompressed: {stats['raw_bytes']:,} bytes (ratio {ratio:.2f})")
+    print(f"304 hits: {stats['hits']}")
+    print()
@@ -0,0 +1,32 @@
+"""Helpers shared by the command modules."""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Optional
+
+from hootscrapper.config import RATE_LIMIT_DB_NAME
+from hootscrapper.shards import is_shard_directory
+from hootscrapper.utils import RateLimiter, SharedTokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+def build_rate_limiter(args: argparse.Namespace, db_path: Optional[str] = None) -> RateLimiter:
+    """Create the rate limiter, shared with other processes if requested."""
+    backend = None
+    if args.shared_rate_limit:
+        db_path = db_path or args.out
+        backend = SharedTokenBucket(str(Path(db_path).parent / RATE_LIMIT_DB_NAME), "sec")
+    return RateLimiter(delay=args.delay, burst=args.burst, backend=backend)
+
+
+def reject_shard_directory(path: str, command: str) -> None:
+    """Exit with an error if ``path`` is a shard directory, which ``command`` cannot use."""
+    if is_shard_directory(path):
+        logger.error(
+            f"'hoot {command}' does not support shard directories yet; "
+            f"point it at a single database file instead of {path}"
+        )
+        sys.exit(1)
@@ -0,0 +1,33 @@
+"""hoot enrich: fetch filing detail pages through the work queue."""
+
+import argparse
+import logging
+
+from hootscrapper.commands.common import build_rate_limiter, reject_shard_directory
+from hootscrapper.enrich import Enricher
+from hootscrapper.robots import RobotsCache
+from hootscrapper.scrapers.sec_edgar import SECEdgarScraper
+from hootscrapper.shards import state_db_path
+from hootscrapper.storage import FilingStorage
+
+logger = logging.getLogger(__name__)
+
+
+def run(args: argparse.Namespace) -> None:
+    """Fetch detail pages for stored filings."""
+    reject_shard_directory(args.db, "enrich")
+    rate_limiter = build_rate_limiter(args, args.db)
+    scraper = SECEdgarScraper(
+        rate_limiter=rate_limiter,
+        robots=RobotsCache(db_path=state_db_path(args.db), rate_limiter=rate_limiter),
+    )
+    with FilingStorage(args.db, profile=args.sqlite_profile) as storage:
+        enricher = Enricher(storage, scraper, workers=args.workers)
+        enricher.enqueue(filing_types=args.filing_type, retry_failed=args.retry_failed)
+        result = enricher.run(limit=args.limit)
+        counts = enricher.counts()
+
+    logger.info(
+        f"✅ Enrich complete: {result.enriched} filings enriched, {result.failed} failed "
+        f"({counts['pending']} still queued, {counts['done']} done in total)"
+    )
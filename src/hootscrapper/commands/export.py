@@ -0,0 +1,31 @@
+"""hoot export: write filings to CSV or Parquet."""
+
+import argparse
+import logging
+import sys
+
+from hootscrapper.config import DEFAULT_CSV_PATH, DEFAULT_PARQUET_PATH
+from hootscrapper.shards import open_storage
+
+logger = logging.getLogger(__name__)
+
+
+def run(args: argparse.Namespace) -> None:
+    """Export data to CSV or Parquet."""
+    with open_storage(args.db) as storage:
+        if args.format == "parquet":
+            from hootscrapper.columnar import export_to_parquet
+
+            out = args.out or DEFAULT_PARQUET_PATH
+            try:
+                count = export_to_parquet(storage, out, since=args.since, watermark=args.watermark)
+            except ValueError as e:
+                logger.error(f"Export failed: {e}")
+                sys.exit(1)
+        else:
+            out = args.out or DEFAULT_CSV_PATH
+            count = storage.export_to_csv(
+                out, since=args.since, compression=args.compression, watermark=args.watermark
+            )
+
+    logger.info(f"✅ Export complete: {count} filings written to {out}")
@@ -0,0 +1,30 @@
+"""hoot migrate: convert a database to the compact schema."""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from hootscrapper.commands.common import reject_shard_directory
+from hootscrapper.storage import FilingStorage
+
+logger = logging.getLogger(__name__)
+
+
+def run(args: argparse.Namespace) -> None:
+    """Migrate a wide database to the compact schema, optionally vacuuming it."""
+    if not Path(args.db).exists():
+        logger.error(f"Database not found: {args.db}")
+        sys.exit(1)
+    reject_shard_directory(args.db, "migrate")
+
+    with FilingStorage(args.db) as storage:
+        size_before = storage.db_path.stat().st_size
+        copied = storage.migrate_to_compact(batch_size=args.batch_size)
+        if args.vacuum:
+            logger.info("Vacuuming (other connections wait until it finishes)")
+            storage.conn.execute("VACUUM")
+        size_after = storage.db_path.stat().st_size
+
+    print(f"✅ {args.db} uses the compact schema ({copied} filings copied)")
+    print(f"   File size: {size_before / 1e6:.1f} MB -> {size_after / 1e6:.1f} MB")
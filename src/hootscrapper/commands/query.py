@@ -0,0 +1,46 @@
+"""hoot query: print filings matching filters, one keyset page at a time."""
+
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+
+from hootscrapper.shards import open_storage
+from hootscrapper.storage import FilingQuery
+
+logger = logging.getLogger(__name__)
+
+
+def run(args: argparse.Namespace) -> None:
+    """Print filings matching filters, one keyset-paginated page at a time."""
+    filters = FilingQuery(
+        cik=args.cik,
+        filing_types=args.filing_type,
+        date_from=args.date_from,
+        date_to=args.date_to,
+        company=args.company,
+    )
+    with open_storage(args.db, read_only=Path(args.db).exists()) as storage:
+        try:
+            rows, next_cursor = storage.query_page(filters, after=args.after, page_size=args.limit)
+        except (ValueError, sqlite3.OperationalError) as e:
+            logger.error(f"Query failed: {e}")
+            sys.exit(1)
+
+    if args.json:
+        for row in rows:
+            print(json.dumps(dict(row)))
+        if next_cursor:
+            print(json.dumps({"next_cursor": next_cursor}))
+        return
+
+    for row in rows:
+        print(
+            f"  {row['filing_date']}  {row['filing_type']:<10} {row['company_name']} "
+            f"(CIK {row['cik']}, {row['accession_number']})"
+        )
+    print(f"\n{len(rows)} filings")
+    if next_cursor:
+        print(f"Next page: --after {next_cursor}")
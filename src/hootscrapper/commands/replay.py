@@ -0,0 +1,36 @@
+"""hoot replay: re-parse archived feed pages offline."""
+
+import argparse
+import logging
+import sys
+
+from hootscrapper.archive import PageArchive, replay
+from hootscrapper.shards import open_storage
+
+logger = logging.getLogger(__name__)
+
+
+def run(args: argparse.Namespace) -> None:
+    """Re-parse archived pages offline and load them into the database."""
+    archive = PageArchive(args.archive)
+    stats = archive.stats()
+    if not stats["pages"]:
+        logger.error(f"No archived pages in {args.archive}")
+        sys.exit(1)
+
+    logger.info(f"Replaying {stats['pages']} archived pages from {args.archive}")
+    with open_storage(args.out, profile=args.sqlite_profile) as storage:
+        result = replay(
+            archive,
+            storage,
+            parser=args.parser,
+            workers=args.workers,
+            since=args.since,
+            batch_size=args.batch_size,
+            upsert=args.upsert,
+        )
+
+    logger.info(
+        f"✅ Replay complete: {result.inserted} new filings saved to {args.out} "
+        f"({result.skipped} duplicates skipped, {result.updated} updated)"
+    )
@@ -0,0 +1,150 @@
+"""hoot scrape: fetch filings from the current feed or the quarterly full index."""
+
+import argparse
+import logging
+import sys
+from itertools import islice
+from typing import List
+
+from hootscrapper.archive import PageArchive
+from hootscrapper.cache import ResponseCache
+from hootscrapper.commands.common import build_rate_limiter, reject_shard_directory
+from hootscrapper.robots import RobotsCache
+from hootscrapper.scrapers.sec_edgar import SECEdgarScraper
+from hootscrapper.scrapers.sec_full_index import FullIndexSource
+from hootscrapper.shards import open_storage, state_db_path
+from hootscrapper.storage import FilingStorage
+
+logger = logging.getLogger(__name__)
+
+
+def parse_years(value: str) -> List[int]:
+    """Parse a year list like "2023", "2020-2023" or "2019,2021"."""
+    years: List[int] = []
+    for part in value.split(","):
+        first, _, last = part.partition("-")
+        years.extend(range(int(first), int(last or first) + 1))
+    return years
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run the scraper."""
+    logger.info(f"Starting scrape: source={args.source}, limit={args.limit}")
+
+    if args.source == "sec-edgar":
+        scrape_sec_edgar(args)
+    elif args.source == "sec-full-index":
+        scrape_sec_full_index(args)
+    elif args.source == "sec-submissions":
+        scrape_sec_submissions(args)
+    else:
+        logger.error(f"Unknown source: {args.source}")
+        sys.exit(1)
+
+
+def scrape_sec_edgar(args: argparse.Namespace) -> None:
+    """Scrape the EDGAR current-filings feed."""
+    storage = open_storage(args.out, profile=args.sqlite_profile)
+    rate_limiter = build_rate_limiter(args)
+    scraper = SECEdgarScraper(
+        engine=args.engine,
+        concurrency=args.concurrency,
+        rate_limiter=rate_limiter,
+        robots=RobotsCache(db_path=state_db_path(args.out), rate_limiter=rate_limiter),
+        cache=None if args.no_cache else ResponseCache(args.cache),
+        parser=args.parser,
+        archive=PageArchive(args.archive) if args.archive else None,
+    )
+    with storage:
+        filings = scraper.scrape(
+            limit=args.limit or 100,
+            known=storage.existing_accessions,
+            cursor=None if args.full else storage.get_cursor(args.source),
+        )
+
+        if not filings:
+            if scraper.reached_known:
+                logger.info(
+                    f"✅ No new filings since the last scrape ({scraper.pages_fetched} pages fetched)"
+                )
+                return
+            logger.error("No filings scraped")
+            sys.exit(1)
+
+        result = storage.bulk_insert(filings, batch_size=args.batch_size, upsert=args.upsert)
+        newest = next((f for f in filings if f.accession_number), None)
+        if newest is not None:
+            storage.set_cursor(args.source, newest.accession_number, newest.filing_date)
+
+    logger.info(
+        f"✅ Scrape complete: {result.inserted} new filings saved to {args.out} "
+        f"({scraper.pages_fetched} pages fetched)"
+    )
+
+
+def scrape_sec_full_index(args: argparse.Namespace) -> None:
+    """Bulk-load filings from quarterly full-index files (network or local mirror)."""
+    rate_limiter = build_rate_limiter(args)
+    source = FullIndexSource(
+        kind=args.index_kind,
+        rate_limiter=rate_limiter,
+        robots=RobotsCache(db_path=state_db_path(args.out), rate_limiter=rate_limiter),
+    )
+
+    if args.index_dir:
+        filings = source.iter_directory(args.index_dir)
+    elif args.years:
+        quarters = [int(q) for q in args.quarters.split(",")]
+        filings = source.iter_filings(parse_years(args.years), quarters)
+    else:
+        logger.error("sec-full-index needs --years or --index-dir")
+        sys.exit(1)
+
+    if args.limit:
+        filings = islice(filings, args.limit)
+
+    with open_storage(args.out, profile=args.sqlite_profile) as storage:
+        result = storage.bulk_insert(filings, batch_size=args.batch_size, upsert=args.upsert)
+
+    logger.info(
+        f"✅ Scrape complete: {result.inserted} new filings saved to {args.out} "
+        f"({result.skipped} duplicates skipped, {result.updated} updated)"
+    )
+
+
+def scrape_sec_submissions(args: argparse.Namespace) -> None:
+    """Poll watchlist companies' submissions JSON, or load a local submissions.zip."""
+    from hootscrapper.scrapers.sec_submissions import SubmissionsSource
+    from hootscrapper.watchlist import Watchlist
+
+    reject_shard_directory(args.out, "scrape --source sec-submissions")
+    rate_limiter = build_rate_limiter(args)
+    source = SubmissionsSource(
+        rate_limiter=rate_limiter,
+        robots=RobotsCache(db_path=state_db_path(args.out), rate_limiter=rate_limiter),
+        cache=None if args.no_cache else ResponseCache(args.cache),
+        history=args.history,
+    )
+    with FilingStorage(args.out, profile=args.sqlite_profile) as storage:
+        watchlist = Watchlist(storage)
+        if args.submissions_zip:
+            filings = source.iter_zip(args.submissions_zip, watchlist.ciks() or None)
+            if args.limit:
+                filings = islice(filings, args.limit)
+            result = storage.bulk_insert(filings, batch_size=args.batch_size, upsert=args.upsert)
+            watchlist.refresh_recency()
+            logger.info(
+                f"✅ Load complete: {result.inserted} new filings saved to {args.out} "
+                f"({result.skipped} duplicates skipped, {result.updated} updated)"
+            )
+            return
+
+        if not watchlist.ciks():
+            logger.error("The watchlist is empty; add companies with 'hoot watchlist add CIK...'")
+            sys.exit(1)
+        polled = watchlist.poll(source, max_requests=args.max_requests, batch_size=args.batch_size)
+
+    logger.info(
+        f"✅ Scrape complete: {polled.inserted} new filings from {polled.polled} companies "
+        f"saved to {args.out} ({polled.errors} errors)"
+    )
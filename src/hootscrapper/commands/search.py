@@ -0,0 +1,47 @@
+"""hoot search: ranked full-text search over company names and filing types."""
+
+import argparse
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+
+from hootscrapper.commands.common import reject_shard_directory
+from hootscrapper.search import search
+from hootscrapper.storage import FilingStorage
+
+logger = logging.getLogger(__name__)
+
+
+def run(args: argparse.Namespace) -> None:
+    """Search filings by company name and filing type."""
+    reject_shard_directory(args.db, "search")
+    with FilingStorage(args.db, read_only=Path(args.db).exists()) as storage:
+        try:
+            page = search(
+                storage,
+                " ".join(args.query),
+                page=args.page,
+                page_size=args.page_size,
+                fuzzy=args.fuzzy,
+                prefix=not args.exact,
+                filing_type=args.filing_type,
+            )
+        except sqlite3.OperationalError as e:
+            logger.error(f"Search failed ({e}); open the database once with a write command")
+            sys.exit(1)
+
+    if not page.results:
+        print(f"No filings match {page.query!r}")
+        return
+
+    print(f"\n🔎 Results for {page.query!r} (page {page.page})")
+    print("=" * 50)
+    for row in page.results:
+        print(
+            f"  {row['filing_date']}  {row['filing_type']:<10} {row['company_name']} "
+            f"(CIK {row['cik']}, {row['accession_number']})"
+        )
+    if page.has_more:
+        print(f"\nMore results: --page {page.page + 1}")
+    print()
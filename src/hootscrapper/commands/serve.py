@@ -0,0 +1,21 @@
+"""hoot serve: read-only HTTP API over the database."""
+
+import argparse
+
+from hootscrapper import metrics
+from hootscrapper.commands.common import reject_shard_directory
+from hootscrapper.server import serve
+
+
+def run(args: argparse.Namespace) -> None:
+    """Serve filings, summary and search over HTTP."""
+    reject_shard_directory(args.db, "serve")
+    if args.metrics:
+        metrics.enable()
+    serve(
+        args.db,
+        args.host,
+        args.port,
+        pool_size=args.pool_size,
+        cache_entries=args.cache_entries,
+    )
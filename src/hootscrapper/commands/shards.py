@@ -0,0 +1,46 @@
+"""hoot shards: create, list or maintain a directory of per-period database shards."""
+
+import argparse
+import logging
+import sys
+
+from hootscrapper.shards import ShardedStorage, is_shard_directory
+
+logger = logging.getLogger(__name__)
+
+
+def run(args: argparse.Namespace) -> None:
+    """Create a shard directory, list its shards, or compact and close finished ones."""
+    if args.action == "init":
+        with ShardedStorage(
+            args.db, period=None if is_shard_directory(args.db) else args.by
+        ) as storage:
+            if args.source:
+                copied = storage.import_database(args.source)
+                print(f"✅ Imported {copied} filings from {args.source}")
+            print(f"✅ {args.db} is sharded by {storage.period}")
+        return
+
+    if not is_shard_directory(args.db):
+        logger.error(f"Not a shard directory: {args.db} (create one with 'hoot shards init')")
+        sys.exit(1)
+
+    if args.action == "maintain":
+        with ShardedStorage(args.db) as storage:
+            closed = storage.maintain(close_after_days=args.close_after_days)
+        print(f"✅ Closed {len(closed)} shards" + (f": {', '.join(closed)}" if closed else ""))
+        return
+
+    with ShardedStorage(args.db, read_only=True) as storage:
+        if args.hot:
+            print(storage.shard_path(storage.hot_key()))
+            return
+        shards = storage.shards()
+
+    print(f"\n🗂️  {args.db} (sharded by {storage.period})")
+    for shard in shards:
+        print(
+            f"  {shard['key']:<8} {shard['state']:<7} {shard['filings']:>10} filings "
+            f"{shard['bytes'] / 1e6:>9.1f} MB"
+        )
+    print(f"\n{len(shards)} shards")
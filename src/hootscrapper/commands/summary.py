@@ -0,0 +1,58 @@
+"""hoot summary: print totals, top filing types and top companies."""
+
+import argparse
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+
+from hootscrapper.shards import open_storage
+
+logger = logging.getLogger(__name__)
+
+
+def run(args: argparse.Namespace) -> None:
+    """Show data summary."""
+    if args.days is not None and args.days < 1:
+        logger.error("--days must be at least 1 (1 is today only)")
+        sys.exit(1)
+    if args.parquet:
+        if args.days is not None or args.rebuild:
+            logger.error("--days and --rebuild apply to the SQLite database, not --parquet")
+            sys.exit(1)
+
+        from hootscrapper.columnar import summarize
+
+        summary = summarize(args.parquet)
+    elif args.rebuild:
+        with open_storage(args.db) as storage:
+            storage.rebuild_summary()
+            summary = storage.get_summary(days=args.days)
+    else:
+        # Read-only when the database exists, so a running scrape is never blocked
+        with open_storage(args.db, read_only=Path(args.db).exists()) as storage:
+            try:
+                summary = storage.get_summary(days=args.days)
+            except sqlite3.OperationalError as e:
+                logger.error(f"Summary unavailable ({e}); run 'hoot summary --rebuild' once")
+                sys.exit(1)
+
+    print("\n📊 Hoot Scrapper Summary")
+    print("=" * 50)
+    if "since" in summary:
+        print(f"\nFiled since {summary['since']}: {summary['total_filings']}")
+        print("\n📅 Filings by day:")
+        for filing_date, count in summary["filings_by_day"]:
+            print(f"  {filing_date}: {count}")
+    else:
+        print(f"\nTotal filings: {summary['total_filings']}")
+
+    print("\n🔝 Top filing types:")
+    for filing_type, count in summary["top_filing_types"]:
+        print(f"  {filing_type}: {count}")
+
+    print("\n🏢 Top companies:")
+    for company, count in summary["top_companies"]:
+        print(f"  {company}: {count}")
+
+    print()
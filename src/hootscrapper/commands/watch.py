@@ -0,0 +1,34 @@
+"""hoot watch: poll the current feed continuously."""
+
+import argparse
+
+from hootscrapper import metrics
+from hootscrapper.cache import ResponseCache
+from hootscrapper.commands.common import build_rate_limiter
+from hootscrapper.config import SERVE_HOST
+from hootscrapper.robots import RobotsCache
+from hootscrapper.scrapers.sec_edgar import SECEdgarScraper
+from hootscrapper.shards import open_storage, state_db_path
+from hootscrapper.watch import Watcher
+
+
+def run(args: argparse.Namespace) -> None:
+    """Poll the EDGAR feed continuously until SIGTERM/SIGINT."""
+    rate_limiter = build_rate_limiter(args)
+    scraper = SECEdgarScraper(
+        rate_limiter=rate_limiter,
+        robots=RobotsCache(db_path=state_db_path(args.out), rate_limiter=rate_limiter),
+        cache=None if args.no_cache else ResponseCache(args.cache),
+    )
+    if args.metrics_port is not None:
+        metrics.start_http_server(args.metrics_port, SERVE_HOST)
+    with open_storage(args.out, profile=args.sqlite_profile) as storage:
+        watcher = Watcher(
+            storage,
+            scraper,
+            limit=args.limit,
+            min_interval=args.min_interval,
+            max_interval=args.max_interval,
+            status_path=args.status_file,
+        )
+        watcher.run(max_cycles=args.max_cycles)
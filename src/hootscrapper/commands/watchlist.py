@@ -0,0 +1,64 @@
+"""hoot watchlist: manage the companies polled through their submissions JSON."""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from hootscrapper.commands.common import reject_shard_directory
+from hootscrapper.storage import FilingStorage
+from hootscrapper.watchlist import Watchlist
+
+logger = logging.getLogger(__name__)
+
+
+def read_ciks(args: argparse.Namespace) -> List[str]:
+    """CIKs from the command line and ``--file``."""
+    ciks = list(args.ciks)
+    if args.file:
+        for line in Path(args.file).read_text().splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                ciks.append(line)
+    invalid = [cik for cik in ciks if not cik.isdigit()]
+    if invalid:
+        logger.error(f"Not a CIK: {', '.join(invalid)}")
+        sys.exit(1)
+    return ciks
+
+
+def run(args: argparse.Namespace) -> None:
+    """Add, remove or list watchlist companies."""
+    reject_shard_directory(args.db, "watchlist")
+    with FilingStorage(args.db) as storage:
+        watchlist = Watchlist(storage)
+        if args.action == "add":
+            count = watchlist.add(read_ciks(args), priority=args.priority)
+            print(f"👀 {count} companies on the watchlist at priority {args.priority}")
+            return
+        if args.action == "remove":
+            count = watchlist.remove(read_ciks(args))
+            print(f"🗑️  Removed {count} companies from the watchlist")
+            return
+        entries = watchlist.entries()
+
+    if not entries:
+        print("The watchlist is empty")
+        return
+    print(f"\n👀 Watchlist ({len(entries)} companies)")
+    print("=" * 50)
+    now = time.time()
+    for entry in entries:
+        if entry["next_poll_at"] <= now:
+            next_poll = "due now"
+        else:
+            next_poll = datetime.fromtimestamp(entry["next_poll_at"]).isoformat(timespec="minutes")
+        print(
+            f"  {entry['cik']:>10}  p{entry['priority']}  "
+            f"last filed {entry['last_filing_date'] or '-':<10}  next poll {next_poll:<16}  "
+            f"{entry['company_name'] or ''}"
+        )
+    print()
@@ -0,0 +1,485 @@
+"""Compact filings schema: dictionary-encoded companies and form types, packed keys, derived URLs.
+
+In a compact database the filings live in ``filing_rows``, which holds small
+integers where the wide ``filings`` table repeats text on every row:
+
+- ``company_id``/``form_type_id`` point into the ``companies`` and
+  ``form_types`` dimension tables
+- ``accession`` packs ``0000320193-26-000001`` into one integer
+- ``url_kind`` names the URL template the document URL follows, so the URL
+  is rebuilt from the CIK and accession number instead of being stored
+- ``scraped_at`` is Unix microseconds and ``created_at`` Unix seconds
+
+A ``filings`` view decodes it all back into the wide columns, so every
+reader (the summary, exports, search, notebooks) keeps working unchanged.
+The view only uses built-in SQL functions, so plain ``sqlite3`` clients can
+read it, and INSTEAD OF triggers accept inserts, updates and deletes.
+"""
+
+import calendar
+import re
+import sqlite3
+from datetime import datetime, timezone
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from hootscrapper.config import SEC_ARCHIVES_URL, SEC_BASE_URL, SEC_FILING_INDEX_URL
+from hootscrapper.models import Filing
+
+ROWS_TABLE = "filing_rows"
+
+# Filer id (10 digits), year (2) and sequence (6) fit in one 64-bit integer
+ACCESSION_RE = re.compile(r"([0-9]{10})-([0-9]{2})-([0-9]{6})")
+ACCESSION_GLOB = "[0-9]" * 10 + "-" + "[0-9]" * 2 + "-" + "[0-9]" * 6
+
+# Document URLs the sources produce, indexed by ``url_kind``; others are stored verbatim
+URL_TEMPLATES: Tuple[str, ...] = (
+    "",  # feed rows without a link
+    f"{SEC_ARCHIVES_URL}/edgar/data/{{cik}}/{{accession}}.txt",  # full index
+    SEC_FILING_INDEX_URL,  # detail pages
+    f"{SEC_ARCHIVES_URL}/edgar/data/{{cik}}/{{folder}}/{{document}}",  # primary documents
+    (  # current feed
+        f"{SEC_BASE_URL}/cgi-bin/browse-edgar?action=getcompany&CIK={{cik10}}"
+        "&accession-number={accession}"
+    ),
+)
+# (kind, template, prefix before {document} or None) for encode_url
+_URL_MATCHERS = [
+    (kind, template, template.split("{document}")[0] if "{document}" in template else None)
+    for kind, template in enumerate(URL_TEMPLATES)
+]
+
+# Columns of the wide schema that triggers watch, and the compact columns behind them
+PHYSICAL_COLUMNS: Dict[str, str] = {
+    "cik": "company_id",
+    "company_name": "company_id",
+    "filing_type": "form_type_id",
+    "filing_date": "filing_date",
+}
+
+
+def pack_accession(accession: str) -> Union[int, str]:
+    """Pack a standard accession number into an integer (anything else is kept as text)."""
+    match = ACCESSION_RE.fullmatch(accession)
+    if not match:
+        return accession
+    filer, year, sequence = match.groups()
+    return int(filer) * 100_000_000 + int(year) * 1_000_000 + int(sequence)
+
+
+def unpack_accession(value: Union[int, str]) -> str:
+    """Inverse of ``pack_accession``."""
+    if isinstance(value, int):
+        return f"{value // 100_000_000:010d}-{value // 1_000_000 % 100:02d}-{value % 1_000_000:06d}"
+    return value
+
+
+@lru_cache(maxsize=1024)  # a scrape stamps every row of a page or file alike
+def pack_timestamp(value: str) -> Union[int, str]:
+    """
+    Turn a naive UTC ``isoformat()`` timestamp into Unix microseconds.
+
+    Values that would not come back unchanged from ``unpack_timestamp``
+    (other formats, time zones) are kept as text.
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return value
+    packed = calendar.timegm(parsed.utctimetuple()) * 1_000_000 + parsed.microsecond
+    return packed if unpack_timestamp(packed) == value else value
+
+
+def unpack_timestamp(value: Union[int, str]) -> str:
+    """Inverse of ``pack_timestamp``, formatted like ``datetime.isoformat()``."""
+    if not isinstance(value, int):
+        return value
+    seconds, micros = divmod(value, 1_000_000)
+    text = datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    return f"{text}.{micros:06d}" if micros else text
+
+
+def _url_fields(cik: str, accession: str) -> Optional[dict]:
+    if not (cik.isascii() and cik.isdigit() and len(cik) <= 10):
+        return None
+    return {
+        "cik": cik,
+        "cik10": f"{int(cik):010d}",
+        "accession": accession,
+        "folder": accession.replace("-", ""),
+    }
+
+
+def encode_url(cik: str, accession: str, url: Optional[str]) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Encode a document URL as ``(url_kind, url_part)``.
+
+    Args:
+        cik: Filing CIK
+        accession: Filing accession number
+        url: Document URL
+
+    Returns:
+        The index of the matching ``URL_TEMPLATES`` entry and the primary
+        document name (for templates that have one), or ``(None, url)``
+    """
+    if url is None:
+        return None, None
+    fields = _url_fields(cik, accession)
+    for kind, template, document_prefix in _URL_MATCHERS:
+        if fields is None and "{" in template:
+            continue
+        if document_prefix is not None:
+            prefix = document_prefix.format_map(fields)
+            document = url[len(prefix) :]
+            if url.startswith(prefix) and document and "/" not in document:
+                return kind, document
+        elif url == template.format_map(fields or {}):
+            return kind, None
+    return None, url
+
+
+# SQL counterparts of the functions above (built-in functions only)
+
+
+def _literal(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+
+def _template_sql(template: str, fields: Dict[str, str]) -> str:
+    """Render a URL template as a SQL concatenation of literals and expressions."""
+    parts = []
+    for literal, name, _, _ in Formatter().parse(template):
+        if literal:
+            parts.append(_literal(literal))
+        if name is not None:
+            parts.append(fields[name])
+    return " || ".join(parts) or "''"
+
+
+def _url_fields_sql(cik: str, accession: str, document: str) -> Dict[str, str]:
+    return {
+        "cik": cik,
+        "cik10": f"printf('%010d', {cik})",
+        "accession": accession,
+        "folder": f"replace({accession}, '-', '')",
+        "document": document,
+    }
+
+
+def pack_accession_sql(expr: str) -> str:
+    return f"""CASE WHEN {expr} GLOB '{ACCESSION_GLOB}' THEN
+        CAST(substr({expr}, 1, 10) AS INTEGER) * 100000000
+        + CAST(substr({expr}, 12, 2) AS INTEGER) * 1000000
+        + CAST(substr({expr}, 15, 6) AS INTEGER)
+    ELSE {expr} END"""
+
+
+def unpack_accession_sql(expr: str) -> str:
+    return f"""CASE WHEN typeof({expr}) = 'integer'
+        THEN printf('%010d-%02d-%06d', {expr} / 100000000, {expr} / 1000000 % 100, {expr} % 1000000)
+    ELSE {expr} END"""
+
+
+def unpack_timestamp_sql(expr: str) -> str:
+    return f"""CASE WHEN typeof({expr}) = 'integer'
+        THEN strftime('%Y-%m-%dT%H:%M:%S', {expr} / 1000000, 'unixepoch')
+            || CASE WHEN {expr} % 1000000 THEN printf('.%06d', {expr} % 1000000) ELSE '' END
+    ELSE {expr} END"""
+
+
+def pack_timestamp_sql(expr: str) -> str:
+    packed = f"""(CAST(strftime('%s', {expr}) AS INTEGER) * 1000000
+        + CASE WHEN substr({expr}, 20, 1) = '.'
+            THEN CAST(substr({expr}, 21, 6) AS INTEGER) ELSE 0 END)"""
+    # Only keep the integer when it decodes back to the same text
+    return f"CASE WHEN {unpack_timestamp_sql(packed)} = {expr} THEN {packed} ELSE {expr} END"
+
+
+def decode_url_sql(kind: str, part: str, cik: str, accession: str) -> str:
+    fields = _url_fields_sql(cik, accession, part)
+    cases = "\n        ".join(
+        f"WHEN {i} THEN {_template_sql(template, fields)}"
+        for i, template in enumerate(URL_TEMPLATES)
+    )
+    return f"CASE {kind}\n        {cases}\n        ELSE {part} END"
+
+
+def encode_url_sql(url: str, cik: str, accession: str) -> Tuple[str, str]:
+    """SQL expressions for ``(url_kind, url_part)``, matching ``decode_url_sql`` exactly."""
+    fields = _url_fields_sql(cik, accession, "")
+    kinds, document_kind, prefix = [], None, ""
+    for i, template in enumerate(URL_TEMPLATES):
+        if "{document}" in template:
+            document_kind = i
+            prefix = _template_sql(template.split("{document}")[0], fields)
+            rest = f"substr({url}, length({prefix}) + 1)"
+            kinds.append(
+                f"WHEN substr({url}, 1, length({prefix})) = {prefix} AND {rest} != '' "
+                f"AND instr({rest}, '/') = 0 THEN {i}"
+            )
+        else:
+            kinds.append(f"WHEN {url} = {_template_sql(template, fields)} THEN {i}")
+    kind = f"CASE WHEN {url} IS NULL THEN NULL {' '.join(kinds)} END"
+    part = (
+        f"CASE ({kind}) WHEN {document_kind} THEN substr({url}, length({prefix}) + 1) "
+        f"ELSE CASE WHEN ({kind}) IS NULL THEN {url} END END"
+    )
+    return kind, part
+
+
+def row_columns(row: str) -> Dict[str, str]:
+    """Expressions for the wide columns of a ``filing_rows`` trigger row (``new``/``old``)."""
+    return {
+        "id": f"{row}.id",
+        "cik": f"(SELECT cik FROM companies WHERE id = {row}.company_id)",
+        "company_name": f"(SELECT name FROM companies WHERE id = {row}.company_id)",
+        "filing_type": f"(SELECT name FROM form_types WHERE id = {row}.form_type_id)",
+        "filing_date": f"{row}.filing_date",
+    }
+
+
+def _encode_row_sql(row: str) -> Dict[str, str]:
+    """Expressions for the ``filing_rows`` columns of a wide row (view trigger or table)."""
+    url_kind, url_part = encode_url_sql(
+        f"{row}.document_url", f"{row}.cik", f"{row}.accession_number"
+    )
+    return {
+        "company_id": (
+            f"(SELECT id FROM companies WHERE cik = {row}.cik AND name = {row}.company_name)"
+        ),
+        "form_type_id": f"(SELECT id FROM form_types WHERE name = {row}.filing_type)",
+        "filing_date": f"{row}.filing_date",
+        "accession": pack_accession_sql(f"{row}.accession_number"),
+        "url_kind": url_kind,
+        "url_part": url_part,
+        "scraped_at": pack_timestamp_sql(f"{row}.scraped_at"),
+        "created_at": (
+            f"COALESCE(CAST(strftime('%s', {row}.created_at) AS INTEGER), "
+            "CAST(strftime('%s', 'now') AS INTEGER))"
+        ),
+    }
+
+
+def _add_dimensions_sql(row: str) -> str:
+    return f"""
+        INSERT OR IGNORE INTO companies (cik, name) VALUES ({row}.cik, {row}.company_name);
+        INSERT OR IGNORE INTO form_types (name) VALUES ({row}.filing_type);
+    """
+
+
+def _update_row_sql(row: str) -> str:
+    values = _encode_row_sql(row)
+    assignments = ",\n            ".join(f"{column} = {expr}" for column, expr in values.items())
+    return f"""
+        UPDATE filing_rows SET
+            {assignments}
+        WHERE id = old.id;
+    """
+
+
+INSERT_SQL = """
+    INSERT OR IGNORE INTO filing_rows
+    (company_id, form_type_id, filing_date, accession, url_kind, url_part, scraped_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPSERT_SQL = """
+    INSERT INTO filing_rows
+    (company_id, form_type_id, filing_date, accession, url_kind, url_part, scraped_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(accession) DO UPDATE SET
+        url_kind = excluded.url_kind,
+        url_part = excluded.url_part,
+        scraped_at = excluded.scraped_at
+"""
+
+
+def create_tables(cursor: sqlite3.Cursor) -> None:
+    """Create the dimension tables and ``filing_rows`` with its indexes."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS companies (
+            id INTEGER PRIMARY KEY,
+            cik TEXT NOT NULL,
+            name TEXT NOT NULL,
+            UNIQUE (cik, name)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS form_types (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        )
+    """)
+    # accession has no declared type, so packed integers and non-standard
+    # accession numbers (kept as text) are both stored without conversion
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS filing_rows (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            company_id INTEGER NOT NULL REFERENCES companies(id),
+            form_type_id INTEGER NOT NULL REFERENCES form_types(id),
+            filing_date TEXT NOT NULL,
+            accession NOT NULL UNIQUE,
+            url_kind INTEGER,
+            url_part TEXT,
+            scraped_at INTEGER NOT NULL,
+            created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_rows_company_filing_date
+        ON filing_rows(company_id, filing_date)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_rows_form_type_filing_date
+        ON filing_rows(form_type_id, filing_date)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_rows_filing_date ON filing_rows(filing_date)
+    """)
+
+
+def create_view(cursor: sqlite3.Cursor) -> None:
+    """Create the ``filings`` view and the triggers that make it writable."""
+    accession = unpack_accession_sql("r.accession")
+    cursor.execute(f"""
+        CREATE VIEW IF NOT EXISTS filings AS
+        SELECT
+            r.id AS id,
+            c.cik AS cik,
+            c.name AS company_name,
+            t.name AS filing_type,
+            r.filing_date AS filing_date,
+            {accession} AS accession_number,
+            {decode_url_sql("r.url_kind", "r.url_part", "c.cik", accession)} AS document_url,
+            {unpack_timestamp_sql("r.scraped_at")} AS scraped_at,
+            datetime(r.created_at, 'unixepoch') AS created_at
+        FROM filing_rows r
+        JOIN companies c ON c.id = r.company_id
+        JOIN form_types t ON t.id = r.form_type_id
+    """)
+
+    values = _encode_row_sql("new")
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS filings_view_insert INSTEAD OF INSERT ON filings BEGIN
+            {_add_dimensions_sql("new")}
+            INSERT INTO filing_rows (id, {", ".join(values)})
+            VALUES (new.id, {", ".join(values.values())});
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS filings_view_update INSTEAD OF UPDATE ON filings BEGIN
+            {_add_dimensions_sql("new")}
+            {_update_row_sql("new")}
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS filings_view_delete INSTEAD OF DELETE ON filings BEGIN
+            DELETE FROM filing_rows WHERE id = old.id;
+        END
+    """)
+
+
+def create_sync_triggers(cursor: sqlite3.Cursor) -> None:
+    """Mirror updates and deletes of already-copied ``filings`` rows while migrating."""
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS migrate_sync_update AFTER UPDATE ON filings BEGIN
+            {_add_dimensions_sql("new")}
+            {_update_row_sql("new")}
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS migrate_sync_delete AFTER DELETE ON filings BEGIN
+            DELETE FROM filing_rows WHERE id = old.id;
+        END
+    """)
+
+
+def copy_batch(cursor: sqlite3.Cursor, after_id: int, batch_size: int) -> int:
+    """
+    Copy the next ``batch_size`` rows of the wide ``filings`` table after ``after_id``.
+
+    Returns:
+        Number of rows copied
+    """
+    batch = "SELECT * FROM filings WHERE id > :after ORDER BY id LIMIT :limit"
+    params = {"after": after_id, "limit": batch_size}
+    cursor.execute(
+        f"INSERT OR IGNORE INTO companies (cik, name) "
+        f"SELECT DISTINCT cik, company_name FROM ({batch})",
+        params,
+    )
+    cursor.execute(
+        f"INSERT OR IGNORE INTO form_types (name) SELECT DISTINCT filing_type FROM ({batch})",
+        params,
+    )
+    values = _encode_row_sql("f")
+    cursor.execute(
+        f"INSERT INTO filing_rows (id, {', '.join(values)}) "
+        f"SELECT f.id, {', '.join(values.values())} FROM ({batch}) f",
+        params,
+    )
+    return cursor.rowcount
+
+
+class Dictionary:
+    """
+    Cache of dimension ids for one connection.
+
+    New companies and form types are added in their own short transaction
+    before the rows that use them, so an insert batch that rolls back never
+    leaves the cache pointing at ids that don't exist.
+    """
+
+    def __init__(self):
+        self.companies: Dict[Tuple[str, str], int] = {}
+        self.form_types: Dict[str, int] = {}
+
+    def _add_missing(self, conn: sqlite3.Connection, filings: List[Filing]) -> None:
+        companies = {(f.cik, f.company_name) for f in filings} - self.companies.keys()
+        form_types = {f.filing_type for f in filings} - self.form_types.keys()
+        if not companies and not form_types:
+            return
+        with conn:
+            conn.executemany("INSERT OR IGNORE INTO companies (cik, name) VALUES (?, ?)", companies)
+            conn.executemany(
+                "INSERT OR IGNORE INTO form_types (name) VALUES (?)", [(t,) for t in form_types]
+            )
+            for key in companies:
+                self.companies[key] = conn.execute(
+                    "SELECT id FROM companies WHERE cik = ? AND name = ?", key
+                ).fetchone()[0]
+            for name in form_types:
+                self.form_types[name] = conn.execute(
+                    "SELECT id FROM form_types WHERE name = ?", (name,)
+                ).fetchone()[0]
+
+    def encode(self, conn: sqlite3.Connection, filings: Iterable[Filing]) -> List[tuple]:
+        """
+        Turn filings into ``filing_rows`` parameter tuples for ``INSERT_SQL``/``UPSERT_SQL``.
+
+        Args:
+            conn: Connection to the compact database
+            filings: Filings to encode
+
+        Returns:
+            One tuple per filing
+        """
+        filings = list(filings)
+        self._add_missing(conn, filings)
+        rows = []
+        for f in filings:
+            url_kind, url_part = encode_url(f.cik, f.accession_number, f.document_url)
+            rows.append(
+                (
+                    self.companies[(f.cik, f.company_name)],
+                    self.form_types[f.filing_type],
+                    f.filing_date,
+                    pack_accession(f.accession_number),
+                    url_kind,
+                    url_part,
+                    pack_timestamp(f.scraped_at),
+                )
+            )
+        return rows
@@ -12,9 +12,19 @@ USER_AGENT: Final[str] = os.getenv(
 
 # Rate limiting - be polite to SEC servers
 REQUEST_DELAY: Final[float] = float(os.getenv("HOOT_DELAY", "0.5"))  # seconds between requests
+RATE_BURST: Final[int] = int(os.getenv("HOOT_BURST", "1"))  # requests allowed back-to-back
+RATE_LIMIT_DB_NAME: Final[str] = "ratelimit.sqlite"  # shared bucket file, next to the DB
 MAX_RETRIES: Final[int] = 3
+RETRY_BACKOFF: Final[float] = 1.0  # base delay in seconds, doubled on each retry
 TIMEOUT: Final[int] = 30  # request timeout in seconds
 
+# Concurrency - max requests in flight for the async engine (also sizes the connection pool)
+MAX_CONCURRENCY: Final[int] = int(os.getenv("HOOT_CONCURRENCY", "4"))
+
+# robots.txt caching
+ROBOTS_TTL: Final[int] = int(os.getenv("HOOT_ROBOTS_TTL", "86400"))  # seconds
+ROBOTS_ERROR_TTL: Final[int] = 300  # retry sooner when robots.txt could not be fetched
+
 # SEC EDGAR URLs
 SEC_BASE_URL: Final[str] = "https://www.sec.gov"
 SEC_DAILY_INDEX_URL: Final[str] = f"{SEC_BASE_URL}/cgi-bin/browse-edgar"
@@ -22,10 +32,99 @@ SEC_SEARCH_URL: Final[str] = (
     f"{SEC_BASE_URL}/cgi-bin/browse-edgar?"
     "action=getcurrent&type=&company=&dateb=&owner=exclude&count=100"
 )
+# Paginated "getcurrent" feed; EDGAR serves at most 100 rows per page
+SEC_CURRENT_PAGE_SIZE: Final[int] = 100
+SEC_CURRENT_URL: Final[str] = (
+    f"{SEC_BASE_URL}/cgi-bin/browse-edgar?"
+    "action=getcurrent&type=&company=&dateb=&owner=exclude&start={start}&count={count}"
+)
+
+# Quarterly full-index files: {base}/{year}/QTR{quarter}/{kind}.{idx,gz,zip}
+SEC_FULL_INDEX_URL: Final[str] = f"{SEC_BASE_URL}/Archives/edgar/full-index"
+SEC_ARCHIVES_URL: Final[str] = f"{SEC_BASE_URL}/Archives"
+# Filing detail ("-index.htm") pages, fetched by `hoot enrich`
+SEC_FILING_INDEX_URL: Final[str] = (
+    f"{SEC_ARCHIVES_URL}/edgar/data/{{cik}}/{{folder}}/{{accession}}-index.htm"
+)
+ENRICH_MAX_ATTEMPTS: Final[int] = 3  # queue attempts before a filing is marked failed
+# Claims older than this many seconds belong to a run that died and are handed out again
+ENRICH_CLAIM_TIMEOUT: Final[float] = float(os.getenv("HOOT_ENRICH_CLAIM_TIMEOUT", "900"))
+
+# Per-company submissions JSON: recent filings inline, older ones in paged files
+SEC_DATA_URL: Final[str] = "https://data.sec.gov"
+SEC_SUBMISSIONS_URL: Final[str] = f"{SEC_DATA_URL}/submissions"
+# Watchlist scheduling: active filers are polled every interval, quiet ones less often
+WATCHLIST_INTERVAL: Final[float] = float(os.getenv("HOOT_WATCHLIST_INTERVAL", "3600"))  # seconds
+WATCHLIST_MAX_INTERVAL: Final[float] = 7 * 86400
+WATCHLIST_MAX_REQUESTS: Final[int] = 100  # submissions fetched per scrape run
 
 # Data storage
 DEFAULT_DB_PATH: Final[str] = "data/hoot.sqlite"
 DEFAULT_CSV_PATH: Final[str] = "data/snapshot.csv"
+DEFAULT_PARQUET_PATH: Final[str] = "data/parquet"
+DEFAULT_CACHE_PATH: Final[str] = "data/http_cache.sqlite"
+DEFAULT_ARCHIVE_PATH: Final[str] = "data/archive.sqlite"  # raw pages for `hoot replay`
+INSERT_BATCH_SIZE: Final[int] = 10_000  # rows per bulk-insert transaction
+EXPORT_BATCH_SIZE: Final[int] = 5_000  # rows per fetchmany() when streaming exports
+MIGRATE_BATCH_SIZE: Final[int] = 50_000  # rows copied per transaction by `hoot migrate`
+CACHE_MAX_BYTES: Final[int] = int(os.getenv("HOOT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# `hoot watch` polling: the interval shrinks while filings keep arriving, and grows when quiet
+WATCH_MIN_INTERVAL: Final[float] = float(os.getenv("HOOT_WATCH_MIN_INTERVAL", "5"))  # seconds
+WATCH_MAX_INTERVAL: Final[float] = float(os.getenv("HOOT_WATCH_MAX_INTERVAL", "300"))
+DEFAULT_STATUS_PATH: Final[str] = "data/watch_status.json"
+
+# `hoot serve` read API
+SERVE_HOST: Final[str] = os.getenv("HOOT_SERVE_HOST", "127.0.0.1")
+SERVE_PORT: Final[int] = int(os.getenv("HOOT_SERVE_PORT", "8765"))
+SERVE_POOL_SIZE: Final[int] = 8  # read-only connections shared by request threads
+SERVE_CACHE_ENTRIES: Final[int] = 256  # cached JSON responses (LRU)
+SERVE_ACQUIRE_TIMEOUT: Final[float] = 5.0  # seconds to wait for a connection before a 503
+SERVE_STREAM_PAGE_SIZE: Final[int] = 1000  # NDJSON rows read per borrowed connection
+
+# SQLite tuning profiles (PRAGMA name -> value), selected with HOOT_SQLITE_PROFILE
+SQLITE_PROFILES: Final[dict] = {
+    # WAL lets readers (summary, notebooks) run alongside a writing scrape
+    "default": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64_000,  # negative = KiB, i.e. ~64 MB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5_000,  # ms
+    },
+    # Fastest bulk loads; a crash may lose the last transactions (never corrupts in WAL)
+    "bulk": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -256_000,
+        "mmap_size": 1024 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5_000,
+    },
+    # SQLite's own defaults (rollback journal, full sync)
+    "compat": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "busy_timeout": 5_000,
+    },
+}
+SQLITE_PROFILE: Final[str] = os.getenv("HOOT_SQLITE_PROFILE", "default")
+
+# Table layout of new databases: "wide" stores every filing column as text; "compact"
+# dictionary-encodes companies and form types, packs accession numbers into integers
+# and derives URLs (existing databases keep their layout until `hoot migrate`)
+SQLITE_SCHEMAS: Final[tuple] = ("wide", "compact")
+SQLITE_SCHEMA: Final[str] = os.getenv("HOOT_SQLITE_SCHEMA", "wide")
+
+# Time-partitioned storage (`hoot shards`): a directory holding one SQLite file per
+# filing_date year or quarter, plus a catalog of the shards, cursors and export watermarks
+SHARD_PERIODS: Final[tuple] = ("year", "quarter")
+SHARD_PERIOD: Final[str] = os.getenv("HOOT_SHARD_PERIOD", "year")
+SHARD_CATALOG_NAME: Final[str] = "catalog.sqlite"
+DEFAULT_SHARD_PATH: Final[str] = "data/shards"
+# Days after a period ends before `hoot shards maintain` closes its shard (late filings)
+SHARD_CLOSE_AFTER_DAYS: Final[int] = int(os.getenv("HOOT_SHARD_CLOSE_AFTER_DAYS", "7"))
 
 # Logging
 LOG_FORMAT: Final[str] = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -0,0 +1,385 @@
+"""Second-stage enrichment from filing detail pages."""
+
+import logging
+import re
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+from lxml import html
+
+from hootscrapper.config import (
+    ENRICH_CLAIM_TIMEOUT,
+    ENRICH_MAX_ATTEMPTS,
+    MAX_CONCURRENCY,
+    SEC_BASE_URL,
+    SEC_FILING_INDEX_URL,
+)
+from hootscrapper.scrapers.sec_edgar import SECEdgarScraper
+from hootscrapper.storage import FilingStorage
+from hootscrapper.utils import build_session, make_request
+
+logger = logging.getLogger(__name__)
+
+SIC_RE = re.compile(r"SIC=(\d+)")
+
+# Queue states; "running" rows left behind by a crash are reset once their claim goes stale
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+
+
+@dataclass
+class FilingDetail:
+    """Fields taken from a filing's detail (index) page."""
+
+    accession_number: str
+    period_of_report: Optional[str]
+    primary_document_url: Optional[str]
+    primary_document_size: Optional[int]
+    total_size: Optional[int]
+    document_count: int
+    sic: Optional[str]
+    fetched_at: str
+
+
+@dataclass
+class EnrichResult:
+    """Counts from an enrichment run."""
+
+    enriched: int = 0
+    failed: int = 0
+    retried: int = 0
+
+
+def detail_url(cik: str, accession_number: str) -> str:
+    """Build the URL of a filing's detail page from its CIK and accession number."""
+    return SEC_FILING_INDEX_URL.format(
+        cik=cik, folder=accession_number.replace("-", ""), accession=accession_number
+    )
+
+
+def _size(text: str) -> Optional[int]:
+    digits = text.strip().replace(",", "")
+    return int(digits) if digits.isdigit() else None
+
+
+def parse_detail_page(
+    content: bytes,
+    accession_number: str,
+    base_url: str = SEC_BASE_URL,
+    fetched_at: Optional[str] = None,
+) -> FilingDetail:
+    """
+    Parse an EDGAR filing detail page.
+
+    Args:
+        content: Raw page bytes
+        accession_number: Accession number of the filing
+        base_url: Base for relative document links
+        fetched_at: Timestamp to record (defaults to now)
+
+    Returns:
+        FilingDetail (fields missing from the page are None)
+    """
+    doc = html.fromstring(content)
+
+    period = None
+    for head in doc.xpath('//div[contains(@class, "infoHead")]'):
+        if head.text_content().strip() == "Period of Report":
+            info = head.getnext()
+            if info is not None:
+                period = info.text_content().strip() or None
+            break
+
+    sic = None
+    for link in doc.xpath('//*[contains(@class, "identInfo")]//a[contains(@href, "SIC=")]'):
+        match = SIC_RE.search(link.get("href", ""))
+        if match:
+            sic = match.group(1)
+            break
+
+    primary_url = primary_size = total_size = None
+    sizes: List[int] = []
+    tables = doc.xpath('//table[contains(@class, "tableFile")]')
+    for row in tables[0].xpath(".//tr[td]") if tables else []:
+        cols = row.xpath("./td")
+        if len(cols) < 5:
+            continue
+        size = _size(cols[4].text_content())
+        link = next(iter(cols[2].xpath(".//a[@href]")), None)
+        if "complete submission" in cols[1].text_content().lower():
+            total_size = size
+            continue
+        if size is not None:
+            sizes.append(size)
+        if primary_url is None and link is not None:
+            primary_url = urljoin(base_url, link.get("href"))
+            primary_size = size
+
+    return FilingDetail(
+        accession_number=accession_number,
+        period_of_report=period,
+        primary_document_url=primary_url,
+        primary_document_size=primary_size,
+        total_size=total_size if total_size is not None else (sum(sizes) or None),
+        document_count=len(sizes),
+        sic=sic,
+        fetched_at=fetched_at or datetime.utcnow().isoformat(),
+    )
+
+
+class Enricher:
+    """
+    Fetches filing detail pages into a ``filing_details`` table.
+
+    Work is tracked in an ``enrich_queue`` table next to ``filings``, so an
+    interrupted run resumes with the filings it had not finished. Pages are
+    fetched by a bounded thread pool over one pooled session, all drawing from
+    the scraper's rate limiter; results are written from the calling thread,
+    one transaction per completed page.
+    """
+
+    def __init__(
+        self,
+        storage: FilingStorage,
+        scraper: Optional[SECEdgarScraper] = None,
+        workers: int = MAX_CONCURRENCY,
+        max_attempts: int = ENRICH_MAX_ATTEMPTS,
+        claim_timeout: float = ENRICH_CLAIM_TIMEOUT,
+    ):
+        """
+        Initialize enricher, creating its tables if needed.
+
+        Args:
+            storage: Storage holding the filings to enrich
+            scraper: Scraper whose rate limiter, robots.txt cache and base URL are used
+            workers: Max detail pages in flight
+            max_attempts: Attempts per filing before it is marked failed
+            claim_timeout: Seconds before a "running" claim is treated as abandoned
+        """
+        self.storage = storage
+        self.scraper = scraper or SECEdgarScraper()
+        self.workers = max(1, workers)
+        self.max_attempts = max_attempts
+        self.claim_timeout = claim_timeout
+
+        with storage.conn as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS filing_details (
+                    accession_number TEXT PRIMARY KEY
+                        REFERENCES filings(accession_number),
+                    period_of_report TEXT,
+                    primary_document_url TEXT,
+                    primary_document_size INTEGER,
+                    total_size INTEGER,
+                    document_count INTEGER NOT NULL DEFAULT 0,
+                    sic TEXT,
+                    fetched_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS enrich_queue (
+                    accession_number TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_enrich_queue_status ON enrich_queue(status)
+            """)
+
+    def enqueue(
+        self, filing_types: Optional[Iterable[str]] = None, retry_failed: bool = False
+    ) -> int:
+        """
+        Queue stored filings that are not queued yet, in one statement.
+
+        Args:
+            filing_types: Only queue these filing types (default: all)
+            retry_failed: Give failed filings a fresh set of attempts
+
+        Returns:
+            Number of filings newly queued
+        """
+        conn = self.storage.conn
+        conn.create_function("hoot_detail_url", 2, detail_url, deterministic=True)
+        sql = """
+            INSERT OR IGNORE INTO enrich_queue (accession_number, url, updated_at)
+            SELECT f.accession_number, hoot_detail_url(f.cik, f.accession_number), ?
+            FROM filings f
+            WHERE f.cik != '' AND f.accession_number != ''
+        """
+        now = time.time()
+        params: list = [now]
+        if filing_types:
+            filing_types = list(filing_types)
+            sql += f" AND f.filing_type IN ({', '.join('?' * len(filing_types))})"
+            params.extend(filing_types)
+
+        with conn:
+            if retry_failed:
+                conn.execute(
+                    "UPDATE enrich_queue SET status = ?, attempts = 0, updated_at = ? "
+                    "WHERE status = ?",
+                    (PENDING, now, FAILED),
+                )
+            added = conn.execute(sql, params).rowcount
+        logger.info(f"Queued {added} filings for enrichment")
+        return added
+
+    def counts(self) -> dict:
+        """Get queue size by status."""
+        rows = self.storage.conn.execute(
+            "SELECT status, COUNT(*) FROM enrich_queue GROUP BY status"
+        ).fetchall()
+        return {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0, **dict(rows)}
+
+    def _claim(self, count: int) -> List[Tuple[str, str]]:
+        """Mark up to ``count`` pending filings as running and return them."""
+        conn = self.storage.conn
+        # Take the write lock before reading, so two runs never claim the same rows
+        conn.execute("BEGIN IMMEDIATE")
+        with conn:
+            rows = conn.execute(
+                "SELECT accession_number, url FROM enrich_queue WHERE status = ? "
+                "ORDER BY updated_at LIMIT ?",
+                (PENDING, count),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE enrich_queue SET status = ?, updated_at = ? WHERE accession_number = ?",
+                [(RUNNING, time.time(), accession) for accession, _ in rows],
+            )
+        return rows
+
+    def _fetch(self, session: requests.Session, accession_number: str, url: str) -> FilingDetail:
+        """Fetch and parse one detail page (runs on a worker thread)."""
+        response = make_request(url, self.scraper.rate_limiter, session=session)
+        return parse_detail_page(response.content, accession_number, self.scraper.base_url)
+
+    def _complete(self, detail: FilingDetail) -> None:
+        """Store a detail row and mark its queue entry done."""
+        conn = self.storage.conn
+        with conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO filing_details
+                (accession_number, period_of_report, primary_document_url,
+                 primary_document_size, total_size, document_count, sic, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    detail.accession_number,
+                    detail.period_of_report,
+                    detail.primary_document_url,
+                    detail.primary_document_size,
+                    detail.total_size,
+                    detail.document_count,
+                    detail.sic,
+                    detail.fetched_at,
+                ),
+            )
+            conn.execute(
+                "UPDATE enrich_queue SET status = ?, last_error = NULL, updated_at = ? "
+                "WHERE accession_number = ?",
+                (DONE, time.time(), detail.accession_number),
+            )
+
+    def _fail(self, accession_number: str, error: Exception, retryable: bool = True) -> bool:
+        """Record a failed attempt; returns True if the filing will be retried."""
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        conn = self.storage.conn
+        with conn:
+            conn.execute(
+                "UPDATE enrich_queue SET attempts = attempts + 1 WHERE accession_number = ?",
+                (accession_number,),
+            )
+            attempts = conn.execute(
+                "SELECT attempts FROM enrich_queue WHERE accession_number = ?",
+                (accession_number,),
+            ).fetchone()[0]
+            # A missing page will not appear on retry
+            retry = retryable and attempts < self.max_attempts and status != 404
+            conn.execute(
+                "UPDATE enrich_queue SET status = ?, last_error = ?, updated_at = ? "
+                "WHERE accession_number = ?",
+                (PENDING if retry else FAILED, str(error)[:500], time.time(), accession_number),
+            )
+        logger.warning(f"Failed to enrich {accession_number} (attempt {attempts}): {error}")
+        return retry
+
+    def run(self, limit: Optional[int] = None) -> EnrichResult:
+        """
+        Work through the queue until it is empty (or ``limit`` filings are done).
+
+        Args:
+            limit: Stop after this many filings have been attempted
+
+        Returns:
+            EnrichResult with enriched/failed/retried counts
+        """
+        result = EnrichResult()
+        conn = self.storage.conn
+        with conn:
+            # Fresh claims may belong to another run that is still working on them
+            resumed = conn.execute(
+                "UPDATE enrich_queue SET status = ? WHERE status = ? AND updated_at < ?",
+                (PENDING, RUNNING, time.time() - self.claim_timeout),
+            ).rowcount
+        if resumed:
+            logger.info(f"Resuming {resumed} filings interrupted by a previous run")
+
+        budget = limit if limit is not None else float("inf")
+        in_flight: deque = deque()
+        session = build_session(pool_size=self.workers)
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hoot-enrich")
+        try:
+            while True:
+                # Keep two pages per worker queued so no worker sits idle
+                room = int(min(2 * self.workers - len(in_flight), budget))
+                if room > 0:
+                    for accession, url in self._claim(room):
+                        budget -= 1
+                        if not self.scraper.robots.can_fetch(url):
+                            error = PermissionError(f"Blocked by robots.txt: {url}")
+                            self._fail(accession, error, retryable=False)
+                            result.failed += 1
+                            continue
+                        future = pool.submit(self._fetch, session, accession, url)
+                        in_flight.append((accession, future))
+                if not in_flight:
+                    break
+
+                accession, future = in_flight.popleft()
+                self._collect(accession, future, result)
+                if (result.enriched + result.failed + result.retried) % 100 == 0:
+                    logger.info(f"Enriched {result.enriched} filings ({result.failed} failed)")
+        finally:
+            # Unfinished claims stay "running" until they go stale, then are resumed
+            pool.shutdown(wait=True, cancel_futures=True)
+            session.close()
+
+        logger.info(
+            f"Enrichment finished: {result.enriched} enriched, {result.failed} failed, "
+            f"{result.retried} to retry"
+        )
+        return result
+
+    def _collect(self, accession: str, future: Future, result: EnrichResult) -> None:
+        """Wait for one fetch and record its outcome."""
+        try:
+            detail = future.result()
+        except Exception as e:
+            if self._fail(accession, e):
+                result.retried += 1
+            else:
+                result.failed += 1
+            return
+        self._complete(detail)
+        result.enriched += 1
@@ -0,0 +1,273 @@
+"""In-process counters and latency histograms for finding bottlenecks."""
+
+import bisect
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) shared by every histogram: 0.5 ms to 60 s
+BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)  # fmt: skip
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Bucketed distribution of observed durations."""
+
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket containing it."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(BUCKETS[i], self.max) if i < len(BUCKETS) else self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+            "min": round(self.min, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class Registry:
+    """
+    Thread-safe store of named counters and histograms.
+
+    A disabled registry drops every update after a single attribute check, so
+    instrumented code paths cost next to nothing unless metrics were requested.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """Initialize an empty registry."""
+        self.enabled = enabled
+        self.started_at = datetime.utcnow().isoformat()
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, help_text: str) -> None:
+        """Attach a Prometheus HELP line to a metric."""
+        self._help[name] = help_text
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """Add ``value`` to a counter."""
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """Record one duration in a histogram."""
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        """Time the enclosed block into a histogram."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self) -> None:
+        """Drop every recorded value."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+        self.started_at = datetime.utcnow().isoformat()
+
+    def snapshot(self) -> dict:
+        """Return every metric as a JSON-serializable run report."""
+        with self._lock:
+            counters = {
+                _key(name, labels): value for (name, labels), value in self._counters.items()
+            }
+            histograms = {
+                _key(name, labels): histogram.to_dict()
+                for (name, labels), histogram in self._histograms.items()
+            }
+        return {
+            "started_at": self.started_at,
+            "finished_at": datetime.utcnow().isoformat(),
+            "counters": dict(sorted(counters.items())),
+            "histograms": dict(sorted(histograms.items())),
+        }
+
+    def write_report(self, path: str, **extra) -> None:
+        """Write the run report (plus ``extra`` top-level fields) as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({**extra, **self.snapshot()}, indent=2) + "\n")
+        logger.info(f"Metrics written to {path}")
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(
+                ((key, h.counts[:], h.count, h.sum) for key, h in self._histograms.items()),
+                key=lambda item: item[0],
+            )
+
+        lines: List[str] = []
+        described = set()
+
+        def header(name: str, kind: str) -> None:
+            if name in described:
+                return
+            described.add(name)
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in counters:
+            header(name, "counter")
+            lines.append(f"{name}{_labels(labels)} {value:g}")
+
+        for (name, labels), counts, count, total in histograms:
+            header(name, "histogram")
+            cumulative = 0
+            for bound, bucket in zip(BUCKETS + (float("inf"),), counts):
+                cumulative += bucket
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f"{name}_bucket{_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {total:.6f}")
+            lines.append(f"{name}_count{_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _key(name: str, labels: Labels) -> str:
+    return name + _labels(labels)
+
+
+# Process-wide registry used by the instrumented code paths (off by default)
+REGISTRY = Registry()
+inc = REGISTRY.inc
+observe = REGISTRY.observe
+timer = REGISTRY.timer
+
+for _name, _help in {
+    "hoot_http_request_seconds": "Time from sending a GET to receiving the response body",
+    "hoot_http_requests_total": "HTTP responses received, by status code",
+    "hoot_http_bytes_total": "Response body bytes received",
+    "hoot_http_retries_total": "Requests retried after a failure",
+    "hoot_http_errors_total": "Requests that failed with a connection error or timeout",
+    "hoot_ratelimit_wait_seconds": "Time spent sleeping in the rate limiter",
+    "hoot_parse_seconds": "Time spent parsing one feed page",
+    "hoot_rows_parsed_total": "Filings parsed from feed pages",
+    "hoot_insert_batch_seconds": "Time spent writing one insert transaction",
+    "hoot_rows_inserted_total": "Filings inserted",
+    "hoot_rows_skipped_total": "Duplicate filings skipped on insert",
+    "hoot_rows_updated_total": "Existing filings refreshed by an upsert",
+    "hoot_api_request_seconds": "Time spent answering one API request",
+}.items():
+    REGISTRY.describe(_name, _help)
+
+
+def enable() -> None:
+    """Start recording metrics in the process-wide registry."""
+    REGISTRY.enabled = True
+
+
+def is_enabled() -> bool:
+    """Whether the process-wide registry is recording."""
+    return REGISTRY.enabled
+
+
+def start_http_server(port: int, host: str = "127.0.0.1") -> "ThreadingHTTPServer":
+    """
+    Enable metrics and serve them at ``/metrics`` from a background thread.
+
+    Args:
+        port: Port to bind (0 picks a free one)
+        host: Interface to bind
+
+    Returns:
+        The running server (call ``shutdown()`` to stop it)
+    """
+    from http import HTTPStatus
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args) -> None:
+            logger.debug(f"{self.address_string()} {format % args}")
+
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+            body = REGISTRY.to_prometheus().encode()
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    enable()
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="hoot-metrics", daemon=True).start()
+    logger.info(f"Serving metrics on http://{host}:{server.server_port}/metrics")
+    return server
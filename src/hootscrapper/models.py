@@ -0,0 +1,16 @@
+"""Data model shared by the scrapers and storage."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Filing:
+    """Represents an SEC filing."""
+
+    cik: str
+    company_name: str
+    filing_type: str
+    filing_date: str
+    accession_number: str
+    document_url: str
+    scraped_at: str
@@ -0,0 +1,194 @@
+"""Cached robots.txt policies."""
+
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+from hootscrapper.config import ROBOTS_ERROR_TTL, ROBOTS_TTL, USER_AGENT
+from hootscrapper.utils import RateLimiter, make_request
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RobotsEntry:
+    """A fetched robots.txt and its HTTP validators."""
+
+    host: str
+    status: int
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    def to_parser(self) -> RobotFileParser:
+        """
+        Build a parser following RFC 9309 status handling.
+
+        A server error or an unreachable host (status 0) disallows everything
+        until the entry is retried. Like ``urllib.robotparser``, 401 and 403 also
+        disallow everything, where the RFC would allow it.
+        """
+        parser = RobotFileParser()
+        if self.status in (0, 401, 403) or self.status >= 500:
+            parser.disallow_all = True
+        elif self.status >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(self.body.splitlines())
+        parser.modified()
+        return parser
+
+
+class RobotsCache:
+    """
+    Per-host robots.txt cache.
+
+    Parsed policies are kept in memory and, when ``db_path`` is given, persisted
+    in a ``robots_cache`` table so later processes skip the fetch entirely. Expired
+    entries are revalidated with ``If-None-Match``/``If-Modified-Since``. Fetches
+    go through ``make_request``, so they are rate-limited and send ``USER_AGENT``.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl: float = ROBOTS_TTL,
+        rate_limiter: Optional[RateLimiter] = None,
+        user_agent: str = USER_AGENT,
+    ):
+        """Initialize cache, creating the on-disk table if a database is given."""
+        self.db_path = Path(db_path) if db_path else None
+        self.ttl = ttl
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.user_agent = user_agent
+        self._entries: Dict[str, RobotsEntry] = {}
+        self._parsers: Dict[str, RobotFileParser] = {}
+        self._lock = threading.Lock()
+
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(self.db_path)) as conn, conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS robots_cache (
+                        host TEXT PRIMARY KEY,
+                        status INTEGER NOT NULL,
+                        body TEXT NOT NULL,
+                        etag TEXT,
+                        last_modified TEXT,
+                        expires_at REAL NOT NULL
+                    )
+                """)
+
+    def policy(self, url: str) -> RobotFileParser:
+        """
+        Get the parsed robots.txt policy for a URL's host.
+
+        Args:
+            url: Any URL on the host
+
+        Returns:
+            RobotFileParser for the host
+        """
+        parsed = urlparse(url)
+        host = f"{parsed.scheme}://{parsed.netloc}"
+
+        with self._lock:
+            entry = self._entries.get(host) or self._load(host)
+            if entry is None or entry.expires_at <= time.time():
+                entry = self._fetch(host, entry)
+                self._store(entry)
+                self._parsers.pop(host, None)
+            self._entries[host] = entry
+            if host not in self._parsers:
+                self._parsers[host] = entry.to_parser()
+            return self._parsers[host]
+
+    def can_fetch(self, url: str) -> bool:
+        """Check if a URL may be fetched under its host's policy."""
+        can_fetch = self.policy(url).can_fetch(self.user_agent, url)
+        logger.debug(f"robots.txt check for {url}: {'ALLOWED' if can_fetch else 'BLOCKED'}")
+        return can_fetch
+
+    def can_fetch_many(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """Check many URLs, resolving each host's policy once."""
+        return {url: self.can_fetch(url) for url in urls}
+
+    def _fetch(self, host: str, stale: Optional[RobotsEntry]) -> RobotsEntry:
+        """Download (or revalidate) robots.txt for a host."""
+        headers = {"User-Agent": self.user_agent}
+        if stale is not None:
+            if stale.etag:
+                headers["If-None-Match"] = stale.etag
+            if stale.last_modified:
+                headers["If-Modified-Since"] = stale.last_modified
+
+        expires_at = time.time() + self.ttl
+        try:
+            response = make_request(f"{host}/robots.txt", self.rate_limiter, headers=headers)
+        except requests.RequestException as e:
+            status = getattr(e.response, "status_code", None) or 0
+            if 400 <= status < 500:
+                logger.info(f"robots.txt for {host} returned {status}")
+                return RobotsEntry(host, status, "", None, None, expires_at)
+            # Keep the last known policy (or disallow everything), and retry soon
+            logger.warning(f"Could not fetch robots.txt for {host}: {e}")
+            retry_at = time.time() + min(self.ttl, ROBOTS_ERROR_TTL)
+            if stale is not None:
+                stale.expires_at = retry_at
+                return stale
+            logger.warning("Assuming disallowed.")
+            return RobotsEntry(host, status, "", None, None, retry_at)
+
+        if response.status_code == 304 and stale is not None:
+            logger.debug(f"robots.txt for {host} not modified")
+            stale.expires_at = expires_at
+            return stale
+
+        return RobotsEntry(
+            host=host,
+            status=response.status_code,
+            body=response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            expires_at=expires_at,
+        )
+
+    def _load(self, host: str) -> Optional[RobotsEntry]:
+        """Read a host's entry from the database, if persisted."""
+        if not self.db_path:
+            return None
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            row = conn.execute(
+                "SELECT host, status, body, etag, last_modified, expires_at "
+                "FROM robots_cache WHERE host = ?",
+                (host,),
+            ).fetchone()
+        return RobotsEntry(*row) if row else None
+
+    def _store(self, entry: RobotsEntry) -> None:
+        """Persist a host's entry to the database."""
+        if not self.db_path:
+            return
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO robots_cache "
+                "(host, status, body, etag, last_modified, expires_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    entry.host,
+                    entry.status,
+                    entry.body,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.expires_at,
+                ),
+            )
@@ -2,80 +2,388 @@
 
 import logging
 import re
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from functools import partial
+from io import BytesIO
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional, Set, Tuple
 
 from bs4 import BeautifulSoup
+from lxml import etree
 
-from hootscrapper.config import SEC_BASE_URL, SEC_SEARCH_URL
-from hootscrapper.utils import RateLimiter, check_robots_txt, make_request
+from hootscrapper import metrics
+from hootscrapper.config import (
+    MAX_CONCURRENCY,
+    SEC_BASE_URL,
+    SEC_CURRENT_PAGE_SIZE,
+    SEC_CURRENT_URL,
+)
+from hootscrapper.models import Filing
+from hootscrapper.robots import RobotsCache
+from hootscrapper.utils import RateLimiter, make_request
+
+if TYPE_CHECKING:
+    from hootscrapper.archive import PageArchive
+    from hootscrapper.cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+ENGINES = ("sync", "async")
+PARSERS = ("lxml", "bs4")
+
+CIK_RE = re.compile(r"CIK=(\d+)")
+ACCESSION_RE = re.compile(r"accession-number=([0-9-]+)")
 
-@dataclass
-class Filing:
-    """Represents an SEC filing."""
 
-    cik: str
-    company_name: str
-    filing_type: str
-    filing_date: str
-    accession_number: str
-    document_url: str
-    scraped_at: str
+def _text(element) -> str:
+    """lxml equivalent of BeautifulSoup's ``get_text(strip=True)``."""
+    return "".join(piece.strip() for piece in element.itertext())
 
 
 class SECEdgarScraper:
     """Scraper for SEC EDGAR recent filings."""
 
-    def __init__(self, delay: float = 0.5):
-        """Initialize scraper with rate limiter."""
-        self.rate_limiter = RateLimiter(delay=delay)
+    def __init__(
+        self,
+        delay: float = 0.5,
+        engine: str = "sync",
+        concurrency: int = MAX_CONCURRENCY,
+        rate_limiter: Optional[RateLimiter] = None,
+        robots: Optional[RobotsCache] = None,
+        cache: Optional["ResponseCache"] = None,
+        parser: str = "lxml",
+        archive: Optional["PageArchive"] = None,
+    ):
+        """
+        Initialize scraper with rate limiter.
+
+        Args:
+            delay: Minimum delay between requests (seconds)
+            engine: "sync" prefetches one page ahead with ``make_request``;
+                "async" keeps up to ``concurrency`` pages in flight via AsyncFetcher
+            concurrency: Max in-flight requests for the async engine
+            rate_limiter: Limiter to share with other scrapers (overrides ``delay``)
+            robots: robots.txt cache (defaults to an in-memory cache)
+            cache: Optional response cache for conditional GETs of feed pages
+            parser: "lxml" streams the raw page with lxml's iterparse; "bs4" builds
+                a full BeautifulSoup tree. Both produce identical filings.
+            archive: Optional archive that keeps every fetched page for ``hoot replay``
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine} (expected one of {ENGINES})")
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown parser: {parser} (expected one of {PARSERS})")
+        self.rate_limiter = rate_limiter or RateLimiter(delay=delay)
+        self.robots = robots or RobotsCache(rate_limiter=self.rate_limiter)
+        self.cache = cache
+        self.engine = engine
+        self.concurrency = concurrency
+        self.parser = parser
+        self.archive = archive
         self.base_url = SEC_BASE_URL
+        self.reached_known = False
+        self.pages_fetched = 0  # feed page requests sent by the last scrape
 
-    def scrape(self, limit: int = 100) -> List[Filing]:
+    def scrape(
+        self,
+        limit: int = 100,
+        known: Optional[Callable[[Iterable[str]], Set[str]]] = None,
+        cursor: Optional[Tuple[str, str]] = None,
+    ) -> List[Filing]:
         """
-        Scrape recent SEC filings.
+        Scrape recent SEC filings, following the feed's pagination.
+
+        Once a page is parsed and the crawl goes on, the next one is fetched in
+        the background while the current page is stored. The feed is newest
+        first, so the crawl stops paging (and parsing) at the first filing it
+        already has, without requesting another page.
 
         Args:
             limit: Maximum number of filings to scrape
+            known: Optional callback returning the subset of the given accession
+                numbers that are already stored
+            cursor: Optional ``(accession_number, filing_date)`` high-water mark
+                from the previous run; parsing stops at that filing, or at the
+                first filing dated before it
 
         Returns:
             List of Filing objects
         """
         logger.info(f"Starting SEC EDGAR scrape (limit={limit})")
+        self.reached_known = False
+        self.pages_fetched = 0
 
         # Check robots.txt
-        if not check_robots_txt(SEC_SEARCH_URL):
+        if not self.robots.can_fetch(self._page_url(0)):
             logger.error("Scraping blocked by robots.txt")
             return []
 
-        # Fetch the recent filings page
+        stopped = False
+
+        def at_cursor(filing: Filing) -> bool:
+            nonlocal stopped
+            stopped = filing.accession_number == cursor[0] or (
+                bool(filing.filing_date) and filing.filing_date < cursor[1]
+            )
+            return stopped
+
+        filings: List[Filing] = []
         try:
-            response = make_request(SEC_SEARCH_URL, self.rate_limiter)
-            soup = BeautifulSoup(response.content, "lxml")
+            for start, content, fetch_next in self._iter_pages(limit):
+                if self.archive is not None:
+                    self.archive.put(self._page_url(start), content)
+                page, rows_seen = self.parse_feed_page(
+                    content, SEC_CURRENT_PAGE_SIZE, stop=at_cursor if cursor else None
+                )
+                logger.debug(f"Parsed {len(page)} filings from page start={start}")
+                self.reached_known = stopped
 
-            filings = self._parse_filings_table(soup, limit)
-            logger.info(f"Successfully scraped {len(filings)} filings")
+                if known is not None:
+                    seen = known(f.accession_number for f in page if f.accession_number)
+                    for i, filing in enumerate(page):
+                        if filing.accession_number in seen:
+                            page = page[:i]
+                            self.reached_known = True
+                            break
 
-            return filings
+                filings.extend(page)
+                # A short table ends the feed; rows that failed to parse don't
+                done = (
+                    self.reached_known or len(filings) >= limit or rows_seen < SEC_CURRENT_PAGE_SIZE
+                )
+                if not done:
+                    # Request the next page only once the crawl is known to go on
+                    fetch_next()
+                if self.reached_known:
+                    logger.info(f"Reached known filings after {self.pages_fetched} pages")
+                if done:
+                    break
 
         except Exception as e:
             logger.error(f"Failed to scrape SEC EDGAR: {e}")
-            return []
 
-    def _parse_filings_table(self, soup: BeautifulSoup, limit: int) -> List[Filing]:
-        """Parse the filings table from SEC page."""
+        return self._finish(filings, limit)
+
+    def _finish(self, filings: List[Filing], limit: int) -> List[Filing]:
+        """Trim results to the limit and log the outcome."""
+        filings = filings[:limit]
+        logger.info(f"Successfully scraped {len(filings)} filings")
+        return filings
+
+    def _page_url(self, start: int) -> str:
+        """Build the feed URL for the page beginning at ``start``."""
+        return SEC_CURRENT_URL.format(start=start, count=SEC_CURRENT_PAGE_SIZE)
+
+    def _fetch_page(self, start: int) -> bytes:
+        """Fetch one raw feed page."""
+        self.pages_fetched += 1
+        return make_request(self._page_url(start), self.rate_limiter, cache=self.cache).content
+
+    def _iter_pages(self, limit: int) -> Iterator[Tuple[int, bytes, Callable[[], None]]]:
+        """
+        Yield ``(start, content, fetch_next)`` for each feed page.
+
+        Only the first page is requested up front. Calling ``fetch_next`` starts
+        fetching the next page in the background while the caller finishes with
+        the current one; a caller that stops without calling it sends no
+        further requests. The generator ends after a page whose ``fetch_next``
+        was not called.
+        """
+        starts = range(0, limit, SEC_CURRENT_PAGE_SIZE)
+        if not starts:
+            return
+        if self.engine == "async":
+            yield from self._iter_pages_async(starts)
+            return
+
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="edgar-prefetch")
+        pending: List[Future] = [pool.submit(self._fetch_page, starts[0])]
+
+        def fetch_next(index: int) -> None:
+            if not pending and index < len(starts):
+                pending.append(pool.submit(self._fetch_page, starts[index]))
+
+        try:
+            for i, start in enumerate(starts):
+                if not pending:
+                    return
+                content = pending.pop().result()
+                yield start, content, partial(fetch_next, i + 1)
+        finally:
+            # A fetch the caller asked for completes before the pool goes away
+            pool.shutdown(wait=True)
+
+    def _iter_pages_async(self, starts: range) -> Iterator[Tuple[int, bytes, Callable[[], None]]]:
+        """
+        Yield pages in order, like ``_iter_pages``, over the async engine.
+
+        Once the caller asks for the next page, up to ``concurrency`` pages are
+        kept in flight; a crawl that stops later leaves at most that many
+        fetches to finish, and the fetcher waits for them on exit.
+        """
+        from hootscrapper.fetch import AsyncFetcher
+
+        with AsyncFetcher(
+            self.rate_limiter, concurrency=self.concurrency, cache=self.cache
+        ) as fetcher:
+            remaining = iter(starts)
+            window: deque = deque()
+
+            def fill(count: int) -> None:
+                for start in islice(remaining, count):
+                    self.pages_fetched += 1
+                    window.append((start, fetcher.submit(self._page_url(start))))
+
+            def fetch_next(asked: List[bool]) -> None:
+                if not asked:
+                    asked.append(True)
+                    fill(fetcher.concurrency - len(window))
+
+            fill(1)
+            while window:
+                start, future = window.popleft()
+                content = future.result().content
+                asked: List[bool] = []
+                yield start, content, partial(fetch_next, asked)
+                if not asked:
+                    return
+
+    def parse_page(
+        self,
+        content: bytes,
+        limit: int,
+        scraped_at: Optional[str] = None,
+        stop: Optional[Callable[[Filing], bool]] = None,
+    ) -> List[Filing]:
+        """
+        Parse a raw feed page with the configured parser.
+
+        Falls back to BeautifulSoup if the lxml parser fails on a page.
+
+        Args:
+            content: Raw page bytes
+            limit: Maximum number of filings to return
+            scraped_at: Timestamp to stamp on each filing (defaults to now)
+            stop: Optional predicate; parsing ends before the first filing it accepts
+
+        Returns:
+            List of Filing objects
+        """
+        return self.parse_feed_page(content, limit, scraped_at, stop)[0]
+
+    def parse_feed_page(
+        self,
+        content: bytes,
+        limit: int,
+        scraped_at: Optional[str] = None,
+        stop: Optional[Callable[[Filing], bool]] = None,
+    ) -> Tuple[List[Filing], int]:
+        """
+        Parse a raw feed page like ``parse_page``, also counting its table rows.
+
+        Returns:
+            ``(filings, rows_seen)``: the filings, and the number of data rows in
+            the table, including rows that were skipped or failed to parse
+        """
+        if self.parser == "lxml":
+            try:
+                with metrics.timer("hoot_parse_seconds", parser="lxml"):
+                    filings, rows_seen = self._parse_filings_lxml(content, limit, scraped_at, stop)
+                metrics.inc("hoot_rows_parsed_total", len(filings), parser="lxml")
+                return filings, rows_seen
+            except Exception as e:
+                logger.warning(f"lxml parser failed ({e}); falling back to BeautifulSoup")
+        with metrics.timer("hoot_parse_seconds", parser="bs4"):
+            soup = BeautifulSoup(content, "lxml")
+            filings, rows_seen = self._parse_filings_table(soup, limit, scraped_at, stop)
+        metrics.inc("hoot_rows_parsed_total", len(filings), parser="bs4")
+        return filings, rows_seen
+
+    def _parse_filings_lxml(
+        self,
+        content: bytes,
+        limit: int,
+        scraped_at: Optional[str] = None,
+        stop: Optional[Callable[[Filing], bool]] = None,
+    ) -> Tuple[List[Filing], int]:
+        """Parse the filings table by streaming the page through lxml's iterparse."""
+        scraped_at = scraped_at or datetime.utcnow().isoformat()
+
+        for _, table in etree.iterparse(BytesIO(content), events=("end",), tag="table", html=True):
+            if "tableFile2" not in (table.get("class") or "").split():
+                table.clear()
+                continue
+
+            filings = []
+            rows = list(table.iter("tr"))[1:]  # Skip header
+            for row in rows[:limit]:
+                try:
+                    filing = self._row_to_filing([td for td in row.iter("td")], scraped_at)
+                except Exception as e:
+                    logger.warning(f"Failed to parse row: {e}")
+                    continue
+                if filing is None:
+                    continue
+                if stop is not None and stop(filing):
+                    break
+                filings.append(filing)
+            return filings, len(rows)
+
+        logger.warning("Could not find filings table")
+        return [], 0
+
+    def _row_to_filing(self, cols: list, scraped_at: str) -> Optional[Filing]:
+        """Build a Filing from a row's ``td`` elements (lxml)."""
+        if len(cols) < 5:
+            return None
+
+        link = next(cols[1].iter("a"), None)
+        href = link.get("href", "") if link is not None else ""
+
+        cik = ""
+        if "CIK" in href:
+            cik_match = CIK_RE.search(href)
+            if cik_match:
+                cik = cik_match.group(1).lstrip("0")
+
+        document_url = ""
+        if href:
+            document_url = self.base_url + href if href.startswith("/") else href
+
+        accession_number = ""
+        if document_url:
+            acc_match = ACCESSION_RE.search(document_url)
+            if acc_match:
+                accession_number = acc_match.group(1)
+
+        return Filing(
+            cik=cik,
+            company_name=_text(cols[1]),
+            filing_type=_text(cols[0]),
+            filing_date=_text(cols[3]),
+            accession_number=accession_number,
+            document_url=document_url,
+            scraped_at=scraped_at,
+        )
+
+    def _parse_filings_table(
+        self,
+        soup: BeautifulSoup,
+        limit: int,
+        scraped_at: Optional[str] = None,
+        stop: Optional[Callable[[Filing], bool]] = None,
+    ) -> Tuple[List[Filing], int]:
+        """Parse the filings table from SEC page, returning ``(filings, rows_seen)``."""
         filings = []
-        scraped_at = datetime.utcnow().isoformat()
+        scraped_at = scraped_at or datetime.utcnow().isoformat()
 
         # Find the table with recent filings
         table = soup.find("table", {"class": "tableFile2"})
         if not table:
             logger.warning("Could not find filings table")
-            return filings
+            return filings, 0
 
         rows = table.find_all("tr")[1:]  # Skip header
 
@@ -87,28 +395,27 @@ class SECEdgarScraper:
 
                 filing_type = cols[0].get_text(strip=True)
                 company_name = cols[1].get_text(strip=True)
-                cik_link = cols[1].find("a")
+                link = cols[1].find("a")
                 filing_date = cols[3].get_text(strip=True)
 
                 # Extract CIK from link
                 cik = ""
-                if cik_link and "CIK" in cik_link.get("href", ""):
-                    cik_match = re.search(r"CIK=(\d+)", cik_link["href"])
+                if link and "CIK" in link.get("href", ""):
+                    cik_match = CIK_RE.search(link["href"])
                     if cik_match:
                         cik = cik_match.group(1).lstrip("0")
 
                 # Get document link
-                doc_link = cols[1].find("a")
                 document_url = ""
-                if doc_link:
-                    href = doc_link.get("href", "")
+                if link:
+                    href = link.get("href", "")
                     if href:
                         document_url = self.base_url + href if href.startswith("/") else href
 
                 # Extract accession number from URL
                 accession_number = ""
                 if document_url:
-                    acc_match = re.search(r"accession-number=([0-9-]+)", document_url)
+                    acc_match = ACCESSION_RE.search(document_url)
                     if acc_match:
                         accession_number = acc_match.group(1)
 
@@ -121,6 +428,8 @@ class SECEdgarScraper:
                     document_url=document_url,
                     scraped_at=scraped_at,
                 )
+                if stop is not None and stop(filing):
+                    break
 
                 filings.append(filing)
                 logger.debug(f"Parsed filing: {filing.company_name} - {filing.filing_type}")
@@ -129,4 +438,4 @@ class SECEdgarScraper:
                 logger.warning(f"Failed to parse row: {e}")
                 continue
 
-        return filings
+        return filings, len(rows)
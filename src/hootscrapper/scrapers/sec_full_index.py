@@ -0,0 +1,225 @@
+"""Bulk ingest from EDGAR quarterly full-index files (master.idx / form.idx)."""
+
+import gzip
+import io
+import logging
+import shutil
+import tempfile
+import zipfile
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List, Optional, Sequence
+
+import requests
+
+from hootscrapper.config import SEC_ARCHIVES_URL, SEC_FULL_INDEX_URL
+from hootscrapper.models import Filing
+from hootscrapper.robots import RobotsCache
+from hootscrapper.utils import RateLimiter, make_request
+
+logger = logging.getLogger(__name__)
+
+INDEX_KINDS = ("master", "form")
+INDEX_SUFFIXES = (".idx", ".gz", ".zip")
+
+# Index files predate UTF-8 on EDGAR; latin-1 never fails to decode
+INDEX_ENCODING = "latin-1"
+
+
+def parse_index_lines(lines: Iterable[str], scraped_at: Optional[str] = None) -> Iterator[Filing]:
+    """
+    Parse the lines of a master.idx or form.idx file into filings.
+
+    The layout is detected from the column header above the dashed separator:
+    master.idx is pipe-delimited, form.idx is fixed-width. Lines are consumed
+    one at a time, so files of any size run in constant memory.
+
+    Args:
+        lines: Text lines of an index file
+        scraped_at: Timestamp to stamp on each filing (defaults to now)
+
+    Yields:
+        Filing objects
+    """
+    scraped_at = scraped_at or datetime.utcnow().isoformat()
+    lines = iter(lines)
+
+    header = ""
+    for line in lines:
+        if line.startswith("---"):
+            break
+        if line.strip():
+            header = line
+    else:
+        logger.warning("No index header found")
+        return
+
+    if "|" in header:
+        split = _split_master
+    else:
+        company_col = header.find("Company Name")
+        if company_col < 0:
+            logger.warning(f"Unrecognized index header: {header.strip()}")
+            return
+
+        def split(line: str) -> Sequence[str]:
+            return _split_form(line, company_col)
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            cik, company_name, form_type, date_filed, filename = split(line.rstrip("\r\n"))
+        except ValueError:
+            logger.debug(f"Skipping malformed index line: {line!r}")
+            continue
+
+        yield Filing(
+            cik=cik.strip().lstrip("0"),
+            company_name=company_name.strip(),
+            filing_type=form_type.strip(),
+            filing_date=_normalize_date(date_filed.strip()),
+            accession_number=Path(filename.strip()).stem,
+            document_url=f"{SEC_ARCHIVES_URL}/{filename.strip()}",
+            scraped_at=scraped_at,
+        )
+
+
+def _split_master(line: str) -> Sequence[str]:
+    """Split a master.idx row: CIK|Company Name|Form Type|Date Filed|Filename."""
+    fields = line.split("|")
+    if len(fields) != 5:
+        raise ValueError(line)
+    return fields
+
+
+def _split_form(line: str, company_col: int) -> Sequence[str]:
+    """Split a fixed-width form.idx row (form types may contain spaces, e.g. 'SC 13D')."""
+    head, cik, date_filed, filename = line.rsplit(None, 3)
+    return cik, head[company_col:], line[:company_col], date_filed, filename
+
+
+def _normalize_date(value: str) -> str:
+    """Normalize YYYYMMDD dates (used by some older indexes) to YYYY-MM-DD."""
+    if len(value) == 8 and value.isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:]}"
+    return value
+
+
+@contextmanager
+def open_index(name: str, stream: IO[bytes]) -> Iterator[IO[str]]:
+    """
+    Open a plain, gzip or zip index file as a text stream.
+
+    Args:
+        name: File name or URL (its suffix selects the decoder)
+        stream: Binary stream with the file contents
+
+    Yields:
+        Text stream of index lines
+    """
+    if name.endswith(".gz"):
+        with gzip.GzipFile(fileobj=stream) as raw:
+            yield io.TextIOWrapper(raw, encoding=INDEX_ENCODING)
+    elif name.endswith(".zip"):
+        with ExitStack() as stack:
+            # zipfile needs random access; spool non-seekable (network) streams to disk
+            if not stream.seekable():
+                spooled = stack.enter_context(tempfile.TemporaryFile())
+                shutil.copyfileobj(stream, spooled)
+                spooled.seek(0)
+                stream = spooled
+            archive = stack.enter_context(zipfile.ZipFile(stream))
+            members = [m for m in archive.namelist() if m.endswith(".idx")]
+            if not members:
+                raise ValueError(f"No .idx file in {name}")
+            raw = stack.enter_context(archive.open(members[0]))
+            yield io.TextIOWrapper(raw, encoding=INDEX_ENCODING)
+    else:
+        yield io.TextIOWrapper(stream, encoding=INDEX_ENCODING)
+
+
+class FullIndexSource:
+    """Source that streams filings from EDGAR quarterly full-index files."""
+
+    def __init__(
+        self,
+        kind: str = "master",
+        compression: str = "gz",
+        rate_limiter: Optional[RateLimiter] = None,
+        robots: Optional[RobotsCache] = None,
+    ):
+        """
+        Initialize source.
+
+        Args:
+            kind: Index flavor to download, "master" or "form"
+            compression: Download format: "idx" (plain), "gz" or "zip"
+            rate_limiter: Limiter for downloads
+            robots: robots.txt cache (defaults to an in-memory cache)
+        """
+        if kind not in INDEX_KINDS:
+            raise ValueError(f"Unknown index kind: {kind} (expected one of {INDEX_KINDS})")
+        self.kind = kind
+        self.compression = compression
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.robots = robots or RobotsCache(rate_limiter=self.rate_limiter)
+
+    def index_urls(self, years: Iterable[int], quarters: Iterable[int] = (1, 2, 3, 4)) -> List[str]:
+        """Build full-index URLs for the given years and quarters."""
+        quarters = list(quarters)
+        return [
+            f"{SEC_FULL_INDEX_URL}/{year}/QTR{quarter}/{self.kind}.{self.compression}"
+            for year in years
+            for quarter in quarters
+        ]
+
+    def iter_url(self, url: str) -> Iterator[Filing]:
+        """Stream filings from one index file on the network."""
+        if not self.robots.can_fetch(url):
+            logger.error(f"Blocked by robots.txt: {url}")
+            return
+
+        logger.info(f"Streaming index: {url}")
+        try:
+            response = make_request(url, self.rate_limiter, stream=True)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                logger.warning(f"Index not published (yet): {url}")
+                return
+            raise
+        response.raw.decode_content = True
+        with response, open_index(url, response.raw) as text:
+            yield from parse_index_lines(text)
+
+    def iter_path(self, path: Path) -> Iterator[Filing]:
+        """Stream filings from one local index file."""
+        logger.info(f"Reading index: {path}")
+        with open(path, "rb") as stream, open_index(path.name, stream) as text:
+            yield from parse_index_lines(text)
+
+    def iter_directory(self, directory: str) -> Iterator[Filing]:
+        """
+        Stream filings from every index file under a directory (e.g. a mirror).
+
+        Args:
+            directory: Directory searched recursively for .idx/.gz/.zip files
+
+        Yields:
+            Filing objects
+        """
+        paths = sorted(
+            p for p in Path(directory).rglob("*") if p.is_file() and p.suffix in INDEX_SUFFIXES
+        )
+        if not paths:
+            logger.warning(f"No index files found in {directory}")
+        for path in paths:
+            yield from self.iter_path(path)
+
+    def iter_filings(
+        self, years: Iterable[int], quarters: Iterable[int] = (1, 2, 3, 4)
+    ) -> Iterator[Filing]:
+        """Stream filings from the network for the given years and quarters."""
+        for url in self.index_urls(years, quarters):
+            yield from self.iter_url(url)
@@ -0,0 +1,179 @@
+"""Per-company filing history from EDGAR submissions JSON (data.sec.gov or submissions.zip)."""
+
+import json
+import logging
+import zipfile
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional
+
+from hootscrapper.config import SEC_ARCHIVES_URL, SEC_SUBMISSIONS_URL
+from hootscrapper.models import Filing
+from hootscrapper.robots import RobotsCache
+from hootscrapper.utils import RateLimiter, make_request
+
+if TYPE_CHECKING:
+    from hootscrapper.cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+def submissions_name(cik: str) -> str:
+    """File name of a company's submissions document, e.g. ``CIK0000320193.json``."""
+    return f"CIK{int(cik):010d}.json"
+
+
+def parse_columns(
+    columns: dict,
+    cik: str,
+    company_name: str,
+    scraped_at: Optional[str] = None,
+    since: Optional[str] = None,
+) -> Iterator[Filing]:
+    """
+    Turn one columnar filings block into filings.
+
+    Submissions documents store filings column-wise (``accessionNumber``,
+    ``filingDate``, ``form``, ... as parallel arrays), so rows are built by
+    zipping the columns without any HTML or per-row JSON parsing.
+
+    Args:
+        columns: ``filings.recent`` of a submissions document, or a paged history file
+        cik: Company CIK
+        company_name: Company name
+        scraped_at: Timestamp to stamp on each filing (defaults to now)
+        since: Skip filings dated before this ISO date
+
+    Yields:
+        Filing objects
+    """
+    scraped_at = scraped_at or datetime.utcnow().isoformat()
+    accessions = columns.get("accessionNumber") or []
+    documents = columns.get("primaryDocument") or [""] * len(accessions)
+    base = f"{SEC_ARCHIVES_URL}/edgar/data/{cik}"
+
+    for accession, filing_date, form, document in zip(
+        accessions, columns.get("filingDate") or [], columns.get("form") or [], documents
+    ):
+        if since and filing_date < since:
+            continue
+        if document:
+            url = f"{base}/{accession.replace('-', '')}/{document}"
+        else:
+            url = f"{base}/{accession}.txt"
+        yield Filing(
+            cik=cik,
+            company_name=company_name,
+            filing_type=form,
+            filing_date=filing_date,
+            accession_number=accession,
+            document_url=url,
+            scraped_at=scraped_at,
+        )
+
+
+def latest_filing_date(document: dict) -> Optional[str]:
+    """Most recent filing date in a submissions document (None if it lists no filings)."""
+    dates = document.get("filings", {}).get("recent", {}).get("filingDate") or []
+    return max(dates, default=None)
+
+
+class SubmissionsSource:
+    """Source that reads complete per-company filing histories from submissions JSON."""
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        robots: Optional[RobotsCache] = None,
+        cache: Optional["ResponseCache"] = None,
+        history: bool = False,
+    ):
+        """
+        Initialize source.
+
+        Args:
+            rate_limiter: Limiter for data.sec.gov requests
+            robots: robots.txt cache (defaults to an in-memory cache)
+            cache: Optional response cache for conditional GETs
+            history: Also read the paged files holding filings beyond the
+                ~1000 most recent (one extra request per file over the network)
+        """
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.robots = robots or RobotsCache(rate_limiter=self.rate_limiter)
+        self.cache = cache
+        self.history = history
+
+    def _get_json(self, name: str) -> dict:
+        url = f"{SEC_SUBMISSIONS_URL}/{name}"
+        if not self.robots.can_fetch(url):
+            raise PermissionError(f"Blocked by robots.txt: {url}")
+        return json.loads(make_request(url, self.rate_limiter, cache=self.cache).content)
+
+    def fetch(self, cik: str) -> dict:
+        """Download one company's submissions document."""
+        return self._get_json(submissions_name(cik))
+
+    def iter_document(
+        self,
+        document: dict,
+        since: Optional[str] = None,
+        load_file: Optional[Callable[[str], dict]] = None,
+    ) -> Iterator[Filing]:
+        """
+        Stream the filings of a submissions document.
+
+        Args:
+            document: Parsed submissions document
+            since: Skip filings (and history files) dated before this ISO date
+            load_file: Reads a history file by name (defaults to data.sec.gov);
+                only used when the source was created with ``history=True``
+
+        Yields:
+            Filing objects, recent filings first
+        """
+        cik = str(document.get("cik", "")).lstrip("0")
+        name = document.get("name", "")
+        scraped_at = datetime.utcnow().isoformat()
+        filings = document.get("filings", {})
+
+        yield from parse_columns(filings.get("recent", {}), cik, name, scraped_at, since)
+        if not self.history:
+            return
+        load_file = load_file or self._get_json
+        for page in filings.get("files", []):
+            if since and page.get("filingTo", "") < since:
+                continue
+            yield from parse_columns(load_file(page["name"]), cik, name, scraped_at, since)
+
+    def iter_cik(self, cik: str, since: Optional[str] = None) -> Iterator[Filing]:
+        """Stream one company's filings from data.sec.gov."""
+        yield from self.iter_document(self.fetch(cik), since)
+
+    def iter_zip(self, path: str, ciks: Optional[Iterable[str]] = None) -> Iterator[Filing]:
+        """
+        Stream filings from a local copy of the bulk ``submissions.zip``.
+
+        Args:
+            path: Path to submissions.zip
+            ciks: Only read these companies (default: every company in the archive)
+
+        Yields:
+            Filing objects
+        """
+        with zipfile.ZipFile(path) as archive:
+            if ciks is None:
+                names = [n for n in archive.namelist() if "-submissions-" not in n]
+            else:
+                names = [submissions_name(cik) for cik in ciks]
+            logger.info(f"Reading {len(names)} submissions documents from {path}")
+
+            def load_file(name: str) -> dict:
+                with archive.open(name) as member:
+                    return json.load(member)
+
+            for name in names:
+                try:
+                    document = load_file(name)
+                except KeyError:
+                    logger.warning(f"{name} not in {path}")
+                    continue
+                yield from self.iter_document(document, load_file=load_file)
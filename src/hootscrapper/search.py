@@ -0,0 +1,144 @@
+"""Ranked full-text search over company names and filing types."""
+
+import difflib
+import logging
+import re
+import sqlite3
+from dataclasses import dataclass
+from typing import List, Optional
+
+from hootscrapper.storage import FilingStorage
+
+logger = logging.getLogger(__name__)
+
+TERM_RE = re.compile(r"\w+")
+
+# Company names weigh more than form types in the ranking
+BM25_WEIGHTS = (10.0, 1.0)
+
+# Fuzzy matching: vocabulary terms considered per word, and how close they must be
+FUZZY_CANDIDATES = 5_000
+FUZZY_MATCHES = 5
+FUZZY_CUTOFF = 0.75
+
+
+@dataclass
+class SearchPage:
+    """One page of ranked search results."""
+
+    query: str
+    match: str
+    page: int
+    page_size: int
+    results: List[dict]
+    has_more: bool
+
+
+def _quote(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def fuzzy_terms(conn: sqlite3.Connection, term: str) -> List[str]:
+    """
+    Find indexed terms close to a (possibly misspelled) word.
+
+    Candidates come from the FTS vocabulary, restricted to terms sharing the
+    word's first letter (a range scan), and are ranked by edit similarity.
+
+    Args:
+        conn: Connection to a database with the search index
+        term: Lowercased word
+
+    Returns:
+        Up to ``FUZZY_MATCHES`` indexed terms, closest first
+    """
+    rows = conn.execute(
+        "SELECT term FROM filings_fts_vocab WHERE term >= ? AND term < ? "
+        "ORDER BY doc DESC LIMIT ?",
+        (term[0], term[0] + "\uffff", FUZZY_CANDIDATES),
+    ).fetchall()
+    candidates = [row[0] for row in rows]
+    return difflib.get_close_matches(term, candidates, n=FUZZY_MATCHES, cutoff=FUZZY_CUTOFF)
+
+
+def match_expression(
+    text: str, prefix: bool = True, conn: Optional[sqlite3.Connection] = None
+) -> str:
+    """
+    Build an FTS5 MATCH expression from free text.
+
+    Every word must match. With ``prefix`` a word also matches longer terms
+    ("micro" finds "microsoft"); with ``conn`` each word may instead match
+    close spellings from the index vocabulary (fuzzy matching).
+
+    Args:
+        text: User query
+        prefix: Treat each word as a prefix
+        conn: Connection used to expand words fuzzily (None to disable)
+
+    Returns:
+        MATCH expression (empty if the text has no words)
+    """
+    groups = []
+    for word in TERM_RE.findall(text.lower()):
+        alternatives = [_quote(word) + ("*" if prefix else "")]
+        if conn is not None and len(word) >= 3:
+            alternatives += [_quote(t) for t in fuzzy_terms(conn, word) if t != word]
+        groups.append(
+            alternatives[0] if len(alternatives) == 1 else f"({' OR '.join(alternatives)})"
+        )
+    return " AND ".join(groups)
+
+
+def search(
+    storage: FilingStorage,
+    query: str,
+    page: int = 1,
+    page_size: int = 20,
+    fuzzy: bool = False,
+    prefix: bool = True,
+    filing_type: Optional[str] = None,
+) -> SearchPage:
+    """
+    Search filings by company name and filing type, best matches first.
+
+    Results are ranked with BM25 (company name weighted above filing type,
+    then newest first). Only the requested page is read from ``filings``.
+
+    Args:
+        storage: Storage to search
+        query: Free-text query, e.g. "apple inc" or "tesla 10-k"
+        page: 1-based page number
+        page_size: Results per page
+        fuzzy: Also match close spellings of each word
+        prefix: Treat each word as a prefix
+        filing_type: Only return filings of this exact type
+
+    Returns:
+        SearchPage with the results and whether more pages exist
+    """
+    conn = storage.conn
+    match = match_expression(query, prefix=prefix, conn=conn if fuzzy else None)
+    if not match:
+        return SearchPage(query, match, page, page_size, [], False)
+
+    sql = f"""
+        SELECT f.id, f.cik, f.company_name, f.filing_type, f.filing_date,
+               f.accession_number, f.document_url,
+               bm25(filings_fts, {BM25_WEIGHTS[0]}, {BM25_WEIGHTS[1]}) AS rank
+        FROM filings_fts
+        JOIN filings f ON f.id = filings_fts.rowid
+        WHERE filings_fts MATCH ?
+    """
+    params: list = [match]
+    if filing_type:
+        sql += " AND f.filing_type = ?"
+        params.append(filing_type)
+    sql += " ORDER BY rank, f.filing_date DESC LIMIT ? OFFSET ?"
+    params += [page_size + 1, (max(page, 1) - 1) * page_size]
+
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    rows = [dict(row) for row in cursor.execute(sql, params)]
+    logger.debug(f"Search {match!r} page {page}: {len(rows[:page_size])} results")
+    return SearchPage(query, match, page, page_size, rows[:page_size], len(rows) > page_size)
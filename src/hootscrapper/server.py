@@ -0,0 +1,375 @@
+"""Read-only HTTP API over the filings database."""
+
+import hashlib
+import json
+import logging
+import queue
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import ParseResult, parse_qs, urlparse
+
+from hootscrapper import metrics
+from hootscrapper.config import (
+    SERVE_ACQUIRE_TIMEOUT,
+    SERVE_CACHE_ENTRIES,
+    SERVE_POOL_SIZE,
+    SERVE_STREAM_PAGE_SIZE,
+)
+from hootscrapper.search import search
+from hootscrapper.storage import FilingQuery, FilingStorage
+
+logger = logging.getLogger(__name__)
+
+NDJSON = "application/x-ndjson"
+JSON = "application/json"
+
+ENDPOINTS = ("/filings", "/summary", "/search", "/health")
+
+
+class StoragePool:
+    """Fixed set of read-only ``FilingStorage`` connections shared by request threads."""
+
+    def __init__(
+        self, db_path: str, size: int = SERVE_POOL_SIZE, timeout: float = SERVE_ACQUIRE_TIMEOUT
+    ):
+        """Open ``size`` read-only connections to an existing database."""
+        if not Path(db_path).exists():
+            raise FileNotFoundError(f"Database not found: {db_path}")
+        self.db_path = Path(db_path)
+        self.timeout = timeout
+        self._idle: "queue.Queue[FilingStorage]" = queue.Queue()
+        self._all = [FilingStorage(db_path, read_only=True) for _ in range(max(1, size))]
+        for storage in self._all:
+            self._idle.put(storage)
+
+    @contextmanager
+    def acquire(self) -> Iterator[FilingStorage]:
+        """
+        Borrow a connection, waiting up to ``timeout`` seconds if all are busy.
+
+        Raises:
+            TimeoutError: No connection was returned in time
+        """
+        try:
+            storage = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError("All database connections are busy") from None
+        try:
+            yield storage
+        finally:
+            self._idle.put(storage)
+
+    def generation(self) -> str:
+        """
+        Token that changes whenever the database is written.
+
+        Commits append to the WAL file and checkpoints rewrite the main file,
+        so their sizes and modification times identify the current contents
+        without a query.
+        """
+        parts = []
+        for path in (self.db_path, self.db_path.with_name(self.db_path.name + "-wal")):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        return "/".join(parts)
+
+    def close(self) -> None:
+        """Close every connection."""
+        for storage in self._all:
+            storage.close()
+
+
+class ResponseLRU:
+    """Thread-safe LRU cache of rendered response bodies."""
+
+    def __init__(self, max_entries: int = SERVE_CACHE_ENTRIES):
+        """Initialize an empty cache holding at most ``max_entries`` bodies."""
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a cached body and mark it as recently used."""
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: str, body: bytes) -> None:
+        """Store a body, evicting the least recently used entries beyond the bound."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _first(params: Dict[str, List[str]], name: str) -> Optional[str]:
+    values = params.get(name)
+    return values[0] if values else None
+
+
+def _int(params: Dict[str, List[str]], name: str, default: int) -> int:
+    value = _first(params, name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer") from None
+
+
+def _flag(params: Dict[str, List[str]], name: str) -> bool:
+    return (_first(params, name) or "").lower() in ("1", "true", "yes")
+
+
+def _filters(params: Dict[str, List[str]]) -> FilingQuery:
+    return FilingQuery(
+        cik=_first(params, "cik"),
+        filing_types=params.get("type"),
+        date_from=_first(params, "from"),
+        date_to=_first(params, "to"),
+        company=_first(params, "company"),
+    )
+
+
+class FilingServer(ThreadingHTTPServer):
+    """
+    HTTP server answering read queries from a pool of read-only connections.
+
+    Endpoints (all GET):
+        /filings   ?cik= &type= (repeatable) &from= &to= &company= &limit= &after=
+                   &format=json|ndjson. JSON returns one keyset page and its
+                   ``next_cursor``; NDJSON streams every matching row, a
+                   keyset page at a time.
+        /summary   ?days= &top=
+        /search    ?q= &page= &page_size= &fuzzy=1 &exact=1 &type=
+        /health
+        /metrics   Prometheus text format (only when metrics are enabled)
+
+    Every response but ``/health`` carries an ETag derived from the database
+    generation and the request, so clients can revalidate with
+    ``If-None-Match``. Rendered JSON bodies are kept in an LRU cache keyed the same way, so repeated hot
+    queries skip SQLite until the next write. A request that waits too long
+    for a pooled connection gets 503.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        db_path: str,
+        pool_size: int = SERVE_POOL_SIZE,
+        cache_entries: int = SERVE_CACHE_ENTRIES,
+    ):
+        """Bind the server and open the connection pool."""
+        self.pool = StoragePool(db_path, pool_size)
+        self.cache = ResponseLRU(cache_entries)
+        super().__init__(address, _Handler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.close()
+
+    def render(self, path: str, params: Dict[str, List[str]]) -> Optional[object]:
+        """Build the JSON document for an endpoint (None if the path is unknown)."""
+        if path == "/health":
+            return {"status": "ok", "cache": {"hits": self.cache.hits, "misses": self.cache.misses}}
+
+        with self.pool.acquire() as storage:
+            if path == "/filings":
+                limit = min(_int(params, "limit", 100), 10_000)
+                rows, next_cursor = storage.query_page(
+                    _filters(params), after=_first(params, "after"), page_size=limit
+                )
+                return {"filings": [dict(row) for row in rows], "next_cursor": next_cursor}
+
+            if path == "/summary":
+                days = _first(params, "days")
+                return storage.get_summary(
+                    days=int(days) if days else None, top=_int(params, "top", 10)
+                )
+
+            if path == "/search":
+                page = search(
+                    storage,
+                    _first(params, "q") or "",
+                    page=_int(params, "page", 1),
+                    page_size=min(_int(params, "page_size", 20), 1_000),
+                    fuzzy=_flag(params, "fuzzy"),
+                    prefix=not _flag(params, "exact"),
+                    filing_type=_first(params, "type"),
+                )
+                return {
+                    "query": page.query,
+                    "page": page.page,
+                    "results": page.results,
+                    "has_more": page.has_more,
+                }
+        return None
+
+    def stream_filings(self, params: Dict[str, List[str]]) -> Iterator[bytes]:
+        """
+        Stream every matching filing as JSON lines.
+
+        Rows are read in keyset pages of ``SERVE_STREAM_PAGE_SIZE``, borrowing a
+        pooled connection only while each page is read, so a slow client never
+        holds one. ``limit`` and ``after`` are checked and the first page is read
+        before the stream is handed out, so bad parameters raise ``ValueError``
+        while an error status can still be sent.
+        """
+        filters = _filters(params)
+        limit = _int(params, "limit", 0) if _first(params, "limit") else None
+
+        def read(after: Optional[str], remaining: Optional[int]) -> Tuple[list, Optional[str]]:
+            size = SERVE_STREAM_PAGE_SIZE
+            if remaining is not None:
+                size = min(max(remaining, 0), size)
+            with self.pool.acquire() as storage:
+                return storage.query_page(filters, after=after, page_size=size)
+
+        def lines(rows: list, after: Optional[str], remaining: Optional[int]) -> Iterator[bytes]:
+            while True:
+                for row in rows:
+                    yield json.dumps(dict(row)).encode() + b"\n"
+                if remaining is not None:
+                    remaining -= len(rows)
+                if after is None or (remaining is not None and remaining <= 0):
+                    return
+                rows, after = read(after, remaining)
+
+        return lines(*read(_first(params, "after"), limit), limit)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: FilingServer
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path == "/metrics" and metrics.is_enabled():
+            self._metrics()
+            return
+        with metrics.timer(
+            "hoot_api_request_seconds", path=url.path if url.path in ENDPOINTS else "other"
+        ):
+            self._respond(url)
+
+    def _respond(self, url: ParseResult) -> None:
+        params = parse_qs(url.query)
+        streaming = url.path == "/filings" and _first(params, "format") == "ndjson"
+
+        generation = self.server.pool.generation()
+        key = f"{generation}|{url.path}|{sorted(params.items())}"
+        etag = f'"{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+        if url.path == "/health":
+            # Health reports live state, so it is never revalidated
+            etag = None
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        try:
+            if streaming:
+                self._stream(params, etag)
+                return
+
+            body = self.server.cache.get(key)
+            if body is None:
+                document = self.server.render(url.path, params)
+                if document is None:
+                    self._error(HTTPStatus.NOT_FOUND, f"Unknown endpoint: {url.path}")
+                    return
+                body = json.dumps(document).encode()
+                if url.path != "/health":
+                    self.server.cache.put(key, body)
+        except ValueError as e:
+            self._error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        except TimeoutError as e:
+            self._error(HTTPStatus.SERVICE_UNAVAILABLE, str(e))
+            return
+        except Exception as e:
+            logger.exception(f"Request failed: {self.path}")
+            self._error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", JSON)
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, params: Dict[str, List[str]], etag: str) -> None:
+        """Stream NDJSON rows as they are read (the response ends when the connection closes)."""
+        lines = self.server.stream_filings(params)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", NDJSON)
+        self.send_header("ETag", etag)
+        self.send_header("Connection", "close")
+        self.end_headers()
+        try:
+            for line in lines:
+                self.wfile.write(line)
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Client went away during NDJSON stream")
+        except Exception:
+            # Headers are out: cut the stream short rather than append an error body
+            logger.exception(f"NDJSON stream failed: {self.path}")
+
+    def _metrics(self) -> None:
+        body = metrics.REGISTRY.to_prometheus().encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", metrics.PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: HTTPStatus, message: str) -> None:
+        body = json.dumps({"error": message}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", JSON)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(
+    db_path: str,
+    host: str,
+    port: int,
+    pool_size: int = SERVE_POOL_SIZE,
+    cache_entries: int = SERVE_CACHE_ENTRIES,
+) -> None:
+    """Run the read API until interrupted."""
+    server = FilingServer((host, port), db_path, pool_size, cache_entries)
+    logger.info(f"Serving {db_path} on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down")
+    finally:
+        server.server_close()
@@ -0,0 +1,790 @@
+"""
+Time-partitioned storage: one SQLite database per filing_date year or quarter.
+
+A shard directory holds a ``filings-<key>.sqlite`` file per period, keyed
+"2024" or "2024Q3" (filings without a valid date go to the "undated" shard),
+and a small catalog with the shard list, scrape cursors and per-shard export
+watermarks. ``ShardedStorage`` offers the parts of the ``FilingStorage``
+interface used by scrapes, exports, summaries and queries:
+
+- Writes are routed by filing_date, so a daily scrape only touches the hot
+  shard (the current period's) and the catalog.
+- Reads are routed to the shards that can hold matching rows and merged in
+  Python, one shard at a time: last week's summary opens one file, not
+  decades of history. (ATTACH would cap a directory at SQLite's default of
+  10 attached databases.)
+- Each shard numbers new rows from its own base (``shard_id_base``), so ids
+  stay unique across the directory and keyset cursors work unchanged.
+- ``maintain`` compacts shards whose period is over and marks them
+  read-only; they are opened with ``mode=ro`` from then on, until a late
+  write reopens one.
+"""
+
+import logging
+import re
+import sqlite3
+import stat
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from itertools import chain, islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from hootscrapper import compact
+from hootscrapper.config import (
+    EXPORT_BATCH_SIZE,
+    INSERT_BATCH_SIZE,
+    SHARD_CATALOG_NAME,
+    SHARD_CLOSE_AFTER_DAYS,
+    SHARD_PERIOD,
+    SHARD_PERIODS,
+    SQLITE_PROFILE,
+    SQLITE_SCHEMA,
+    SQLITE_SCHEMAS,
+)
+from hootscrapper.models import Filing
+from hootscrapper.storage import (
+    GET_CURSOR_SQL,
+    SCRAPE_CURSORS_TABLE,
+    SET_CURSOR_SQL,
+    FilingQuery,
+    FilingStorage,
+    InsertResult,
+    cursor_token,
+    export_watermark,
+    parse_cursor_token,
+    summary_since,
+    write_csv,
+)
+
+logger = logging.getLogger(__name__)
+
+UNDATED = "undated"
+
+# New rows of a shard get ids above its base; lower ids are left to rows
+# imported from a single-file database, which keep theirs
+SHARD_ID_SPAN = 10**10
+
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-[0-9]{2}")
+
+_CATALOG_TABLES = (
+    """
+    CREATE TABLE IF NOT EXISTS settings (
+        name TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS shards (
+        key TEXT PRIMARY KEY,
+        created_at TEXT NOT NULL,
+        closed_at TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS export_watermarks (
+        name TEXT NOT NULL,
+        shard TEXT NOT NULL,
+        last_id INTEGER NOT NULL,
+        exported_at TEXT NOT NULL,
+        PRIMARY KEY (name, shard)
+    )
+    """,
+    SCRAPE_CURSORS_TABLE,
+)
+
+_SET_WATERMARK_SQL = """
+    INSERT INTO export_watermarks (name, shard, last_id, exported_at)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(name, shard) DO UPDATE SET
+        last_id = MAX(last_id, excluded.last_id),
+        exported_at = excluded.exported_at
+"""
+
+_IMPORT_COLUMNS = (
+    "id",
+    "cik",
+    "company_name",
+    "filing_type",
+    "filing_date",
+    "accession_number",
+    "document_url",
+    "scraped_at",
+    "created_at",
+)
+
+_IMPORT_SQL = f"""
+    INSERT OR IGNORE INTO filings ({", ".join(_IMPORT_COLUMNS)})
+    VALUES ({", ".join("?" * len(_IMPORT_COLUMNS))})
+"""
+
+
+def shard_key(filing_date: str, period: str) -> str:
+    """Key of the shard for a filing date: "2024", "2024Q3" or "undated"."""
+    match = _DATE_RE.fullmatch(filing_date or "")
+    if not match or not 1 <= int(match.group(2)) <= 12:
+        return UNDATED
+    year, month = match.group(1), int(match.group(2))
+    if period == "year":
+        return year
+    return f"{year}Q{(month - 1) // 3 + 1}"
+
+
+def shard_dates(key: str) -> Optional[Tuple[str, str]]:
+    """First and last date of a shard's period (None for the undated shard)."""
+    if key == UNDATED:
+        return None
+    year = int(key[:4])
+    if len(key) == 4:
+        return f"{year}-01-01", f"{year}-12-31"
+    quarter = int(key[5])
+    first = date(year, 3 * quarter - 2, 1)
+    last = date(year + quarter // 4, 3 * quarter % 12 + 1, 1) - timedelta(days=1)
+    return first.isoformat(), last.isoformat()
+
+
+def shard_id_base(key: str) -> int:
+    """Ids of a shard's new rows start above this (2024 -> 20240e10, 2024Q3 -> 20243e10)."""
+    if key == UNDATED:
+        return SHARD_ID_SPAN
+    quarter = int(key[5]) if len(key) > 4 else 0
+    return (int(key[:4]) * 10 + quarter) * SHARD_ID_SPAN
+
+
+def _sort_key(key: str) -> Tuple[bool, str]:
+    """Order shards by period, with the undated shard before (i.e. older than) all others."""
+    return key != UNDATED, key
+
+
+def _accession_years(accession: str) -> Optional[Tuple[str, str]]:
+    """Years a filing can be dated, from its accession number's year (None if unknown)."""
+    match = compact.ACCESSION_RE.fullmatch(accession)
+    if not match:
+        return None
+    yy = int(match.group(2))
+    year = (1900 if yy >= 90 else 2000) + yy
+    # Filings accepted late on the last business day are dated the next one
+    return str(year), str(year + 1)
+
+
+def is_shard_directory(path: str) -> bool:
+    """Whether ``path`` is a shard directory (created by ``hoot shards init``)."""
+    return (Path(path) / SHARD_CATALOG_NAME).is_file()
+
+
+def open_storage(path: str, **kwargs) -> Union[FilingStorage, "ShardedStorage"]:
+    """Open a database file with ``FilingStorage``, or a shard directory with ``ShardedStorage``."""
+    if is_shard_directory(path):
+        return ShardedStorage(path, **kwargs)
+    return FilingStorage(path, **kwargs)
+
+
+def state_db_path(path: str) -> str:
+    """SQLite file for state kept next to the filings (robots.txt cache), e.g. the catalog."""
+    if is_shard_directory(path):
+        return str(Path(path) / SHARD_CATALOG_NAME)
+    return path
+
+
+class ShardedStorage:
+    """
+    Filings stored in one SQLite database per filing_date period.
+
+    Shards are opened lazily, each as a ``FilingStorage`` with the same pragma
+    profile, and kept open until ``close()``. Closed shards (see ``maintain``)
+    are opened read-only. With ``read_only=True`` every shard is.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        period: Optional[str] = None,
+        read_only: bool = False,
+        profile: str = SQLITE_PROFILE,
+        pragmas: Optional[dict] = None,
+        schema: str = SQLITE_SCHEMA,
+    ):
+        """
+        Open a shard directory, creating it unless ``read_only``.
+
+        Args:
+            path: Shard directory
+            period: "year" or "quarter" for a new directory (default:
+                ``SHARD_PERIOD``); existing directories keep theirs
+            read_only: Open the catalog and every shard without write access
+            profile: Name of the pragma profile in ``SQLITE_PROFILES``
+            pragmas: Extra pragmas overriding the profile
+            schema: Table layout of new shards ("wide" or "compact")
+        """
+        if period is not None and period not in SHARD_PERIODS:
+            raise ValueError(f"Unknown shard period: {period} ({', '.join(SHARD_PERIODS)})")
+        if schema not in SQLITE_SCHEMAS:
+            raise ValueError(f"Unknown schema: {schema} ({', '.join(SQLITE_SCHEMAS)})")
+        self.db_path = Path(path)
+        self.read_only = read_only
+        self._options = {"profile": profile, "pragmas": pragmas}
+        self._catalog: Optional[sqlite3.Connection] = None
+        self._shards: Dict[str, FilingStorage] = {}
+
+        if read_only:
+            if not is_shard_directory(path):
+                raise FileNotFoundError(f"Not a shard directory: {path}")
+        else:
+            self.db_path.mkdir(parents=True, exist_ok=True)
+            with self.catalog as conn:
+                for sql in _CATALOG_TABLES:
+                    conn.execute(sql)
+                conn.executemany(
+                    "INSERT OR IGNORE INTO settings (name, value) VALUES (?, ?)",
+                    [("period", period or SHARD_PERIOD), ("schema", schema)],
+                )
+
+        settings = dict(self.catalog.execute("SELECT name, value FROM settings"))
+        self.period = settings["period"]
+        self.schema = settings["schema"]
+        if period is not None and period != self.period:
+            raise ValueError(f"{path} is sharded by {self.period}, not {period}")
+
+    @property
+    def catalog(self) -> sqlite3.Connection:
+        """Connection to the shard catalog, opened on first use."""
+        if self._catalog is None:
+            path = self.db_path / SHARD_CATALOG_NAME
+            if self.read_only:
+                uri = f"{path.resolve().as_uri()}?mode=ro"
+                self._catalog = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            else:
+                self._catalog = sqlite3.connect(path, check_same_thread=False)
+            self._catalog.execute("PRAGMA busy_timeout = 5000")
+        return self._catalog
+
+    def close(self) -> None:
+        """Close the catalog and every open shard (they are reopened on next use)."""
+        for storage in self._shards.values():
+            storage.close()
+        self._shards.clear()
+        if self._catalog is not None:
+            self._catalog.close()
+            self._catalog = None
+
+    def __enter__(self) -> "ShardedStorage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def shard_path(self, key: str) -> Path:
+        """Database file of a shard."""
+        return self.db_path / f"filings-{key}.sqlite"
+
+    def hot_key(self, today: Optional[date] = None) -> str:
+        """Key of the shard receiving today's filings."""
+        return shard_key((today or datetime.utcnow().date()).isoformat(), self.period)
+
+    def _keys(self) -> List[str]:
+        """Keys of all shards, newest period first (the undated shard last)."""
+        keys = [row[0] for row in self.catalog.execute("SELECT key FROM shards")]
+        return sorted(keys, key=_sort_key, reverse=True)
+
+    def _keys_between(
+        self, date_from: Optional[str] = None, date_to: Optional[str] = None
+    ) -> List[str]:
+        """Keys of the shards that can hold filings dated in a range, newest first."""
+        if date_from is None and date_to is None:
+            return self._keys()
+        keys = []
+        for key in self._keys():
+            dates = shard_dates(key)
+            # Filings without a valid date never fall in a date range
+            if dates is not None and dates[1] >= (date_from or "") and dates[0] <= (date_to or "~"):
+                keys.append(key)
+        return keys
+
+    def _closed(self) -> Set[str]:
+        return {
+            row[0]
+            for row in self.catalog.execute("SELECT key FROM shards WHERE closed_at IS NOT NULL")
+        }
+
+    def _reader(self, key: str) -> FilingStorage:
+        """Open a shard for reading (read-only if it is closed)."""
+        if key not in self._shards:
+            self._shards[key] = FilingStorage(
+                str(self.shard_path(key)),
+                read_only=self.read_only or key in self._closed(),
+                schema=self.schema,
+                **self._options,
+            )
+        return self._shards[key]
+
+    def _writer(self, key: str) -> FilingStorage:
+        """Open a shard for writing, creating it or reopening a closed one."""
+        if self.read_only:
+            raise ValueError(f"{self.db_path} is open read-only")
+        storage = self._shards.get(key)
+        if storage is not None and not storage.read_only:
+            return storage
+
+        path = self.shard_path(key)
+        row = self.catalog.execute("SELECT closed_at FROM shards WHERE key = ?", (key,)).fetchone()
+        if row is not None and row[0] is not None:
+            logger.warning(f"Reopening closed shard {key} for writing")
+            path.chmod(path.stat().st_mode | stat.S_IWUSR)
+            with self.catalog as conn:
+                conn.execute("UPDATE shards SET closed_at = NULL WHERE key = ?", (key,))
+        if storage is not None:
+            storage.close()
+
+        storage = FilingStorage(str(path), schema=self.schema, **self._options)
+        if row is None:
+            table = compact.ROWS_TABLE if storage.compact else "filings"
+            with storage.conn as conn:
+                conn.execute(
+                    "INSERT INTO sqlite_sequence (name, seq) SELECT ?, ? "
+                    "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = ?)",
+                    (table, shard_id_base(key), table),
+                )
+            with self.catalog as conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO shards (key, created_at) VALUES (?, CURRENT_TIMESTAMP)",
+                    (key,),
+                )
+            logger.info(f"Created shard {key}: {path}")
+        self._shards[key] = storage
+        return storage
+
+    def insert_filings(self, filings: Iterable[Filing]) -> int:
+        """Insert filings; returns the number inserted (see ``bulk_insert``)."""
+        return self.bulk_insert(filings).inserted
+
+    def bulk_insert(
+        self,
+        filings: Iterable[Filing],
+        batch_size: int = INSERT_BATCH_SIZE,
+        upsert: bool = False,
+    ) -> InsertResult:
+        """
+        Insert filings in chunks, each routed to the shards of its filing dates.
+
+        Same contract as ``FilingStorage.bulk_insert``, with one transaction per
+        shard per chunk. A filing always lands in the shard of its date, so
+        duplicates are caught there.
+
+        Args:
+            filings: Iterable of Filing objects
+            batch_size: Rows per chunk
+            upsert: Update existing rows instead of skipping them
+
+        Returns:
+            InsertResult with exact inserted/skipped/updated counts
+        """
+        result = InsertResult()
+        filings = iter(filings)
+        while chunk := list(islice(filings, batch_size)):
+            routed = defaultdict(list)
+            for filing in chunk:
+                routed[shard_key(filing.filing_date, self.period)].append(filing)
+            for key, shard_filings in routed.items():
+                result.add(self._writer(key).insert_batch(shard_filings, upsert=upsert))
+
+        if upsert:
+            logger.info(f"Inserted {result.inserted} new filings, updated {result.updated}")
+        else:
+            logger.info(
+                f"Inserted {result.inserted} new filings (skipped {result.skipped} duplicates)"
+            )
+        return result
+
+    def existing_accessions(self, accession_numbers: Iterable[str]) -> Set[str]:
+        """
+        Return which of the given accession numbers are already stored.
+
+        Only shards of the years an accession number allows are searched (see
+        ``_accession_years``), so checking a feed page doesn't open old shards.
+        A filing with a surprising date is still never stored twice, since
+        inserts dedupe within its shard.
+
+        Args:
+            accession_numbers: Accession numbers to look up
+
+        Returns:
+            Set of accession numbers present in any shard
+        """
+        keys = self._keys()
+        routed = defaultdict(list)
+        for accession in dict.fromkeys(accession_numbers):
+            years = _accession_years(accession)
+            for key in keys:
+                if years is None or key == UNDATED or key[:4] in years:
+                    routed[key].append(accession)
+
+        found: Set[str] = set()
+        for key, accessions in routed.items():
+            found |= self._reader(key).existing_accessions(accessions)
+        return found
+
+    def query(
+        self,
+        filters: Optional[FilingQuery] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[sqlite3.Row]:
+        """
+        Stream filings matching ``filters``, newest ``filing_date`` first.
+
+        Shards are read one after another, newest period first, skipping those
+        outside the date range; each is read with ``FilingStorage.query``. A
+        cursor resumes in the shard of its filing date.
+
+        Args:
+            filters: Filters to apply (default: all filings)
+            after: Cursor from ``cursor_token`` of the last row already seen
+            limit: Maximum number of rows to yield
+            batch_size: Rows fetched per query
+
+        Yields:
+            sqlite3.Row objects
+        """
+        filters = filters or FilingQuery()
+        start = shard_key(parse_cursor_token(after)[0], self.period) if after else None
+        remaining = limit
+
+        for key in self._keys_between(filters.date_from, filters.date_to):
+            if start is not None and _sort_key(key) > _sort_key(start):
+                continue
+            if remaining is not None and remaining <= 0:
+                return
+            rows = self._reader(key).query(
+                filters,
+                after=after if key == start else None,
+                limit=remaining,
+                batch_size=batch_size,
+            )
+            for row in rows:
+                yield row
+                if remaining is not None:
+                    remaining -= 1
+
+    def query_page(
+        self,
+        filters: Optional[FilingQuery] = None,
+        after: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Tuple[List[sqlite3.Row], Optional[str]]:
+        """
+        Fetch one page of ``query`` results.
+
+        Returns:
+            ``(rows, next_cursor)``; ``next_cursor`` is None on the last page
+        """
+        rows = list(self.query(filters, after=after, limit=page_size + 1, batch_size=page_size + 1))
+        if len(rows) > page_size:
+            return rows[:page_size], cursor_token(rows[page_size - 1])
+        return rows, None
+
+    def get_all_filings(self) -> List[dict]:
+        """Get all filings from every shard, newest filing_date first."""
+        return list(
+            chain.from_iterable(self._reader(key).get_all_filings() for key in self._keys())
+        )
+
+    def get_cursor(self, source: str) -> Optional[Tuple[str, str]]:
+        """Get a source's high-water mark (see ``FilingStorage.get_cursor``)."""
+        return self.catalog.execute(GET_CURSOR_SQL, (source,)).fetchone()
+
+    def set_cursor(self, source: str, accession_number: str, filing_date: str) -> None:
+        """Advance a source's high-water mark (an older filing never moves it back)."""
+        with self.catalog as conn:
+            conn.execute(SET_CURSOR_SQL, (source, accession_number, filing_date))
+
+    def get_watermark(self, name: str, key: str) -> int:
+        """Get the last id a shard exported under a watermark (0 if never exported)."""
+        row = self.catalog.execute(
+            "SELECT last_id FROM export_watermarks WHERE name = ? AND shard = ?", (name, key)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def export_batches(
+        self, since: Optional[str], watermark: Optional[str], batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Tuple[Iterator[List[sqlite3.Row]], Callable[[], None]]:
+        """
+        Stream the rows of an export from every shard, newest period first.
+
+        Watermarks are kept per shard in the catalog, so closed shards are
+        never written to, and a late filing added to an old shard is still
+        picked up by ``since="last"``.
+
+        Args:
+            since: None, "last" or an ISO timestamp (see ``FilingStorage.export_filter``)
+            watermark: Name of the export watermark, or None to leave watermarks alone
+            batch_size: Rows per batch
+
+        Returns:
+            ``(batches, commit)`` as from ``FilingStorage.export_batches``
+
+        Raises:
+            ValueError: ``since="last"`` without a watermark
+        """
+        if since == "last" and watermark is None:
+            raise ValueError("since='last' needs a watermark")
+        max_ids: Dict[str, int] = {}
+
+        def batches() -> Iterator[List[sqlite3.Row]]:
+            for key in self._keys():
+                if since == "last":
+                    kwargs = {"after_id": self.get_watermark(watermark, key)}
+                else:
+                    kwargs = {"created_after": since} if since else {}
+                for rows in self._reader(key).iter_batches(batch_size=batch_size, **kwargs):
+                    max_ids[key] = max(max_ids.get(key, 0), max(row["id"] for row in rows))
+                    yield rows
+
+        def commit() -> None:
+            if watermark is None:
+                return
+            with self.catalog as conn:
+                conn.executemany(
+                    _SET_WATERMARK_SQL,
+                    [(watermark, key, last_id) for key, last_id in max_ids.items()],
+                )
+
+        return batches(), commit
+
+    def export_to_csv(
+        self,
+        csv_path: str,
+        since: Optional[str] = None,
+        compression: Optional[str] = None,
+        watermark: Optional[str] = None,
+    ) -> int:
+        """
+        Export filings from every shard to one CSV file.
+
+        Same options as ``FilingStorage.export_to_csv``.
+
+        Returns:
+            Number of filings exported
+        """
+        batches, commit = self.export_batches(since, export_watermark(since, watermark, "csv"))
+        count = write_csv(csv_path, chain.from_iterable(batches), compression)
+        if count:
+            commit()
+        return count
+
+    def get_summary(self, days: Optional[int] = None, top: int = 10) -> dict:
+        """
+        Get summary statistics, merging every shard's counters.
+
+        Totals, filing types and day counts are small and merged in full, so
+        they are exact. All-time top companies are merged from the head of
+        each shard's company counters only (see ``_top_companies``). With
+        ``days`` only the shards overlapping the window are opened, and each
+        reports every company it counted in the window.
+
+        Args:
+            days: Only count filings dated today or in the ``days - 1`` days before
+            top: Number of filing types/companies to return
+
+        Returns:
+            Summary dict as from ``FilingStorage.get_summary``
+        """
+        keys = self._keys()
+        since = None
+        if days is not None:
+            since = summary_since(days)
+            keys = self._keys_between(date_from=since)
+        # All-time company counters are keyed by name, so they can be merged from their heads
+        bounded = days is None and top >= 0
+
+        total = 0
+        types, companies, by_day = Counter(), Counter(), Counter()
+        for key in keys:
+            summary = self._reader(key).get_summary(
+                days=days, top=-1, company_top=0 if bounded else -1
+            )
+            total += summary["total_filings"]
+            for filing_type, count in summary["top_filing_types"]:
+                types[filing_type] += count
+            for company, count in summary["top_companies"]:
+                companies[company] += count
+            for filing_date, count in summary.get("filings_by_day", ()):
+                by_day[filing_date] += count
+
+        result = {
+            "total_filings": total,
+            "top_filing_types": types.most_common(top),
+            "top_companies": (
+                self._top_companies(keys, top) if bounded else companies.most_common(top)
+            ),
+        }
+        if since is not None:
+            result["since"] = since
+            result["filings_by_day"] = sorted(by_day.items())
+        return result
+
+    def _top_companies(self, keys: List[str], top: int) -> List[Tuple[str, int]]:
+        """
+        Exact all-time top companies, reading only the head of each shard's counters.
+
+        Each shard reports its ``n`` largest company counters (``n`` starts at
+        ``top``), and the candidates' counts are completed with key lookups in
+        the shards whose head missed them. A company outside every head has at
+        most the sum of the heads' smallest counts; once the ``top``-th
+        candidate reaches that bound the ranking is final, otherwise ``n``
+        doubles.
+        """
+        n = top
+        while top > 0:
+            heads = {
+                key: dict(self._reader(key).get_summary(top=0, company_top=n)["top_companies"])
+                for key in keys
+            }
+            # A shard that returned fewer than n counters has no others
+            floors = {
+                key: min(head.values()) if len(head) == n else 0 for key, head in heads.items()
+            }
+            totals: Counter = Counter()
+            for head in heads.values():
+                totals.update(head)
+            for key, head in heads.items():
+                missing = [name for name in totals if name not in head]
+                if floors[key] and missing:
+                    totals.update(self._reader(key).company_counts(missing))
+
+            ranked = totals.most_common(top)
+            bound = sum(floors.values())
+            if not bound or (len(ranked) == top and ranked[-1][1] >= bound):
+                return ranked
+            n *= 2
+        return []
+
+    def rebuild_summary(self) -> None:
+        """Recompute the summary counters of every shard that isn't closed."""
+        closed = self._closed()
+        for key in self._keys():
+            if key not in closed:
+                self._writer(key).rebuild_summary()
+
+    def shards(self, today: Optional[date] = None) -> List[dict]:
+        """
+        Describe every shard, newest period first.
+
+        Returns:
+            Dicts with key, path, filings, bytes and state ("hot", "open" or "closed")
+        """
+        hot, closed = self.hot_key(today), self._closed()
+        described = []
+        for key in self._keys():
+            path = self.shard_path(key)
+            state = "closed" if key in closed else "hot" if key == hot else "open"
+            described.append(
+                {
+                    "key": key,
+                    "path": str(path),
+                    "filings": self._reader(key).get_summary(top=0)["total_filings"],
+                    "bytes": path.stat().st_size,
+                    "state": state,
+                }
+            )
+        return described
+
+    def maintain(
+        self, today: Optional[date] = None, close_after_days: int = SHARD_CLOSE_AFTER_DAYS
+    ) -> List[str]:
+        """
+        Compact the shards whose period is over and mark them read-only.
+
+        A shard closes ``close_after_days`` after its period ends, leaving time
+        for late filings: its query planner statistics are refreshed
+        (``ANALYZE``), the file is rewritten without free pages (``VACUUM``)
+        and switched to a rollback journal, so it can be read without creating
+        WAL files, and its file permissions drop write access. Shards still
+        receiving filings only get ``PRAGMA optimize``.
+
+        Args:
+            today: Reference date (default: today, UTC)
+            close_after_days: Grace period after a shard's period ends
+
+        Returns:
+            Keys of the shards closed
+        """
+        today = today or datetime.utcnow().date()
+        closed, newly_closed = self._closed(), []
+        for key in self._keys():
+            if key in closed:
+                continue
+            storage = self._writer(key)
+            dates = shard_dates(key)
+            if dates is None or date.fromisoformat(dates[1]) >= today - timedelta(
+                days=close_after_days
+            ):
+                storage.conn.execute("PRAGMA optimize")
+                continue
+
+            path = self.shard_path(key)
+            size_before = path.stat().st_size
+            storage.conn.execute("ANALYZE")
+            storage.conn.execute("VACUUM")
+            storage.conn.execute("PRAGMA journal_mode = DELETE")
+            storage.close()
+            del self._shards[key]
+            path.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            with self.catalog as conn:
+                conn.execute(
+                    "UPDATE shards SET closed_at = CURRENT_TIMESTAMP WHERE key = ?", (key,)
+                )
+            logger.info(
+                f"Closed shard {key}: {size_before / 1e6:.1f} MB -> "
+                f"{path.stat().st_size / 1e6:.1f} MB, read-only"
+            )
+            newly_closed.append(key)
+        return newly_closed
+
+    def import_database(self, source_path: str, batch_size: int = INSERT_BATCH_SIZE) -> int:
+        """
+        Copy a single-file database into the shards.
+
+        Rows keep their ids (all below ``SHARD_ID_SPAN``) and ``created_at``;
+        scrape cursors carry over, and every shard starts at the source's
+        export watermarks, so ``since="last"`` exports continue where they
+        were. Importing again skips rows already copied.
+
+        Args:
+            source_path: Database written by ``FilingStorage``
+            batch_size: Rows read per batch
+
+        Returns:
+            Number of rows copied
+        """
+        copied = 0
+        with FilingStorage(source_path, read_only=True) as source:
+            for rows in source.iter_batches(batch_size=batch_size):
+                routed = defaultdict(list)
+                for row in rows:
+                    routed[shard_key(row["filing_date"], self.period)].append(
+                        tuple(row[name] for name in _IMPORT_COLUMNS)
+                    )
+                for key, values in routed.items():
+                    storage = self._writer(key)
+                    # rowcount doesn't count inserts into compact shards' view
+                    before = storage.get_summary(top=0)["total_filings"]
+                    with storage.conn as conn:
+                        conn.executemany(_IMPORT_SQL, values)
+                    copied += storage.get_summary(top=0)["total_filings"] - before
+            cursors = source.conn.execute(
+                "SELECT source, accession_number, filing_date FROM scrape_cursors"
+            ).fetchall()
+            watermarks = source.conn.execute(
+                "SELECT name, last_id FROM export_watermarks"
+            ).fetchall()
+
+        keys = self._keys()
+        with self.catalog as conn:
+            conn.executemany(SET_CURSOR_SQL, cursors)
+            conn.executemany(
+                _SET_WATERMARK_SQL,
+                [(name, key, last_id) for name, last_id in watermarks for key in keys],
+            )
+        logger.info(f"Imported {copied} filings from {source_path} into {len(keys)} shards")
+        return copied
@@ -1,30 +1,398 @@
 """SQLite storage for filings."""
 
 import csv
+import gzip
 import logging
 import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import chain, islice
 from pathlib import Path
-from typing import List
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
-from hootscrapper.scrapers.sec_edgar import Filing
+from hootscrapper import compact, metrics
+from hootscrapper.config import (
+    EXPORT_BATCH_SIZE,
+    INSERT_BATCH_SIZE,
+    MIGRATE_BATCH_SIZE,
+    SQLITE_PROFILE,
+    SQLITE_PROFILES,
+    SQLITE_SCHEMA,
+    SQLITE_SCHEMAS,
+)
+from hootscrapper.models import Filing
 
 logger = logging.getLogger(__name__)
 
 
+INSERT_SQL = """
+    INSERT OR IGNORE INTO filings
+    (cik, company_name, filing_type, filing_date, accession_number, document_url, scraped_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPSERT_SQL = """
+    INSERT INTO filings
+    (cik, company_name, filing_type, filing_date, accession_number, document_url, scraped_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(accession_number) DO UPDATE SET
+        document_url = excluded.document_url,
+        scraped_at = excluded.scraped_at
+"""
+
+# Per-source high-water marks (see ``FilingStorage.get_cursor``)
+SCRAPE_CURSORS_TABLE = """
+    CREATE TABLE IF NOT EXISTS scrape_cursors (
+        source TEXT PRIMARY KEY,
+        accession_number TEXT NOT NULL,
+        filing_date TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+"""
+
+GET_CURSOR_SQL = "SELECT accession_number, filing_date FROM scrape_cursors WHERE source = ?"
+
+SET_CURSOR_SQL = """
+    INSERT INTO scrape_cursors (source, accession_number, filing_date, updated_at)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(source) DO UPDATE SET
+        accession_number = excluded.accession_number,
+        filing_date = excluded.filing_date,
+        updated_at = excluded.updated_at
+    WHERE excluded.filing_date >= scrape_cursors.filing_date
+"""
+
+
+@dataclass
+class FilingQuery:
+    """Filters for ``FilingStorage.query``; unset fields match everything."""
+
+    cik: Optional[str] = None
+    filing_types: Optional[Sequence[str]] = None
+    date_from: Optional[str] = None  # inclusive, YYYY-MM-DD
+    date_to: Optional[str] = None  # inclusive, YYYY-MM-DD
+    company: Optional[str] = None  # words matched as prefixes via the search index
+
+
+def cursor_token(row: sqlite3.Row) -> str:
+    """Keyset cursor for resuming a query after ``row``."""
+    return f"{row['filing_date']}~{row['id']}"
+
+
+def parse_cursor_token(token: str) -> Tuple[str, int]:
+    """Split a ``cursor_token`` into its ``(filing_date, id)`` key."""
+    filing_date, _, row_id = token.rpartition("~")
+    if not filing_date or not row_id.isdigit():
+        raise ValueError(f"Invalid cursor: {token!r}")
+    return filing_date, int(row_id)
+
+
+@dataclass
+class InsertResult:
+    """Row counts from a bulk insert."""
+
+    inserted: int = 0
+    skipped: int = 0
+    updated: int = 0
+
+    def add(self, other: "InsertResult") -> None:
+        """Add another result's counts to this one."""
+        self.inserted += other.inserted
+        self.skipped += other.skipped
+        self.updated += other.updated
+
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+
+def _open_text_output(path: Path, compression: Optional[str]) -> IO[str]:
+    """Open a text file for writing, optionally gzip- or zstd-compressed."""
+    if compression is None:
+        return open(path, "w", newline="", encoding="utf-8")
+    if compression == "gzip":
+        return gzip.open(path, "wt", newline="", encoding="utf-8", compresslevel=6)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise RuntimeError(
+                "zstd export requires the 'zstandard' package (pip install 'hootscrapper[zstd]')"
+            ) from e
+        return zstandard.open(path, "wt", newline="", encoding="utf-8")
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+def export_watermark(since: Optional[str], watermark: Optional[str], default: str) -> Optional[str]:
+    """
+    Name of the watermark an export reads and advances, or None to leave them alone.
+
+    Only ``since="last"`` exports and exports naming a ``watermark`` explicitly
+    track one; a full or ``since=<timestamp>`` export says nothing about what
+    the next incremental export should skip.
+
+    Args:
+        since: None, "last" or an ISO timestamp
+        watermark: Watermark named by the caller, if any
+        default: Watermark used by ``since="last"`` when none is named
+
+    Returns:
+        Watermark name, or None
+    """
+    if watermark is not None:
+        return watermark
+    return default if since == "last" else None
+
+
+def summary_since(days: int) -> str:
+    """
+    First date of a ``days``-day summary window, which includes today.
+
+    Args:
+        days: Window length in days (at least 1)
+
+    Returns:
+        ISO date of the window's first day
+
+    Raises:
+        ValueError: ``days`` is less than 1
+    """
+    if days < 1:
+        raise ValueError("days must be at least 1")
+    return (datetime.utcnow().date() - timedelta(days=days - 1)).isoformat()
+
+
+def write_csv(csv_path: str, rows: Iterator[sqlite3.Row], compression: Optional[str] = None) -> int:
+    """
+    Write rows to a CSV file with a header, streaming them one at a time.
+
+    The file is written under a temporary name and renamed into place when
+    complete; nothing is written when there are no rows.
+
+    Args:
+        csv_path: Path to output CSV file
+        rows: Rows to write
+        compression: "gzip", "zstd" or None (inferred from .gz/.zst suffix)
+
+    Returns:
+        Number of rows written
+    """
+    csv_path = Path(csv_path)
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+
+    first = next(rows, None)
+    if first is None:
+        logger.warning("No filings to export")
+        return 0
+
+    compression = compression or COMPRESSION_SUFFIXES.get(csv_path.suffix)
+    tmp_path = csv_path.with_name(f".{csv_path.name}.tmp")
+    count = 0
+    try:
+        with _open_text_output(tmp_path, compression) as f:
+            writer = csv.writer(f)
+            writer.writerow(first.keys())
+            for row in chain([first], rows):
+                writer.writerow(row)
+                count += 1
+        tmp_path.replace(csv_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    logger.info(f"Exported {count} filings to {csv_path}")
+    return count
+
+
+# Trigger statements applying one row's ``delta`` to every summary counter;
+# counters that drop to zero are removed so the tables only hold live keys.
+# Columns are filled in with the row's expressions (see ``_row_columns``)
+_SUMMARY_TRIGGER_BODY = """
+    INSERT INTO summary_by_type (filing_type, count) VALUES ({filing_type}, {delta})
+    ON CONFLICT (filing_type) DO UPDATE SET count = count + excluded.count;
+    INSERT INTO summary_by_company (company_name, count) VALUES ({company_name}, {delta})
+    ON CONFLICT (company_name) DO UPDATE SET count = count + excluded.count;
+    INSERT INTO summary_by_day (filing_date, filing_type, count)
+    VALUES ({filing_date}, {filing_type}, {delta})
+    ON CONFLICT (filing_date, filing_type) DO UPDATE SET count = count + excluded.count;
+"""
+
+_SUMMARY_TRIGGER_PRUNE = """
+    DELETE FROM summary_by_type WHERE filing_type = {filing_type} AND count <= 0;
+    DELETE FROM summary_by_company WHERE company_name = {company_name} AND count <= 0;
+    DELETE FROM summary_by_day
+    WHERE filing_date = {filing_date} AND filing_type = {filing_type} AND count <= 0;
+"""
+
+
+# Pragmas that only apply to (or may only be set by) writers
+WRITE_PRAGMAS = frozenset({"journal_mode", "synchronous"})
+
+
 class FilingStorage:
-    """SQLite storage for SEC filings."""
+    """
+    SQLite storage for SEC filings.
+
+    Owns one long-lived connection, opened on first use and tuned with a pragma
+    profile from ``SQLITE_PROFILES`` (WAL by default, so readers don't block
+    the writer). Use it as a context manager, or call ``close()``, to release
+    the connection. With ``read_only=True`` the database is opened in SQLite's
+    read-only mode for analytics, and the schema is left untouched.
 
-    def __init__(self, db_path: str):
-        """Initialize storage with database path."""
+    New databases use the ``schema`` layout: "wide" or "compact" (see
+    ``hootscrapper.compact``). Either way filings are read through ``filings``,
+    a table in the wide layout and a view in the compact one.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        read_only: bool = False,
+        profile: str = SQLITE_PROFILE,
+        pragmas: Optional[dict] = None,
+        schema: str = SQLITE_SCHEMA,
+    ):
+        """
+        Initialize storage with database path.
+
+        Args:
+            db_path: Path to the SQLite database
+            read_only: Open an existing database without write access
+            profile: Name of the pragma profile in ``SQLITE_PROFILES``
+            pragmas: Extra pragmas overriding the profile
+            schema: Table layout if the database is new ("wide" or "compact");
+                existing databases keep theirs
+        """
+        if profile not in SQLITE_PROFILES:
+            raise ValueError(f"Unknown SQLite profile: {profile} ({', '.join(SQLITE_PROFILES)})")
+        if schema not in SQLITE_SCHEMAS:
+            raise ValueError(f"Unknown schema: {schema} ({', '.join(SQLITE_SCHEMAS)})")
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
+        if self.db_path.is_dir():
+            raise ValueError(
+                f"{db_path} is a directory; shard directories are opened with "
+                "hootscrapper.shards.open_storage"
+            )
+        self.read_only = read_only
+        self.pragmas = {**SQLITE_PROFILES[profile], **(pragmas or {})}
+        self.schema = schema
+        self._conn: Optional[sqlite3.Connection] = None
+        self._compact: Optional[bool] = None
+        self._schema_version: Optional[int] = None
+        self._dictionary = compact.Dictionary()
+
+        if not read_only:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._init_db()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The storage's connection, opened and configured on first use."""
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection and apply the pragma profile."""
+        if self.read_only:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+
+        for name, value in self.pragmas.items():
+            if self.read_only and name in WRITE_PRAGMAS:
+                continue
+            conn.execute(f"PRAGMA {name} = {value}")
+        if self.read_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    @property
+    def compact(self) -> bool:
+        """Whether the database uses the compact layout (``filings`` is a view)."""
+        if self._compact is None:
+            row = self.conn.execute(
+                "SELECT type FROM sqlite_master WHERE name = 'filings'"
+            ).fetchone()
+            self._compact = row is not None and row[0] == "view"
+        return self._compact
+
+    def _schema_changed(self) -> bool:
+        """
+        Whether the schema changed since the layout was last read, forgetting it if so.
+
+        Writers check this for every batch, so one opened before
+        ``migrate_to_compact`` swapped in the view (from this or another
+        process) writes the compact rows from then on.
+        """
+        version = self.conn.execute("PRAGMA schema_version").fetchone()[0]
+        if version == self._schema_version:
+            return False
+        self._schema_version = version
+        self._compact = None
+        return True
+
+    def _rows_table(self) -> str:
+        """Table physically holding the filings."""
+        return compact.ROWS_TABLE if self.compact else "filings"
+
+    def _row_columns(self, row: str) -> dict:
+        """SQL expressions for the wide columns of a trigger row (``new``/``old``)."""
+        if self.compact:
+            return compact.row_columns(row)
+        return {
+            name: f"{row}.{name}"
+            for name in ("id", "cik", "company_name", "filing_type", "filing_date")
+        }
+
+    def _trigger_columns(self, *names: str) -> str:
+        """Physical columns behind wide columns, for ``AFTER UPDATE OF`` triggers."""
+        if self.compact:
+            names = tuple(dict.fromkeys(compact.PHYSICAL_COLUMNS[name] for name in names))
+        return ", ".join(names)
+
+    def close(self) -> None:
+        """Close the connection (it is reopened on next use)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "FilingStorage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _init_db(self) -> None:
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
+        if not cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'filings'").fetchone():
+            self._compact = self.schema == "compact"
+        if self.compact:
+            compact.create_tables(cursor)
+            compact.create_view(cursor)
+        else:
+            self._init_wide_table(cursor)
+
+        cursor.execute(SCRAPE_CURSORS_TABLE)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS export_watermarks (
+                name TEXT PRIMARY KEY,
+                last_id INTEGER NOT NULL,
+                exported_at TEXT NOT NULL
+            )
+        """)
+
+        self._init_search_index(cursor)
+        self._init_summary_counters(cursor)
+
+        conn.commit()
+        logger.info(f"Database initialized: {self.db_path}")
+
+    def _init_wide_table(self, cursor: sqlite3.Cursor) -> None:
+        """Create the wide ``filings`` table and its indexes."""
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS filings (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -39,134 +407,737 @@ class FilingStorage:
             )
         """)
 
+        # Composite indexes serve "filings for X in a date range" newest first,
+        # and their leading column still serves plain cik/filing_type lookups
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_cik ON filings(cik)
+            CREATE INDEX IF NOT EXISTS idx_cik_filing_date ON filings(cik, filing_date)
         """)
 
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_filing_type ON filings(filing_type)
+            CREATE INDEX IF NOT EXISTS idx_filing_type_filing_date
+            ON filings(filing_type, filing_date)
         """)
 
+        cursor.execute("DROP INDEX IF EXISTS idx_cik")
+        cursor.execute("DROP INDEX IF EXISTS idx_filing_type")
+
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_filing_date ON filings(filing_date)
         """)
 
+    def _init_search_index(self, cursor: sqlite3.Cursor) -> None:
+        """Create the FTS5 index over company names and filing types, kept in sync by triggers."""
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'filings_fts'"
+        ).fetchone()
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS filings_fts USING fts5(
+                    company_name, filing_type,
+                    content = 'filings', content_rowid = 'id',
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable ({e}); 'hoot search' is disabled")
+            return
+
+        # Term list, used to expand misspelled words for fuzzy search
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS filings_fts_vocab USING fts5vocab(filings_fts, 'row')
+        """)
+
+        table = self._rows_table()
+        new, old = self._row_columns("new"), self._row_columns("old")
+        insert_new = """
+            INSERT INTO filings_fts (rowid, company_name, filing_type)
+            VALUES ({id}, {company_name}, {filing_type});
+        """.format(**new)
+        delete_old = """
+            INSERT INTO filings_fts (filings_fts, rowid, company_name, filing_type)
+            VALUES ('delete', {id}, {company_name}, {filing_type});
+        """.format(**old)
+
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS filings_fts_insert AFTER INSERT ON {table} BEGIN
+                {insert_new}
+            END
+        """)
+
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS filings_fts_delete AFTER DELETE ON {table} BEGIN
+                {delete_old}
+            END
+        """)
+
+        # Upserts only touch document_url/scraped_at, so they skip the index entirely
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS filings_fts_update
+            AFTER UPDATE OF {self._trigger_columns("company_name", "filing_type")} ON {table}
+            BEGIN
+                {delete_old}
+                {insert_new}
+            END
+        """)
+
+        if not exists:
+            # Index rows stored before the search index existed
+            cursor.execute("INSERT INTO filings_fts (filings_fts) VALUES ('rebuild')")
+
+    def _init_summary_counters(self, cursor: sqlite3.Cursor) -> None:
+        """Create the summary counter tables and the triggers that maintain them."""
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'summary_by_type'"
+        ).fetchone()
+        if exists:
+            self._rekey_company_counters(cursor)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS summary_by_type (
+                filing_type TEXT PRIMARY KEY,
+                count INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS summary_by_company (
+                company_name TEXT PRIMARY KEY,
+                count INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_summary_by_company_count ON summary_by_company(count)
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS summary_by_day (
+                filing_date TEXT NOT NULL,
+                filing_type TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (filing_date, filing_type)
+            )
+        """)
+
+        updated = self._trigger_columns("company_name", "filing_type", "filing_date")
+        for name, event, rows in (
+            ("summary_insert", "INSERT", [("new", 1)]),
+            ("summary_delete", "DELETE", [("old", -1)]),
+            ("summary_update", f"UPDATE OF {updated}", [("old", -1), ("new", 1)]),
+        ):
+            body = "".join(
+                _SUMMARY_TRIGGER_BODY.format(**self._row_columns(row), delta=delta)
+                for row, delta in rows
+            )
+            if rows[0][0] == "old":
+                body += _SUMMARY_TRIGGER_PRUNE.format(**self._row_columns("old"))
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON {self._rows_table()} BEGIN
+                    {body}
+                END
+            """)
+
+        if not exists:
+            # Count rows stored before the counters existed
+            self._rebuild_summary(cursor)
+
+    @staticmethod
+    def _rekey_company_counters(cursor: sqlite3.Cursor) -> None:
+        """Fold company counters kept per (company_name, cik) into one per name."""
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(summary_by_company)")]
+        if "cik" not in columns:
+            return
+        # The old triggers name the old conflict key; they are recreated after this
+        for name in ("summary_insert", "summary_delete", "summary_update"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute("""
+            CREATE TABLE summary_by_company_new (
+                company_name TEXT PRIMARY KEY,
+                count INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("""
+            INSERT INTO summary_by_company_new (company_name, count)
+            SELECT company_name, SUM(count) FROM summary_by_company GROUP BY company_name
+        """)
+        cursor.execute("DROP TABLE summary_by_company")
+        cursor.execute("ALTER TABLE summary_by_company_new RENAME TO summary_by_company")
+        logger.info("Summary company counters re-keyed by company name")
+
+    def _rebuild_summary(self, cursor: sqlite3.Cursor) -> None:
+        """Recompute all summary counters from ``filings``."""
+        cursor.execute("DELETE FROM summary_by_type")
+        cursor.execute("DELETE FROM summary_by_company")
+        cursor.execute("DELETE FROM summary_by_day")
+        cursor.execute("""
+            INSERT INTO summary_by_type (filing_type, count)
+            SELECT filing_type, COUNT(*) FROM filings GROUP BY filing_type
+        """)
+        cursor.execute("""
+            INSERT INTO summary_by_company (company_name, count)
+            SELECT company_name, COUNT(*) FROM filings GROUP BY company_name
+        """)
+        cursor.execute("""
+            INSERT INTO summary_by_day (filing_date, filing_type, count)
+            SELECT filing_date, filing_type, COUNT(*) FROM filings
+            GROUP BY filing_date, filing_type
+        """)
+
+    def rebuild_summary(self) -> None:
+        """Recompute the summary counters in one transaction (e.g. after manual edits)."""
+        with self.conn:
+            self._rebuild_summary(self.conn.cursor())
+        logger.info("Summary counters rebuilt")
+
+    def migrate_to_compact(self, batch_size: int = MIGRATE_BATCH_SIZE) -> int:
+        """
+        Convert a wide database to the compact layout while it stays in use.
+
+        Rows are copied into ``filing_rows`` in short transactions of
+        ``batch_size`` rows, keeping their ids, so readers and writers carry on
+        between batches; temporary triggers mirror updates and deletes of rows
+        already copied. A final transaction copies the rows added meanwhile
+        and replaces the ``filings`` table with the view. The search index and
+        summary counters carry over as they are. An interrupted migration
+        resumes where it stopped. The old table's pages are reused by later
+        inserts, or returned to the file system by ``VACUUM``.
+
+        Args:
+            batch_size: Rows copied per transaction
+
+        Returns:
+            Number of rows copied
+        """
+        if self.compact:
+            logger.info(f"{self.db_path} already uses the compact schema")
+            return 0
+
+        conn = self.conn
+        cursor = conn.cursor()
+        compact.create_tables(cursor)
+        compact.create_sync_triggers(cursor)
         conn.commit()
-        conn.close()
-        logger.info(f"Database initialized: {self.db_path}")
 
-    def insert_filings(self, filings: List[Filing]) -> int:
+        def last_copied() -> int:
+            return cursor.execute("SELECT COALESCE(MAX(id), 0) FROM filing_rows").fetchone()[0]
+
+        copied = 0
+        after_id = last_copied()
+        while True:
+            with conn:
+                count = compact.copy_batch(cursor, after_id, batch_size)
+            if not count:
+                break
+            copied += count
+            after_id = last_copied()
+            logger.info(f"Copied {copied} filings (up to id {after_id})")
+            if count < batch_size:
+                break
+
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            while count := compact.copy_batch(cursor, after_id, batch_size):
+                copied += count
+                after_id = last_copied()
+            row = cursor.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'filings'"
+            ).fetchone()
+            cursor.execute("DROP TABLE filings")
+            # Keep AUTOINCREMENT from reusing ids of rows deleted before the migration
+            cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'filing_rows'")
+            cursor.execute(
+                "INSERT INTO sqlite_sequence (name, seq) VALUES ('filing_rows', MAX(?, ?))",
+                (row[0] if row else 0, after_id),
+            )
+            compact.create_view(cursor)
+            self._compact = True
+            self._init_search_index(cursor)
+            self._init_summary_counters(cursor)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            self._compact = None
+            raise
+
+        logger.info(f"Migrated {self.db_path} to the compact schema ({copied} filings)")
+        return copied
+
+    def insert_filings(self, filings: Iterable[Filing]) -> int:
         """
         Insert filings into database.
 
         Args:
-            filings: List of Filing objects
+            filings: Iterable of Filing objects
 
         Returns:
             Number of filings inserted (skips duplicates)
         """
-        if not filings:
-            return 0
+        return self.bulk_insert(filings).inserted
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def bulk_insert(
+        self,
+        filings: Iterable[Filing],
+        batch_size: int = INSERT_BATCH_SIZE,
+        upsert: bool = False,
+    ) -> InsertResult:
+        """
+        Insert filings in chunks, one transaction per chunk.
 
-        inserted_count = 0
-        for filing in filings:
-            try:
-                cursor.execute(
-                    """
-                    INSERT INTO filings 
-                    (cik, company_name, filing_type, filing_date, accession_number, 
-                     document_url, scraped_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        filing.cik,
-                        filing.company_name,
-                        filing.filing_type,
-                        filing.filing_date,
-                        filing.accession_number,
-                        filing.document_url,
-                        filing.scraped_at,
-                    ),
-                )
-                inserted_count += 1
-            except sqlite3.IntegrityError:
-                logger.debug(f"Skipping duplicate filing: {filing.accession_number}")
-                continue
+        Each chunk is written with a single ``executemany``. Duplicate accession
+        numbers are ignored, or with ``upsert`` have their ``document_url`` and
+        ``scraped_at`` refreshed. Any iterable works, including generators, and
+        only one chunk is held in memory at a time.
 
-        conn.commit()
-        conn.close()
+        Args:
+            filings: Iterable of Filing objects
+            batch_size: Rows per transaction
+            upsert: Update existing rows instead of skipping them
+
+        Returns:
+            InsertResult with exact inserted/skipped/updated counts
+        """
+        result = InsertResult()
+        filings = iter(filings)
+        while chunk := list(islice(filings, batch_size)):
+            result.add(self.insert_batch(chunk, upsert=upsert))
+
+        if upsert:
+            logger.info(f"Inserted {result.inserted} new filings, updated {result.updated}")
+        else:
+            logger.info(
+                f"Inserted {result.inserted} new filings (skipped {result.skipped} duplicates)"
+            )
+        return result
+
+    def insert_batch(self, filings: Sequence[Filing], upsert: bool = False) -> InsertResult:
+        """
+        Insert one chunk of filings with a single ``executemany`` in one transaction.
+
+        Args:
+            filings: Filing objects to write
+            upsert: Update existing rows instead of skipping them
+
+        Returns:
+            InsertResult for this chunk
+        """
+        result = InsertResult()
+        conn = self.conn
+        self._schema_changed()
+        with metrics.timer("hoot_insert_batch_seconds"):
+            while True:
+                sql, rows = self._insert_params(filings, upsert)
+                # The layout can only change while no write transaction is open
+                conn.execute("BEGIN IMMEDIATE")
+                if not self._schema_changed():
+                    break
+                conn.rollback()
+
+            table = self._rows_table()
+            with conn:
+                if upsert:
+                    # New rows get ids above the current max (AUTOINCREMENT)
+                    cursor = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+                    max_id = cursor.fetchone()[0]
+                    written = conn.executemany(sql, rows).rowcount
+                    inserted = conn.execute(
+                        f"SELECT COUNT(*) FROM {table} WHERE id > ?", (max_id,)
+                    ).fetchone()[0]
+                    result.updated = written - inserted
+                else:
+                    inserted = conn.executemany(sql, rows).rowcount
+                    result.skipped = len(rows) - inserted
+                result.inserted = inserted
+
+        metrics.inc("hoot_rows_inserted_total", result.inserted)
+        metrics.inc("hoot_rows_skipped_total", result.skipped)
+        metrics.inc("hoot_rows_updated_total", result.updated)
+        return result
+
+    def _insert_params(self, filings: Sequence[Filing], upsert: bool) -> Tuple[str, List[tuple]]:
+        """Statement and parameter rows writing ``filings`` in the current layout."""
+        if self.compact:
+            sql = compact.UPSERT_SQL if upsert else compact.INSERT_SQL
+            return sql, self._dictionary.encode(self.conn, filings)
+        sql = UPSERT_SQL if upsert else INSERT_SQL
+        return sql, [
+            (
+                f.cik,
+                f.company_name,
+                f.filing_type,
+                f.filing_date,
+                f.accession_number,
+                f.document_url,
+                f.scraped_at,
+            )
+            for f in filings
+        ]
+
+    def existing_accessions(self, accession_numbers: Iterable[str]) -> Set[str]:
+        """
+        Return which of the given accession numbers are already stored.
+
+        Args:
+            accession_numbers: Accession numbers to look up
+
+        Returns:
+            Set of accession numbers present in the database
+        """
+        accessions = list(dict.fromkeys(accession_numbers))
+        if not accessions:
+            return set()
+
+        cursor = self.conn.cursor()
+        if self.compact:
+            # Look up the packed keys, so the unique index is used
+            sql = "SELECT accession FROM filing_rows WHERE accession IN ({})"
+            accessions = [compact.pack_accession(a) for a in accessions]
+        else:
+            sql = "SELECT accession_number FROM filings WHERE accession_number IN ({})"
+
+        found: Set[str] = set()
+        # Stay well below SQLite's bound-parameter limit
+        for i in range(0, len(accessions), 500):
+            chunk = accessions[i : i + 500]
+            cursor.execute(sql.format(",".join("?" * len(chunk))), chunk)
+            found.update(compact.unpack_accession(row[0]) for row in cursor.fetchall())
+
+        return found
+
+    def query(
+        self,
+        filters: Optional[FilingQuery] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[sqlite3.Row]:
+        """
+        Stream filings matching ``filters``, newest ``filing_date`` first.
+
+        Rows are read in keyset-paginated batches: each batch resumes strictly
+        after the ``(filing_date, id)`` of the previous one, so no OFFSET is
+        ever scanned and no read transaction stays open between batches.
+        Equality on cik or filing_type plus a date range is answered by the
+        composite ``(cik, filing_date)``/``(filing_type, filing_date)`` indexes.
+
+        Args:
+            filters: Filters to apply (default: all filings)
+            after: Cursor from ``cursor_token`` of the last row already seen
+            limit: Maximum number of rows to yield
+            batch_size: Rows fetched per query
+
+        Yields:
+            sqlite3.Row objects
+        """
+        filters = filters or FilingQuery()
+        clauses, params = [], []
+        if filters.cik:
+            clauses.append("cik = ?")
+            params.append(filters.cik.lstrip("0"))
+        if filters.filing_types:
+            clauses.append(f"filing_type IN ({','.join('?' * len(filters.filing_types))})")
+            params.extend(filters.filing_types)
+        if filters.date_from:
+            clauses.append("filing_date >= ?")
+            params.append(filters.date_from)
+        if filters.date_to:
+            clauses.append("filing_date <= ?")
+            params.append(filters.date_to)
+        if filters.company:
+            from hootscrapper.search import match_expression
+
+            clauses.append("id IN (SELECT rowid FROM filings_fts WHERE filings_fts MATCH ?)")
+            params.append(f"company_name : ({match_expression(filters.company)})")
 
-        logger.info(f"Inserted {inserted_count} new filings (skipped duplicates)")
-        return inserted_count
+        key = parse_cursor_token(after) if after else None
+        remaining = limit if limit is not None else float("inf")
+        cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
+
+        while remaining > 0:
+            where = list(clauses)
+            if key is not None:
+                where.append("(filing_date, id) < (?, ?)")
+            sql = "SELECT * FROM filings"
+            if where:
+                sql += f" WHERE {' AND '.join(where)}"
+            sql += " ORDER BY filing_date DESC, id DESC LIMIT ?"
+
+            count = int(min(batch_size, remaining))
+            rows = cursor.execute(sql, [*params, *(key or ()), count]).fetchall()
+            yield from rows
+            if len(rows) < count:
+                return
+            remaining -= len(rows)
+            key = (rows[-1]["filing_date"], rows[-1]["id"])
+
+    def query_page(
+        self,
+        filters: Optional[FilingQuery] = None,
+        after: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Tuple[List[sqlite3.Row], Optional[str]]:
+        """
+        Fetch one page of ``query`` results.
+
+        Returns:
+            ``(rows, next_cursor)``; ``next_cursor`` is None on the last page
+        """
+        rows = list(self.query(filters, after=after, limit=page_size + 1, batch_size=page_size + 1))
+        if len(rows) > page_size:
+            return rows[:page_size], cursor_token(rows[page_size - 1])
+        return rows, None
 
     def get_all_filings(self) -> List[dict]:
         """Get all filings from database."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
         cursor.execute("SELECT * FROM filings ORDER BY filing_date DESC")
         rows = cursor.fetchall()
-        conn.close()
 
         return [dict(row) for row in rows]
 
-    def export_to_csv(self, csv_path: str) -> None:
+    def iter_batches(
+        self,
+        after_id: int = 0,
+        created_after: Optional[str] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[List[sqlite3.Row]]:
         """
-        Export all filings to CSV.
+        Stream filings from a single cursor in batches of ``batch_size`` rows.
+
+        Full scans come newest ``filing_date`` first, as in ``get_all_filings``.
+        Incremental scans (``after_id``/``created_after``) come in insertion order.
 
         Args:
-            csv_path: Path to output CSV file
+            after_id: Only rows with a greater id
+            created_after: Only rows with a later ``created_at`` (ISO timestamp)
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Lists of sqlite3.Row objects
         """
-        csv_path = Path(csv_path)
-        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
-        filings = self.get_all_filings()
+        if after_id or created_after:
+            # created_at uses SQLite's "YYYY-MM-DD HH:MM:SS" format
+            created_after = (created_after or "").replace("T", " ")
+            cursor.execute(
+                "SELECT * FROM filings WHERE id > ? AND created_at > ? ORDER BY id",
+                (after_id, created_after),
+            )
+        else:
+            cursor.execute("SELECT * FROM filings ORDER BY filing_date DESC")
 
-        if not filings:
-            logger.warning("No filings to export")
-            return
+        while rows := cursor.fetchmany(batch_size):
+            yield rows
 
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=filings[0].keys())
-            writer.writeheader()
-            writer.writerows(filings)
+    def iter_filings(self, **kwargs) -> Iterator[sqlite3.Row]:
+        """Stream filings row by row; takes the same arguments as ``iter_batches``."""
+        for rows in self.iter_batches(**kwargs):
+            yield from rows
 
-        logger.info(f"Exported {len(filings)} filings to {csv_path}")
+    def get_cursor(self, source: str) -> Optional[Tuple[str, str]]:
+        """
+        Get a source's high-water mark.
 
-    def get_summary(self) -> dict:
-        """Get summary statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        Args:
+            source: Source name (e.g. "sec-edgar")
 
-        cursor.execute("SELECT COUNT(*) FROM filings")
-        total = cursor.fetchone()[0]
+        Returns:
+            ``(accession_number, filing_date)`` of the newest filing seen, or None
+        """
+        return self.conn.execute(GET_CURSOR_SQL, (source,)).fetchone()
 
-        cursor.execute("""
-            SELECT filing_type, COUNT(*) as count 
-            FROM filings 
-            GROUP BY filing_type 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
-        top_types = cursor.fetchall()
+    def set_cursor(self, source: str, accession_number: str, filing_date: str) -> None:
+        """Advance a source's high-water mark (an older filing never moves it back)."""
+        with self.conn:
+            self.conn.execute(SET_CURSOR_SQL, (source, accession_number, filing_date))
 
-        cursor.execute("""
-            SELECT company_name, COUNT(*) as count 
-            FROM filings 
-            GROUP BY company_name 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
-        top_companies = cursor.fetchall()
+    def export_filter(self, since: Optional[str], watermark: str) -> dict:
+        """
+        Translate an export ``since`` option into ``iter_batches`` arguments.
 
-        conn.close()
+        Args:
+            since: None for all rows, "last" for rows added since the previous
+                export under ``watermark``, or an ISO timestamp
+            watermark: Name of the export watermark
+
+        Returns:
+            Keyword arguments for ``iter_batches``/``iter_filings``
+        """
+        if since == "last":
+            return {"after_id": self.get_watermark(watermark)}
+        if since:
+            return {"created_after": since}
+        return {}
+
+    def get_watermark(self, name: str) -> int:
+        """Get the last exported id for an export watermark (0 if never exported)."""
+        row = self.conn.execute(
+            "SELECT last_id FROM export_watermarks WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def set_watermark(self, name: str, last_id: int) -> None:
+        """Record the last exported id for an export watermark."""
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO export_watermarks (name, last_id, exported_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(name) DO UPDATE SET
+                    last_id = MAX(last_id, excluded.last_id),
+                    exported_at = excluded.exported_at
+            """,
+                (name, last_id),
+            )
+
+    def export_batches(
+        self, since: Optional[str], watermark: Optional[str], batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Tuple[Iterator[List[sqlite3.Row]], Callable[[], None]]:
+        """
+        Stream the rows of an export and track how far it got.
+
+        Args:
+            since: None, "last" or an ISO timestamp (see ``export_filter``)
+            watermark: Name of the export watermark, or None to leave watermarks
+                alone (see ``export_watermark``)
+            batch_size: Rows per batch
+
+        Returns:
+            ``(batches, commit)``: the row batches, and a function that advances
+            the watermark past every row yielded, to call once the export is written
+
+        Raises:
+            ValueError: ``since="last"`` without a watermark
+        """
+        if since == "last" and watermark is None:
+            raise ValueError("since='last' needs a watermark")
+        exported = {"max_id": 0}
+
+        def batches() -> Iterator[List[sqlite3.Row]]:
+            for rows in self.iter_batches(
+                batch_size=batch_size, **self.export_filter(since, watermark)
+            ):
+                exported["max_id"] = max(exported["max_id"], max(row["id"] for row in rows))
+                yield rows
+
+        def commit() -> None:
+            if watermark is not None:
+                self.set_watermark(watermark, exported["max_id"])
+
+        return batches(), commit
+
+    def export_to_csv(
+        self,
+        csv_path: str,
+        since: Optional[str] = None,
+        compression: Optional[str] = None,
+        watermark: Optional[str] = None,
+    ) -> int:
+        """
+        Export filings to CSV, streaming rows straight from the database.
+
+        Memory use is constant regardless of table size. The file is written
+        under a temporary name and renamed into place when complete. A
+        ``since="last"`` export picks up only rows added after the previous
+        one and advances the watermark; other exports leave it alone unless
+        ``watermark`` is named.
+
+        Args:
+            csv_path: Path to output CSV file
+            since: None for all rows, "last" for rows added since the previous
+                export, or an ISO timestamp compared against ``created_at``
+            compression: "gzip", "zstd" or None (inferred from .gz/.zst suffix)
+            watermark: Name of the watermark to read and advance (default "csv"
+                for ``since="last"``)
+
+        Returns:
+            Number of filings exported
+        """
+        batches, commit = self.export_batches(since, export_watermark(since, watermark, "csv"))
+        count = write_csv(csv_path, chain.from_iterable(batches), compression)
+        if count:
+            commit()
+        return count
+
+    def get_summary(
+        self, days: Optional[int] = None, top: int = 10, company_top: Optional[int] = None
+    ) -> dict:
+        """
+        Get summary statistics from the materialized counters.
+
+        All-time figures are read from the small counter tables, so they cost
+        the same for any table size; top companies are a walk down the count
+        index. With ``days`` the totals and filing types come from the per-day
+        counters, and top companies from an index range scan over the window's
+        filings only.
+
+        Args:
+            days: Only count filings dated today or in the ``days - 1`` days before
+            top: Number of filing types/companies to return
+            company_top: Number of companies to return instead of ``top``
+
+        Returns:
+            Summary dict with total_filings, top_filing_types and top_companies
+            (plus since and filings_by_day for a time window)
+        """
+        cursor = self.conn.cursor()
+        company_top = top if company_top is None else company_top
+
+        if days is not None:
+            since = summary_since(days)
+            by_day = cursor.execute(
+                """
+                SELECT filing_date, SUM(count) FROM summary_by_day
+                WHERE filing_date >= ? GROUP BY filing_date ORDER BY filing_date
+            """,
+                (since,),
+            ).fetchall()
+            top_types = cursor.execute(
+                """
+                SELECT filing_type, SUM(count) AS total FROM summary_by_day
+                WHERE filing_date >= ? GROUP BY filing_type ORDER BY total DESC LIMIT ?
+            """,
+                (since, top),
+            ).fetchall()
+            top_companies = cursor.execute(
+                """
+                SELECT company_name, COUNT(*) AS count FROM filings
+                WHERE filing_date >= ? GROUP BY company_name ORDER BY count DESC LIMIT ?
+            """,
+                (since, company_top),
+            ).fetchall()
+            return {
+                "total_filings": sum(count for _, count in by_day),
+                "top_filing_types": top_types,
+                "top_companies": top_companies,
+                "since": since,
+                "filings_by_day": by_day,
+            }
+
+        total = cursor.execute("SELECT COALESCE(SUM(count), 0) FROM summary_by_type").fetchone()[0]
+        top_types = cursor.execute(
+            "SELECT filing_type, count FROM summary_by_type ORDER BY count DESC LIMIT ?", (top,)
+        ).fetchall()
+        top_companies = cursor.execute(
+            "SELECT company_name, count FROM summary_by_company ORDER BY count DESC LIMIT ?",
+            (company_top,),
+        ).fetchall()
 
         return {
             "total_filings": total,
             "top_filing_types": top_types,
             "top_companies": top_companies,
         }
+
+    def company_counts(self, names: Iterable[str]) -> Dict[str, int]:
+        """All-time filing counts of the named companies (primary key lookups on the counters)."""
+        names = list(names)
+        sql = "SELECT company_name, count FROM summary_by_company WHERE company_name IN ({})"
+        counts: Dict[str, int] = {}
+        # Stay well below SQLite's bound-parameter limit
+        for i in range(0, len(names), 500):
+            chunk = names[i : i + 500]
+            counts.update(self.conn.execute(sql.format(",".join("?" * len(chunk))), chunk))
+        return counts
@@ -1,41 +1,168 @@
-"""Utility functions for rate limiting and robots.txt checking."""
+"""Utility functions for rate limiting, robots.txt checking and HTTP requests."""
 
+import asyncio
 import logging
+import sqlite3
+import threading
 import time
-from typing import Optional
-from urllib.parse import urlparse
-from urllib.robotparser import RobotFileParser
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from hootscrapper.config import REQUEST_DELAY, TIMEOUT, USER_AGENT
+from hootscrapper import metrics
+from hootscrapper.config import (
+    MAX_CONCURRENCY,
+    MAX_RETRIES,
+    RATE_BURST,
+    REQUEST_DELAY,
+    RETRY_BACKOFF,
+    TIMEOUT,
+    USER_AGENT,
+)
+
+if TYPE_CHECKING:
+    from hootscrapper.cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Statuses worth retrying: throttling and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Failures handled by ``backoff``; anything else propagates at once
+ATTEMPT_ERRORS = (requests.HTTPError, requests.ConnectionError, requests.Timeout)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_robots_cache = None
+
+
+class SharedTokenBucket:
+    """
+    Token-bucket state kept in a SQLite file so several processes share one budget.
+
+    Each reservation runs in an immediate (write-locked) transaction, so workers
+    on the same host draw from a single global rate. Timestamps come from
+    ``time.monotonic()``, which is system-wide on the supported platforms.
+    """
+
+    def __init__(self, path: str, name: str = "default"):
+        """Initialize bucket file and name (one file can hold several buckets)."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.name = name
+        with closing(self._connect()) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS token_buckets (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated REAL NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=TIMEOUT, isolation_level=None)
+
+    def reserve(self, rate: float, burst: int) -> float:
+        """
+        Take one token, returning how long the caller must wait before using it.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+
+        Returns:
+            Seconds to sleep (0 if a token was available)
+        """
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.monotonic()
+                row = conn.execute(
+                    "SELECT tokens, updated FROM token_buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                tokens, updated = row if row else (float(burst), now)
+                if updated > now:  # clock reset (reboot) - start from a full bucket
+                    tokens, updated = float(burst), now
+                tokens = min(float(burst), tokens + (now - updated) * rate) - 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO token_buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                    (self.name, tokens, now),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return max(0.0, -tokens / rate)
+
 
 class RateLimiter:
-    """Simple rate limiter using time delays."""
+    """
+    Token-bucket rate limiter.
+
+    Allows bursts of up to ``burst`` requests, then ``1 / delay`` requests per
+    second. Callers reserve a token under a lock and sleep outside it, so one
+    limiter can be shared by threads (``wait``) and coroutines (``wait_async``).
+    Pass a ``SharedTokenBucket`` to share the budget across processes.
+    """
 
-    def __init__(self, delay: float = REQUEST_DELAY):
-        """Initialize rate limiter with delay in seconds."""
+    def __init__(
+        self,
+        delay: float = REQUEST_DELAY,
+        burst: int = RATE_BURST,
+        backend: Optional[SharedTokenBucket] = None,
+    ):
+        """Initialize rate limiter with delay in seconds and burst size."""
         self.delay = delay
-        self.last_request_time: Optional[float] = None
+        self.rate = 1.0 / delay if delay > 0 else float("inf")
+        self.burst = max(1, burst)
+        self.backend = backend
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token, returning how long to wait before using it."""
+        if self.rate == float("inf"):
+            return 0.0
+        if self.backend is not None:
+            return self.backend.reserve(self.rate, self.burst)
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
 
     def wait(self) -> None:
         """Wait if necessary to maintain rate limit."""
-        if self.last_request_time is not None:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.delay:
-                sleep_time = self.delay - elapsed
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        sleep_time = self.reserve()
+        metrics.observe("hoot_ratelimit_wait_seconds", sleep_time)
+        if sleep_time > 0:
+            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+            time.sleep(sleep_time)
+
+    async def wait_async(self) -> None:
+        """Coroutine version of ``wait`` that sleeps without blocking the event loop."""
+        if self.backend is not None:
+            sleep_time = await asyncio.to_thread(self.reserve)
+        else:
+            sleep_time = self.reserve()
+        metrics.observe("hoot_ratelimit_wait_seconds", sleep_time)
+        if sleep_time > 0:
+            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+            await asyncio.sleep(sleep_time)
 
 
 def check_robots_txt(url: str, user_agent: str = USER_AGENT) -> bool:
     """
     Check if scraping is allowed by robots.txt.
 
+    Policies are cached per host for ``ROBOTS_TTL`` seconds; see ``RobotsCache``
+    for persistent caching and batch checks.
+
     Args:
         url: The URL to check
         user_agent: User agent string to check against
@@ -43,32 +170,197 @@ def check_robots_txt(url: str, user_agent: str = USER_AGENT) -> bool:
     Returns:
         True if allowed, False if disallowed
     """
-    parsed = urlparse(url)
-    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+    from hootscrapper.robots import RobotsCache
+
+    global _robots_cache
+    with _session_lock:
+        if _robots_cache is None or _robots_cache.user_agent != user_agent:
+            _robots_cache = RobotsCache(user_agent=user_agent)
+
+    can_fetch = _robots_cache.can_fetch(url)
+    logger.info(f"robots.txt check for {url}: {'ALLOWED' if can_fetch else 'BLOCKED'}")
+    return can_fetch
+
+
+def build_session(pool_size: int = MAX_CONCURRENCY) -> requests.Session:
+    """
+    Create a keep-alive session with a connection pool.
+
+    Args:
+        pool_size: Max pooled connections per host
+
+    Returns:
+        Configured Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide shared session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = build_session()
+        return _session
+
+
+def retry_delay(attempt: int, response: Optional[requests.Response] = None) -> float:
+    """
+    Compute how long to wait before retrying.
+
+    Honors a numeric ``Retry-After`` header, otherwise backs off exponentially.
+
+    Args:
+        attempt: Zero-based index of the attempt that failed
+        response: Failed response, if the server answered
+
+    Returns:
+        Delay in seconds
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+    return RETRY_BACKOFF * (2**attempt)
+
+
+def should_retry(attempt: int, response: Optional[requests.Response] = None) -> bool:
+    """Whether a failed attempt (exception if no response) should be retried."""
+    if attempt >= MAX_RETRIES:
+        return False
+    return response is None or response.status_code in RETRY_STATUSES
+
+
+def check_response(url: str, response: requests.Response) -> requests.Response:
+    """
+    Return ``response`` if it succeeded, otherwise raise ``requests.HTTPError``.
+
+    Retryable statuses raise too (carrying the response), so one handler sees
+    every failed attempt.
+    """
+    if response.status_code in RETRY_STATUSES:
+        raise requests.HTTPError(f"{response.status_code} for url: {url}", response=response)
+    response.raise_for_status()
+    return response
+
+
+def backoff(attempt: int, error: requests.RequestException) -> float:
+    """
+    Decide whether a failed attempt is retried.
+
+    Shared by ``make_request`` and the async engine, which only differ in how
+    they send and sleep.
+
+    Args:
+        attempt: Zero-based index of the attempt that failed
+        error: One of ``ATTEMPT_ERRORS``
+
+    Returns:
+        Delay in seconds before the next attempt
+
+    Raises:
+        ``error`` when it should not be retried
+    """
+    if not isinstance(error, requests.HTTPError):
+        metrics.inc("hoot_http_errors_total", kind=type(error).__name__)
+    if not should_retry(attempt, error.response):
+        raise error
+    delay = retry_delay(attempt, error.response)
+    logger.warning(f"Request failed ({error}); retrying in {delay:.1f}s")
+    metrics.inc("hoot_http_retries_total")
+    return delay
+
+
+def send_request(
+    session: requests.Session,
+    url: str,
+    headers: dict,
+    cache: Optional["ResponseCache"] = None,
+    stream: bool = False,
+) -> requests.Response:
+    """
+    Send one GET, revalidating against ``cache`` when given.
+
+    On 304 Not Modified the cached body is placed on the response (``content``),
+    the status stays 304 and ``response.from_cache`` is set. If that body is
+    gone, the request is repeated without validators.
+
+    Args:
+        session: Session to send on
+        url: URL to fetch
+        headers: Request headers
+        cache: Optional ResponseCache (ignored when streaming)
+        stream: Leave the body unread so it can be consumed from ``response.raw``
+
+    Returns:
+        Response object
+    """
+    if cache is None or stream:
+        with metrics.timer("hoot_http_request_seconds"):
+            response = session.get(url, headers=headers, timeout=TIMEOUT, stream=stream)
+        _record_response(response, stream)
+        return response
+
+    with metrics.timer("hoot_http_request_seconds"):
+        response = session.get(url, headers={**cache.validators(url), **headers}, timeout=TIMEOUT)
+    _record_response(response)
+    response.from_cache = False
+    if response.status_code == 304:
+        body = cache.get(url)
+        if body is not None:
+            logger.debug(f"Not modified, serving cached body: {url}")
+            response._content = body
+            response.from_cache = True
+            return response
+        # The body was evicted after the validators were read: fetch it again in full
+        logger.debug(f"Not modified but no cached body, refetching: {url}")
+        with metrics.timer("hoot_http_request_seconds"):
+            response = session.get(url, headers=headers, timeout=TIMEOUT)
+        _record_response(response)
+        response.from_cache = False
+    if response.status_code == 200:
+        cache.put(url, response)
+    return response
 
-    try:
-        rp = RobotFileParser()
-        rp.set_url(robots_url)
-        rp.read()
 
-        can_fetch = rp.can_fetch(user_agent, url)
-        logger.info(f"robots.txt check for {url}: {'ALLOWED' if can_fetch else 'BLOCKED'}")
-        return can_fetch
-    except Exception as e:
-        logger.warning(f"Could not check robots.txt for {url}: {e}. Assuming allowed.")
-        return True
+def _record_response(response: requests.Response, stream: bool = False) -> None:
+    """Count a response and its body size (Content-Length when streaming)."""
+    if not metrics.is_enabled():
+        return
+    metrics.inc("hoot_http_requests_total", status=str(response.status_code))
+    if stream:
+        size = int(response.headers.get("Content-Length") or 0)
+    else:
+        size = len(response.content)
+    metrics.inc("hoot_http_bytes_total", size)
 
 
 def make_request(
-    url: str, rate_limiter: RateLimiter, headers: Optional[dict] = None
+    url: str,
+    rate_limiter: RateLimiter,
+    headers: Optional[dict] = None,
+    session: Optional[requests.Session] = None,
+    cache: Optional["ResponseCache"] = None,
+    stream: bool = False,
 ) -> requests.Response:
     """
-    Make a rate-limited HTTP request.
+    Make a rate-limited HTTP request over a pooled keep-alive session.
+
+    Connection errors, timeouts and retryable statuses are retried up to
+    ``MAX_RETRIES`` times with exponential backoff.
 
     Args:
         url: URL to fetch
         rate_limiter: RateLimiter instance
         headers: Optional headers dict
+        session: Session to use (defaults to the shared session)
+        cache: Optional ResponseCache for conditional GETs (see ``send_request``)
+        stream: Don't download the body up front (for large files)
 
     Returns:
         Response object
@@ -80,11 +372,15 @@ def make_request(
         headers = {}
 
     headers.setdefault("User-Agent", USER_AGENT)
+    session = session or get_session()
 
-    rate_limiter.wait()
-    logger.debug(f"Fetching: {url}")
-
-    response = requests.get(url, headers=headers, timeout=TIMEOUT)
-    response.raise_for_status()
-
-    return response
+    attempt = 0
+    while True:
+        rate_limiter.wait()
+        logger.debug(f"Fetching: {url}")
+        try:
+            return check_response(url, send_request(session, url, headers, cache, stream=stream))
+        except ATTEMPT_ERRORS as e:
+            delay = backoff(attempt, e)
+        time.sleep(delay)
+        attempt += 1
@@ -0,0 +1,217 @@
+"""Long-running polling daemon for the EDGAR current-filings feed."""
+
+import json
+import logging
+import os
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from hootscrapper.config import (
+    DEFAULT_STATUS_PATH,
+    INSERT_BATCH_SIZE,
+    WATCH_MAX_INTERVAL,
+    WATCH_MIN_INTERVAL,
+)
+from hootscrapper.scrapers.sec_edgar import SECEdgarScraper
+from hootscrapper.storage import FilingStorage
+
+logger = logging.getLogger(__name__)
+
+SOURCE = "sec-edgar"
+
+
+def next_interval(
+    interval: float,
+    new_filings: int,
+    min_interval: float = WATCH_MIN_INTERVAL,
+    max_interval: float = WATCH_MAX_INTERVAL,
+) -> float:
+    """
+    Adapt the poll interval to the last cycle's yield.
+
+    A busy cycle halves the interval (down to ``min_interval``), and so does
+    each full feed page of new filings. A quiet cycle grows it by half, up to
+    ``max_interval``, so idle hours cost a request every few minutes.
+
+    Args:
+        interval: Current interval in seconds
+        new_filings: Filings the last cycle inserted
+        min_interval: Lower bound in seconds
+        max_interval: Upper bound in seconds
+
+    Returns:
+        Next interval in seconds
+    """
+    if new_filings:
+        interval /= 2 ** (1 + new_filings // 100)
+    else:
+        interval *= 1.5
+    return min(max(interval, min_interval), max_interval)
+
+
+class Watcher:
+    """
+    Polls the feed on an adaptive schedule until stopped.
+
+    The scraper (with its pooled session and robots.txt cache) and the storage
+    connection live for the whole run, so a cycle costs one or a few feed
+    requests and a small insert. SIGTERM/SIGINT finish the current cycle and
+    return cleanly. After every cycle a JSON status file is rewritten
+    atomically for health checks.
+    """
+
+    def __init__(
+        self,
+        storage: FilingStorage,
+        scraper: Optional[SECEdgarScraper] = None,
+        limit: int = 1000,
+        min_interval: float = WATCH_MIN_INTERVAL,
+        max_interval: float = WATCH_MAX_INTERVAL,
+        status_path: Optional[str] = DEFAULT_STATUS_PATH,
+        batch_size: int = INSERT_BATCH_SIZE,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            storage: Storage to insert into (its connection stays open)
+            scraper: Scraper to poll with (its connections stay warm)
+            limit: Max filings per cycle (the cursor usually stops far earlier)
+            min_interval: Shortest pause between cycles (seconds)
+            max_interval: Longest pause between cycles (seconds)
+            status_path: Health/status JSON file (None to disable)
+            batch_size: Rows per insert transaction
+        """
+        if min_interval > max_interval:
+            raise ValueError("min_interval must not exceed max_interval")
+        self.storage = storage
+        self.scraper = scraper or SECEdgarScraper()
+        self.limit = limit
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.status_path = Path(status_path) if status_path else None
+        self.batch_size = batch_size
+        self.interval = min_interval
+        self._stop = threading.Event()
+        self.status = {
+            "pid": os.getpid(),
+            "state": "starting",
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "cycles": 0,
+            "errors": 0,
+            "total_new": 0,
+            "pages_fetched": 0,
+            "last_new": None,
+            "last_cycle_at": None,
+            "last_success_at": None,
+            "last_error": None,
+            "next_poll_at": None,
+            "interval": self.interval,
+        }
+
+    def stop(self, *_) -> None:
+        """Ask the loop to exit after the current cycle (usable as a signal handler)."""
+        if not self._stop.is_set():
+            logger.info("Stop requested; finishing current cycle")
+        self._stop.set()
+
+    def poll(self) -> int:
+        """
+        Run one scrape cycle and insert what it found.
+
+        Returns:
+            Number of new filings inserted
+        """
+        filings = self.scraper.scrape(
+            limit=self.limit,
+            known=self.storage.existing_accessions,
+            cursor=self.storage.get_cursor(SOURCE),
+        )
+        self.status["pages_fetched"] += self.scraper.pages_fetched
+        if not filings:
+            return 0
+
+        result = self.storage.bulk_insert(filings, batch_size=self.batch_size)
+        newest = next((f for f in filings if f.accession_number), None)
+        if newest is not None:
+            self.storage.set_cursor(SOURCE, newest.accession_number, newest.filing_date)
+        return result.inserted
+
+    def run(self, max_cycles: Optional[int] = None) -> dict:
+        """
+        Poll until stopped by a signal, ``stop()`` or ``max_cycles``.
+
+        Args:
+            max_cycles: Stop after this many cycles (default: run forever)
+
+        Returns:
+            Final status dict
+        """
+        handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                handlers[signum] = signal.signal(signum, self.stop)
+
+        logger.info(
+            f"Watching {SOURCE} (interval {self.min_interval:g}-{self.max_interval:g}s, "
+            f"pid {os.getpid()})"
+        )
+        try:
+            while not self._stop.is_set():
+                self._cycle()
+                if max_cycles is not None and self.status["cycles"] >= max_cycles:
+                    break
+                self._stop.wait(self.interval)
+        finally:
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+            self.status["state"] = "stopped"
+            self.status["next_poll_at"] = None
+            self._write_status()
+            logger.info(
+                f"Watcher stopped after {self.status['cycles']} cycles "
+                f"({self.status['total_new']} new filings)"
+            )
+        return self.status
+
+    def _cycle(self) -> None:
+        """Poll once, adapt the interval and publish the status."""
+        status = self.status
+        status["state"] = "polling"
+        status["last_cycle_at"] = datetime.now(timezone.utc).isoformat()
+        try:
+            new = self.poll()
+        except Exception as e:
+            logger.error(f"Poll failed: {e}")
+            status["errors"] += 1
+            status["last_error"] = f"{type(e).__name__}: {e}"
+            # Back off as if the cycle were quiet
+            new = 0
+        else:
+            status["last_new"] = new
+            status["total_new"] += new
+            status["last_success_at"] = status["last_cycle_at"]
+            if new:
+                logger.info(f"Inserted {new} new filings")
+
+        status["cycles"] += 1
+        self.interval = next_interval(self.interval, new, self.min_interval, self.max_interval)
+        status["interval"] = self.interval
+        status["state"] = "sleeping"
+        status["next_poll_at"] = datetime.fromtimestamp(
+            time.time() + self.interval, timezone.utc
+        ).isoformat()
+        self._write_status()
+
+    def _write_status(self) -> None:
+        """Atomically replace the status file."""
+        if self.status_path is None:
+            return
+        self.status_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.status_path.with_name(self.status_path.name + ".tmp")
+        tmp.write_text(json.dumps(self.status, indent=2))
+        tmp.replace(self.status_path)
@@ -0,0 +1,241 @@
+"""Watchlist of companies polled through their submissions JSON on a schedule."""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+from hootscrapper.config import (
+    INSERT_BATCH_SIZE,
+    WATCHLIST_INTERVAL,
+    WATCHLIST_MAX_INTERVAL,
+    WATCHLIST_MAX_REQUESTS,
+)
+from hootscrapper.models import Filing
+from hootscrapper.scrapers.sec_submissions import SubmissionsSource, latest_filing_date
+from hootscrapper.storage import FilingStorage, InsertResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PollResult:
+    """Outcome of one watchlist poll."""
+
+    polled: int = 0
+    errors: int = 0
+    inserted: int = 0
+    skipped: int = 0
+
+
+def poll_interval(
+    priority: int,
+    last_filing_date: Optional[str],
+    today: date,
+    base: float = WATCHLIST_INTERVAL,
+    max_interval: float = WATCHLIST_MAX_INTERVAL,
+) -> float:
+    """
+    Seconds until a company should be polled again.
+
+    A company that filed within the last week is polled every ``base``
+    seconds; the interval then grows with the days since its last filing
+    (two months of silence means polling about nine times less often).
+    Each priority level divides the interval further.
+
+    Args:
+        priority: Watchlist priority (0 = normal, higher = more often)
+        last_filing_date: Company's latest known filing date (ISO), if any
+        today: Current date
+        base: Interval for active filers at priority 0
+        max_interval: Upper bound
+
+    Returns:
+        Interval in seconds
+    """
+    idle_days = 0
+    if last_filing_date:
+        try:
+            idle_days = (today - date.fromisoformat(last_filing_date)).days
+        except ValueError:
+            pass
+    interval = base * max(1.0, idle_days / 7) / (1 + max(priority, 0))
+    return min(interval, max_interval)
+
+
+class Watchlist:
+    """
+    Companies to track, with a per-company poll schedule.
+
+    Stored in a ``watchlist`` table next to ``filings``. Every poll fetches the
+    companies that are due (highest priority first) up to a request budget,
+    drawing from the source's rate limiter, inserts their new filings in
+    batches and reschedules each company with ``poll_interval``.
+
+    Two dates are kept per company: ``last_filing_date`` is its latest known
+    filing from any source and drives the schedule, while ``poll_since`` is
+    the latest filing date a poll has seen and bounds the next poll. A company
+    is loaded in full on its first successful poll, even if some of its
+    filings were stored before it was added.
+    """
+
+    def __init__(self, storage: FilingStorage):
+        """Initialize watchlist, creating its table if needed."""
+        self.storage = storage
+        with storage.conn as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS watchlist (
+                    cik TEXT PRIMARY KEY,
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    added_at TEXT NOT NULL,
+                    last_polled_at TEXT,
+                    last_filing_date TEXT,
+                    poll_since TEXT,
+                    next_poll_at REAL NOT NULL DEFAULT 0,
+                    last_error TEXT
+                )
+            """)
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(watchlist)")]
+            if "poll_since" not in columns:
+                # Lists from before the poll watermark: companies polled so far resume there
+                conn.execute("ALTER TABLE watchlist ADD COLUMN poll_since TEXT")
+                conn.execute(
+                    "UPDATE watchlist SET poll_since = last_filing_date "
+                    "WHERE last_polled_at IS NOT NULL AND last_error IS NULL"
+                )
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_watchlist_due ON watchlist(next_poll_at)
+            """)
+
+    def add(self, ciks: Iterable[str], priority: int = 0) -> int:
+        """
+        Add companies (or change their priority), due for polling immediately if new.
+
+        Returns:
+            Number of companies added or updated
+        """
+        now = datetime.utcnow().isoformat()
+        rows = [(str(int(cik)), priority, now) for cik in ciks]
+        with self.storage.conn as conn:
+            conn.executemany(
+                "INSERT INTO watchlist (cik, priority, added_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(cik) DO UPDATE SET priority = excluded.priority",
+                rows,
+            )
+        self.refresh_recency()
+        return len(rows)
+
+    def remove(self, ciks: Iterable[str]) -> int:
+        """Remove companies, returning how many were on the list."""
+        with self.storage.conn as conn:
+            return conn.executemany(
+                "DELETE FROM watchlist WHERE cik = ?", [(str(int(cik)),) for cik in ciks]
+            ).rowcount
+
+    def entries(self) -> List[dict]:
+        """Every company on the list, soonest poll first."""
+        cursor = self.storage.conn.execute("""
+            SELECT w.cik, w.priority, w.last_polled_at, w.last_filing_date, w.next_poll_at,
+                   w.last_error,
+                   (SELECT company_name FROM filings f WHERE f.cik = w.cik
+                    ORDER BY filing_date DESC LIMIT 1) AS company_name
+            FROM watchlist w
+            ORDER BY w.next_poll_at, w.priority DESC
+        """)
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def ciks(self) -> List[str]:
+        """CIKs on the list."""
+        return [row[0] for row in self.storage.conn.execute("SELECT cik FROM watchlist")]
+
+    def due(
+        self, limit: int, now: Optional[float] = None
+    ) -> List[Tuple[str, int, Optional[str], Optional[str]]]:
+        """
+        ``(cik, priority, last_filing_date, poll_since)`` of companies due for a poll.
+
+        Most urgent first.
+        """
+        return self.storage.conn.execute(
+            "SELECT cik, priority, last_filing_date, poll_since FROM watchlist "
+            "WHERE next_poll_at <= ? ORDER BY priority DESC, next_poll_at LIMIT ?",
+            (time.time() if now is None else now, limit),
+        ).fetchall()
+
+    def refresh_recency(self) -> None:
+        """Set each company's latest filing date from the stored filings (an index lookup each)."""
+        with self.storage.conn as conn:
+            conn.execute("""
+                UPDATE watchlist SET last_filing_date = COALESCE(
+                    (SELECT MAX(filing_date) FROM filings WHERE filings.cik = watchlist.cik),
+                    last_filing_date
+                )
+            """)
+
+    def poll(
+        self,
+        source: SubmissionsSource,
+        max_requests: int = WATCHLIST_MAX_REQUESTS,
+        batch_size: int = INSERT_BATCH_SIZE,
+    ) -> PollResult:
+        """
+        Fetch due companies and insert their new filings.
+
+        Only filings dated on or after the latest one the company's previous
+        poll saw reach the insert, so a poll of an unchanged company writes
+        nothing; a company never polled successfully is loaded in full.
+
+        Args:
+            source: Submissions source (its rate limiter paces the requests)
+            max_requests: Max companies fetched in this poll
+            batch_size: Rows per insert transaction
+
+        Returns:
+            PollResult with companies polled, errors and insert counts
+        """
+        result = PollResult()
+        schedule: List[tuple] = []
+        today = datetime.utcnow().date()
+
+        def filings() -> Iterator[Filing]:
+            for cik, priority, last_filing_date, poll_since in self.due(max_requests):
+                polled_at = datetime.utcnow().isoformat()
+                error = None
+                try:
+                    document = source.fetch(cik)
+                    # Materialized here so history-file fetch errors are caught too
+                    new = list(source.iter_document(document, since=poll_since))
+                except (requests.RequestException, PermissionError, ValueError) as e:
+                    logger.warning(f"CIK {cik}: {e}")
+                    result.errors += 1
+                    error = str(e)
+                else:
+                    yield from new
+                    poll_since = latest_filing_date(document) or poll_since
+                    last_filing_date = max(
+                        filter(None, (last_filing_date, poll_since)), default=None
+                    )
+                result.polled += 1
+                interval = poll_interval(priority, last_filing_date, today)
+                schedule.append(
+                    (polled_at, last_filing_date, poll_since, time.time() + interval, error, cik)
+                )
+
+        inserted: InsertResult = self.storage.bulk_insert(filings(), batch_size=batch_size)
+        with self.storage.conn as conn:
+            conn.executemany(
+                "UPDATE watchlist SET last_polled_at = ?, last_filing_date = ?, poll_since = ?, "
+                "next_poll_at = ?, last_error = ? WHERE cik = ?",
+                schedule,
+            )
+        result.inserted = inserted.inserted
+        result.skipped = inserted.skipped
+        logger.info(
+            f"Polled {result.polled} watchlist companies: {result.inserted} new filings "
+            f"({result.errors} errors)"
+        )
+        return result
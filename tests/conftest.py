@@ -0,0 +1,74 @@
+"""Shared test fixtures."""
+
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tests.helpers import feed_page
+
+
+class FakeEdgar:
+    """State for the local EDGAR stand-in server."""
+
+    def __init__(self):
+        self.total = 0
+        self.requests = []
+        self.failures = {}  # path -> list of statuses to return before succeeding
+        self.routes = {}  # path -> bytes
+        self.headers = {}  # path -> extra response headers (an ETag enables 304s)
+        self.url = ""
+
+    def feed_url(self) -> str:
+        return self.url + "/cgi-bin/browse-edgar?action=getcurrent&start={start}&count={count}"
+
+
+@pytest.fixture
+def edgar_server():
+    """Run a local HTTP server that serves a paginated getcurrent feed."""
+    state = FakeEdgar()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state.requests.append(self.path)
+            pending = state.failures.get(self.path)
+            if pending:
+                self.send_response(pending.pop(0))
+                self.end_headers()
+                return
+
+            if self.path in state.routes:
+                body = state.routes[self.path]
+            elif "action=getcurrent" in self.path:
+                start = int(re.search(r"start=(\d+)", self.path).group(1))
+                body = feed_page(start, max(0, min(100, state.total - start)))
+            else:
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            headers = state.headers.get(self.path, {})
+            etag = headers.get("ETag")
+            if etag and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    state.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield state
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,9 @@
+"""Helpers shared by several test modules."""
+
+
+def feed_page(start: int, count: int) -> bytes:
+    """Build a fake getcurrent page with ``count`` rows numbered from ``start``."""
+    rows = "".join(f"""<tr><td>8-K</td>
+        <td><a href="/cgi-bin/browse-edgar?action=getcompany&CIK=000{n:07d}&accession-number=000{n:07d}-26-{n:06d}">Corp {n}</a></td>
+        <td></td><td>2026-02-06</td><td></td></tr>""" for n in range(start, start + count))
+    return f'<html><table class="tableFile2"><tr><th>h</th></tr>{rows}</table></html>'.encode()
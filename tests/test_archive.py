@@ -0,0 +1,49 @@
+"""Test the raw-page archive and offline replay."""
+
+from hootscrapper.archive import PageArchive, replay
+from hootscrapper.scrapers import sec_edgar
+from hootscrapper.scrapers.sec_edgar import SECEdgarScraper
+from hootscrapper.storage import FilingStorage
+from tests.helpers import feed_page
+
+
+def test_archive_deduplicates_bodies(tmp_path):
+    """Test identical bodies are stored once and unchanged refetches are not re-recorded."""
+    archive = PageArchive(str(tmp_path / "archive.sqlite"))
+    body = feed_page(0, 3)
+
+    digest = archive.put("https://example.test/a", body, fetched_at="2026-02-06T10:00:00")
+    archive.put("https://example.test/a", body, fetched_at="2026-02-06T11:00:00")
+    archive.put("https://example.test/b", body)
+
+    stats = archive.stats()
+    assert stats["blobs"] == 1 and stats["pages"] == 2
+    assert archive.get(digest) == body
+    assert next(archive.iter_pages()).fetched_at == "2026-02-06T10:00:00"
+
+
+def test_scrape_archives_pages_and_replay_matches(edgar_server, monkeypatch, tmp_path):
+    """Test a replay reproduces the scraped filings without any requests."""
+    edgar_server.total = 250
+    monkeypatch.setattr(sec_edgar, "SEC_CURRENT_URL", edgar_server.feed_url())
+    archive = PageArchive(str(tmp_path / "archive.sqlite"))
+
+    scraped = SECEdgarScraper(delay=0, archive=archive).scrape(limit=1000)
+
+    assert archive.stats()["pages"] == 3
+    # The short third page ends the crawl without a request for a fourth
+    assert [path for path in edgar_server.requests if "start=" in path] == [
+        f"/cgi-bin/browse-edgar?action=getcurrent&start={start}&count=100"
+        for start in (0, 100, 200)
+    ]
+    requests_before = len(edgar_server.requests)
+
+    with FilingStorage(str(tmp_path / "replay.sqlite")) as storage:
+        result = replay(archive, storage, workers=2, batch_size=100)
+        replayed = {row["accession_number"]: row for row in storage.iter_filings()}
+
+    assert result.inserted == len(scraped) == 250
+    assert len(edgar_server.requests) == requests_before
+    fetched_at = {page.fetched_at for page in archive.iter_pages()}
+    assert {row["scraped_at"] for row in replayed.values()} <= fetched_at
+    assert set(replayed) == {f.accession_number for f in scraped}
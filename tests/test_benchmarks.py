@@ -0,0 +1,26 @@
+"""Smoke-test the benchmark harness at a tiny size."""
+
+from benchmarks.compare import compare
+from benchmarks.run import parse_size, run
+
+
+def test_run_produces_comparable_results(tmp_path):
+    """Every section reports its metrics, and compare flags a slowdown."""
+    assert parse_size("10k") == 10_000 and parse_size("1m") == 1_000_000
+
+    results = run(
+        [500], ["fetch", "parse", "insert", "export", "summary"], tmp_path, feed_pages=2, repeat=1
+    )
+
+    assert results["fetch"]["sync"]["pages"] == 2
+    assert results["fetch"]["async"]["filings_per_sec"] > 0
+    assert results["fetch"]["full_index"]["rows"] > 0
+    assert results["parse"]["rows_per_page"] == 100
+    size = results["sizes"]["500"]
+    assert size["insert"]["rows"] == 500
+    assert size["export"]["rows"] == 500
+    assert size["summary"]["summary_ms"] >= 0
+
+    slower = {"parse": {"lxml_rows_per_sec": results["parse"]["lxml_rows_per_sec"] / 2}}
+    rows = {row[0]: row for row in compare(results, slower, threshold=0.15)}
+    assert rows["parse.lxml_rows_per_sec"][4] is True
@@ -0,0 +1,55 @@
+"""Test the conditional-GET response cache."""
+
+import os
+
+from hootscrapper.cache import ResponseCache
+from hootscrapper.utils import RateLimiter, make_request
+
+
+def test_not_modified_served_from_cache(edgar_server, monkeypatch, tmp_path):
+    """Test a 304 response is filled with the cached body, or refetched if it is gone."""
+    edgar_server.routes["/feed"] = b"<html>page</html>"
+    edgar_server.headers["/feed"] = {"ETag": '"abc"'}
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    url = edgar_server.url + "/feed"
+
+    first = make_request(url, RateLimiter(delay=0), cache=cache)
+    second = make_request(url, RateLimiter(delay=0), cache=cache)
+
+    assert first.status_code == 200 and not first.from_cache
+    assert second.status_code == 304 and second.from_cache
+    assert second.content == b"<html>page</html>"
+    assert cache.stats()["hits"] == 1
+
+    # Body evicted between reading the validators and the 304
+    monkeypatch.setattr(cache, "get", lambda url: None)
+    third = make_request(url, RateLimiter(delay=0), cache=cache)
+    assert third.status_code == 200 and not third.from_cache
+    assert third.content == b"<html>page</html>"
+    assert edgar_server.requests.count("/feed") == 4
+
+
+def test_responses_without_validators_not_cached(edgar_server, tmp_path):
+    """Test responses that cannot be revalidated are not stored."""
+    edgar_server.routes["/plain"] = b"data"
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+
+    make_request(edgar_server.url + "/plain", RateLimiter(delay=0), cache=cache)
+
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_and_purge(edgar_server, tmp_path):
+    """Test least recently used entries are evicted past the size bound."""
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), max_bytes=2500)
+    for i in range(3):
+        edgar_server.routes[f"/p{i}"] = os.urandom(1200)  # incompressible
+        edgar_server.headers[f"/p{i}"] = {"ETag": f'"{i}"'}
+        make_request(f"{edgar_server.url}/p{i}", RateLimiter(delay=0), cache=cache)
+
+    assert cache.stats()["entries"] == 2
+    assert cache.get(f"{edgar_server.url}/p0") is None
+    assert cache.get(f"{edgar_server.url}/p2") is not None
+
+    assert cache.purge() == 2
+    assert cache.stats()["entries"] == 0
@@ -1,6 +1,9 @@
 """Test CLI commands."""
 
 import subprocess
+import sys
+
+from hootscrapper.cli import parse_importtime
 
 
 def test_cli_help():
@@ -15,3 +18,55 @@ def test_cli_scrape_help():
     result = subprocess.run(["hoot", "scrape", "--help"], capture_output=True, text=True)
     assert result.returncode == 0
     assert "scrape" in result.stdout.lower()
+
+
+def test_short_commands_skip_scraping_stack(tmp_path):
+    """Test summary loads neither the HTTP client nor the HTML parsers."""
+    result = subprocess.run(
+        ["hoot", "--import-profile", "summary", "--db", str(tmp_path / "hoot.db")],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
+    assert "Total filings: 0" in result.stdout
+    assert "Import profile" in result.stderr
+
+    profiled = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "hootscrapper.cli", "--help"],
+        capture_output=True,
+        text=True,
+    )
+    modules = {name for name, *_ in parse_importtime(profiled.stderr.splitlines())}
+    assert "hootscrapper.config" in modules
+    assert not modules & {"bs4", "lxml", "requests", "hootscrapper.storage"}
+
+    profiled = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-m",
+            "hootscrapper.cli",
+            "summary",
+            "--db",
+            str(tmp_path / "hoot.db"),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    modules = {name for name, *_ in parse_importtime(profiled.stderr.splitlines())}
+    assert "hootscrapper.storage" in modules
+    assert not modules & {"bs4", "lxml", "requests"}
+
+
+def test_single_database_commands_reject_shard_directories(tmp_path):
+    """Test commands without shard support exit with an error instead of a traceback."""
+    shards = str(tmp_path / "shards")
+    assert subprocess.run(["hoot", "shards", "init", "--db", shards]).returncode == 0
+
+    result = subprocess.run(
+        ["hoot", "search", "apple", "--db", shards], capture_output=True, text=True
+    )
+    assert result.returncode == 1
+    assert "does not support shard directories" in result.stderr
+    assert "Traceback" not in result.stderr
@@ -0,0 +1,148 @@
+"""Test the compact schema and the migration to it."""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+from hootscrapper import compact
+from hootscrapper.config import SEC_ARCHIVES_URL
+from hootscrapper.models import Filing
+from hootscrapper.search import search
+from hootscrapper.storage import FilingQuery, FilingStorage
+
+TODAY = datetime.utcnow().date()
+
+
+def _filings(count: int, start: int = 0) -> list:
+    """Filings covering every URL template, plus values that can't be packed."""
+    filings = []
+    for n in range(start, start + count):
+        cik = str(1000 + n % 7)
+        accession = f"{int(cik):010d}-26-{n:06d}"
+        folder = accession.replace("-", "")
+        url = [
+            "",
+            f"{SEC_ARCHIVES_URL}/edgar/data/{cik}/{accession}.txt",
+            f"{SEC_ARCHIVES_URL}/edgar/data/{cik}/{folder}/{accession}-index.htm",
+            f"{SEC_ARCHIVES_URL}/edgar/data/{cik}/{folder}/doc{n}.htm",
+            "https://example.com/elsewhere",
+            None,
+        ][n % 6]
+        filings.append(
+            Filing(
+                cik=cik,
+                company_name=f"Corp {n % 7}" + (" Holdings" if n % 11 == 0 else ""),
+                filing_type=["8-K", "10-K", "4"][n % 3],
+                filing_date=(TODAY - timedelta(days=n % 40)).isoformat(),
+                accession_number=accession if n % 13 else f"ODD-{n}",
+                document_url=url,
+                scraped_at="2026-02-06T12:00:00" if n % 5 else f"2026-02-06T12:00:00.{n:06d}",
+            )
+        )
+    return filings
+
+
+def _reads(storage: FilingStorage) -> dict:
+    return {
+        "all": [
+            {k: v for k, v in row.items() if k != "created_at"} for row in storage.get_all_filings()
+        ],
+        "summary": storage.get_summary(),
+        "window": storage.get_summary(days=7),
+        "query": [dict(r) for r in storage.query(FilingQuery(cik="1003", filing_types=["4"]))],
+        "search": [r["id"] for r in search(storage, "holdings").results],
+    }
+
+
+def test_compact_schema_round_trips(tmp_path):
+    """Test both write paths store every column compactly and read back unchanged."""
+    assert compact.unpack_accession(compact.pack_accession("0000320193-26-000001")) == (
+        "0000320193-26-000001"
+    )
+    assert compact.pack_accession("0000320193-26-000001") == 32019326000001
+    assert compact.pack_timestamp("2026-02-06T12:00:00.000100") == 1770379200000100
+    assert compact.pack_timestamp("2026-02-06 12:00") == "2026-02-06 12:00"
+
+    filings = _filings(60)
+    with FilingStorage(str(tmp_path / "wide.db"), schema="wide") as wide:
+        wide.insert_filings(filings)
+        expected = _reads(wide)
+
+    with FilingStorage(str(tmp_path / "compact.db"), schema="compact") as storage:
+        assert storage.compact
+        # Python path for half the rows, the view's INSTEAD OF trigger for the rest
+        assert storage.insert_filings(filings[:30]) == 30
+        with storage.conn:
+            storage.conn.executemany(
+                "INSERT INTO filings (cik, company_name, filing_type, filing_date, "
+                "accession_number, document_url, scraped_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [tuple(vars(f).values()) for f in filings[30:]],
+            )
+        assert _reads(storage) == expected
+        assert storage.insert_filings(filings[25:35]) == 0
+        assert storage.existing_accessions(["0001001-missing", filings[1].accession_number]) == {
+            filings[1].accession_number
+        }
+
+        kinds = dict(
+            storage.conn.execute(
+                "SELECT url_kind, COUNT(*) FROM filing_rows GROUP BY url_kind"
+            ).fetchall()
+        )
+        # URLs of the unpackable accession numbers don't match their templates
+        assert kinds == {None: 23, 0: 10, 1: 9, 2: 9, 3: 9}
+        texts = storage.conn.execute(
+            "SELECT COUNT(*) FROM filing_rows WHERE typeof(accession) = 'text'"
+        ).fetchone()[0]
+        assert texts == 5
+
+
+def test_migration_is_resumable_and_keeps_readers_working(tmp_path):
+    """Test an interrupted migration resumes, mirrors writes made meanwhile, and swaps in the view."""
+    path = str(tmp_path / "hoot.sqlite")
+    with FilingStorage(path, schema="wide") as storage:
+        storage.insert_filings(_filings(100))
+        # A migration that stopped after the first batch, followed by regular writes
+        cursor = storage.conn.cursor()
+        compact.create_tables(cursor)
+        compact.create_sync_triggers(cursor)
+        with storage.conn:
+            compact.copy_batch(cursor, 0, 40)
+        with storage.conn:
+            storage.conn.execute("UPDATE filings SET filing_type = '8-K/A' WHERE id <= 3")
+            storage.conn.execute("DELETE FROM filings WHERE id IN (4, 90)")
+        storage.insert_filings(_filings(10, start=100))
+        expected = _reads(storage)
+
+        writer = FilingStorage(path)  # a scrape that keeps running through the migration
+        assert not writer.compact
+        assert storage.migrate_to_compact(batch_size=25) == 108 - 39
+        assert storage.compact and _reads(storage) == expected
+        assert storage.migrate_to_compact() == 0
+
+    with FilingStorage(path, read_only=True) as storage:
+        assert storage.compact and _reads(storage) == expected
+
+    # Writes after the migration, from a writer opened before it too, keep ids,
+    # counters and the search index in step
+    with writer as storage:
+        result = storage.bulk_insert(_filings(5, start=105) + _filings(5, start=200), upsert=True)
+        assert (result.inserted, result.updated) == (5, 5)
+        assert storage.conn.execute("SELECT MIN(id) FROM filings WHERE id > 110").fetchone()[0]
+        with storage.conn:
+            storage.conn.execute(
+                "UPDATE filings SET company_name = 'Renamed Holdings' WHERE id = 1"
+            )
+            storage.conn.execute("DELETE FROM filings WHERE filing_type = '4'")
+        counters = dict(storage.conn.execute("SELECT filing_type, count FROM summary_by_type"))
+        storage.rebuild_summary()
+        assert counters == dict(
+            storage.conn.execute("SELECT filing_type, count FROM summary_by_type")
+        )
+        assert [r["company_name"] for r in search(storage, "renamed").results] == [
+            "Renamed Holdings"
+        ]
+
+    # Plain sqlite3 clients (notebooks) can read the view
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT COUNT(*) FROM filings").fetchone()[0] == sum(counters.values())
+    conn.close()
@@ -0,0 +1,103 @@
+"""Test the filing detail enrichment stage."""
+
+import time
+
+from hootscrapper import enrich
+from hootscrapper.enrich import Enricher, detail_url, parse_detail_page
+from hootscrapper.scrapers.sec_edgar import Filing, SECEdgarScraper
+from hootscrapper.storage import FilingStorage
+
+DETAIL_PAGE = b"""<html><body>
+<div class="formContent">
+  <div class="formGrouping">
+    <div class="infoHead">Filing Date</div><div class="info">2026-02-06</div>
+    <div class="infoHead">Period of Report</div><div class="info">2025-12-31</div>
+  </div>
+</div>
+<table class="tableFile" summary="Document Format Files">
+  <tr><th>Seq</th><th>Description</th><th>Document</th><th>Type</th><th>Size</th></tr>
+  <tr><td>1</td><td>10-K</td><td><a href="/Archives/edgar/data/1/x/main.htm">main.htm</a></td>
+      <td>10-K</td><td>1,234</td></tr>
+  <tr><td>2</td><td>EX-21</td><td><a href="/Archives/edgar/data/1/x/ex21.htm">ex21.htm</a></td>
+      <td>EX-21</td><td>100</td></tr>
+  <tr><td>&nbsp;</td><td>Complete submission text file</td>
+      <td><a href="/Archives/edgar/data/1/x/full.txt">full.txt</a></td><td>&nbsp;</td><td>5,000</td></tr>
+</table>
+<div class="companyInfo"><p class="identInfo">State of Incorp.: DE | SIC:
+  <a href="/cgi-bin/browse-edgar?action=getcompany&amp;SIC=3571&amp;owner=include">3571</a>
+</p></div>
+</body></html>"""
+
+
+def test_parse_detail_page():
+    """Test period, primary document, sizes and SIC are extracted."""
+    detail = parse_detail_page(DETAIL_PAGE, "0000000001-26-000001", "https://www.sec.gov")
+
+    assert detail.period_of_report == "2025-12-31"
+    assert detail.primary_document_url == "https://www.sec.gov/Archives/edgar/data/1/x/main.htm"
+    assert detail.primary_document_size == 1234
+    assert detail.total_size == 5000
+    assert detail.document_count == 2
+    assert detail.sic == "3571"
+
+
+def _store(tmp_path, count: int) -> FilingStorage:
+    storage = FilingStorage(str(tmp_path / "hoot.sqlite"))
+    storage.bulk_insert(
+        Filing(
+            cik=str(n),
+            company_name=f"Corp {n}",
+            filing_type="10-K",
+            filing_date="2026-02-06",
+            accession_number=f"{n:010d}-26-{n:06d}",
+            document_url="",
+            scraped_at="2026-02-06T00:00:00",
+        )
+        for n in range(1, count + 1)
+    )
+    return storage
+
+
+def test_enrich_resumes_and_retries(edgar_server, monkeypatch, tmp_path):
+    """Test interrupted claims are resumed and failed pages are retried, then given up."""
+    template = edgar_server.url + "/Archives/edgar/data/{cik}/{folder}/{accession}-index.htm"
+    monkeypatch.setattr(enrich, "SEC_FILING_INDEX_URL", template)
+    storage = _store(tmp_path, 6)
+    for n in range(1, 6):
+        path = detail_url(str(n), f"{n:010d}-26-{n:06d}")[len(edgar_server.url) :]
+        edgar_server.routes[path] = DETAIL_PAGE
+    # Filing 6 has no detail page (404 fails immediately)
+
+    scraper = SECEdgarScraper(delay=0)
+    enricher = Enricher(storage, scraper, workers=3)
+    assert enricher.enqueue() == 6
+    assert enricher.enqueue() == 0
+
+    first = enricher.run(limit=2)
+    assert first.enriched == 2
+
+    # A fresh claim may be another run's work in progress and is left alone
+    with storage.conn:
+        storage.conn.execute(
+            "UPDATE enrich_queue SET status = 'running', updated_at = ? "
+            "WHERE accession_number = '0000000003-26-000003'",
+            (time.time(),),
+        )
+    assert enricher._claim(10) and enricher.counts()["running"] == 4
+    assert enricher.run().enriched == 0
+    assert enricher.counts()["running"] == 4
+
+    # Simulate a crash: the claims left behind have gone stale
+    with storage.conn:
+        storage.conn.execute(
+            "UPDATE enrich_queue SET updated_at = updated_at - ? WHERE status = 'running'",
+            (enricher.claim_timeout + 1,),
+        )
+
+    second = enricher.run()
+    assert second.enriched == 3 and second.failed == 1
+    assert enricher.counts() == {"pending": 0, "running": 0, "done": 5, "failed": 1}
+
+    rows = storage.conn.execute("SELECT COUNT(*), MIN(sic) FROM filing_details").fetchone()
+    assert rows == (5, "3571")
+    storage.close()
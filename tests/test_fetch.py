@@ -0,0 +1,102 @@
+"""Test HTTP fetching: retries, pooling and the async engine."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from hootscrapper import utils
+from hootscrapper.fetch import AsyncFetcher
+from hootscrapper.scrapers import sec_edgar
+from hootscrapper.scrapers.sec_edgar import SECEdgarScraper
+from hootscrapper.utils import RateLimiter, SharedTokenBucket, make_request
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    """Keep retry backoff short in tests."""
+    monkeypatch.setattr(utils, "RETRY_BACKOFF", 0.01)
+
+
+def test_make_request_retries_transient_errors(edgar_server):
+    """Test that 503s are retried and the eventual 200 is returned."""
+    edgar_server.routes["/page"] = b"ok"
+    edgar_server.failures["/page"] = [503, 503]
+
+    response = make_request(edgar_server.url + "/page", RateLimiter(delay=0))
+
+    assert response.content == b"ok"
+    assert edgar_server.requests.count("/page") == 3
+
+
+def test_make_request_gives_up_after_max_retries(edgar_server):
+    """Test that persistent failures raise after MAX_RETRIES retries."""
+    edgar_server.failures["/down"] = [503] * 10
+
+    with pytest.raises(requests.HTTPError):
+        make_request(edgar_server.url + "/down", RateLimiter(delay=0))
+
+    assert edgar_server.requests.count("/down") == utils.MAX_RETRIES + 1
+
+
+def test_async_fetch_all_preserves_order(edgar_server):
+    """Test concurrent fetches return responses in input order."""
+    for i in range(10):
+        edgar_server.routes[f"/p{i}"] = str(i).encode()
+
+    async def run():
+        fetcher = AsyncFetcher(RateLimiter(delay=0), concurrency=4)
+        try:
+            return await fetcher.fetch_all(f"{edgar_server.url}/p{i}" for i in range(10))
+        finally:
+            fetcher.close()
+
+    responses = asyncio.run(run())
+    assert [r.content for r in responses] == [str(i).encode() for i in range(10)]
+
+
+def test_scrape_with_async_engine(edgar_server, monkeypatch):
+    """Test the async engine yields the same pages as the sync engine."""
+    edgar_server.total = 350
+    monkeypatch.setattr(sec_edgar, "SEC_CURRENT_URL", edgar_server.feed_url())
+
+    sync = SECEdgarScraper(delay=0).scrape(limit=1000)
+    async_ = SECEdgarScraper(delay=0, engine="async", concurrency=3).scrape(limit=1000)
+
+    assert len(async_) == 350
+    assert [f.accession_number for f in async_] == [f.accession_number for f in sync]
+
+
+def test_rate_limiter_allows_burst_then_throttles():
+    """Test the token bucket serves a burst immediately, then paces requests."""
+    limiter = RateLimiter(delay=0.1, burst=3)
+
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.02)
+    assert limiter.reserve() == pytest.approx(0.2, abs=0.02)
+
+
+def test_rate_limiter_is_thread_safe():
+    """Test concurrent reservations each get a distinct slot."""
+    limiter = RateLimiter(delay=0.01, burst=1)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        waits = sorted(pool.map(lambda _: limiter.reserve(), range(40)))
+
+    assert waits[0] == 0.0
+    assert waits[-1] == pytest.approx(0.39, abs=0.05)
+    assert len({round(w, 3) for w in waits}) == 40
+
+
+def test_shared_token_bucket_spans_limiters(tmp_path):
+    """Test two limiters backed by one file draw from a single budget."""
+    path = str(tmp_path / "ratelimit.sqlite")
+    a = RateLimiter(delay=0.1, burst=2, backend=SharedTokenBucket(path, "sec"))
+    b = RateLimiter(delay=0.1, burst=2, backend=SharedTokenBucket(path, "sec"))
+
+    waits = [a.reserve(), b.reserve(), a.reserve(), b.reserve()]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1, abs=0.02)
+    assert waits[3] == pytest.approx(0.2, abs=0.02)
@@ -0,0 +1,62 @@
+"""Test the EDGAR full-index source."""
+
+import gzip
+import zipfile
+
+from hootscrapper.scrapers.sec_full_index import FullIndexSource, parse_index_lines
+
+MASTER_IDX = """Description:           Master Index of EDGAR Dissemination Feed
+Last Data Received:    March 31, 2023
+Comments:              webmaster@sec.gov
+Anonymous FTP:         ftp://ftp.sec.gov/edgar/
+
+
+
+
+CIK|Company Name|Form Type|Date Filed|Filename
+--------------------------------------------------------------------------------
+1000045|NICHOLAS FINANCIAL INC|10-Q|2023-02-14|edgar/data/1000045/0000950170-23-003606.txt
+1000097|KINGDON CAPITAL MANAGEMENT, L.L.C.|SC 13G/A|2023-02-14|edgar/data/1000097/0000919574-23-001083.txt
+"""
+
+FORM_IDX = """Description:           Daily Index of EDGAR Dissemination Feed by Form Type
+
+Form Type   Company Name                                                  CIK         Date Filed  File Name
+---------------------------------------------------------------------------------------------------------------------------------------------
+10-Q        NICHOLAS FINANCIAL INC                                        1000045     2023-02-14  edgar/data/1000045/0000950170-23-003606.txt
+SC 13G/A    KINGDON CAPITAL MANAGEMENT, L.L.C.                            1000097     20230214    edgar/data/1000097/0000919574-23-001083.txt
+"""
+
+
+def test_parse_master_idx():
+    """Test pipe-delimited master.idx rows become filings."""
+    filings = list(parse_index_lines(MASTER_IDX.splitlines(), scraped_at="now"))
+
+    assert len(filings) == 2
+    assert filings[0].cik == "1000045"
+    assert filings[0].accession_number == "0000950170-23-003606"
+    assert filings[0].document_url.endswith("/Archives/edgar/data/1000045/0000950170-23-003606.txt")
+    assert filings[1].filing_type == "SC 13G/A"
+
+
+def test_parse_form_idx_matches_master():
+    """Test fixed-width form.idx parses to the same filings (incl. spaced form types)."""
+    master = list(parse_index_lines(MASTER_IDX.splitlines(), scraped_at="now"))
+    form = list(parse_index_lines(FORM_IDX.splitlines(), scraped_at="now"))
+
+    assert form == master
+
+
+def test_iter_directory_reads_plain_gzip_and_zip(tmp_path):
+    """Test a local mirror with mixed compression is streamed in full."""
+    (tmp_path / "2023" / "QTR1").mkdir(parents=True)
+    (tmp_path / "2023" / "QTR1" / "master.idx").write_text(MASTER_IDX)
+    with gzip.open(tmp_path / "2023" / "QTR2.gz", "wt") as f:
+        f.write(MASTER_IDX.replace("-23-", "-24-"))
+    with zipfile.ZipFile(tmp_path / "2023" / "QTR3.zip", "w") as z:
+        z.writestr("form.idx", FORM_IDX.replace("-23-", "-25-"))
+
+    filings = list(FullIndexSource().iter_directory(str(tmp_path)))
+
+    assert len(filings) == 6
+    assert len({f.accession_number for f in filings}) == 6
@@ -0,0 +1,76 @@
+"""Test run metrics: recording, reports and the Prometheus exposition."""
+
+import json
+
+import pytest
+
+from hootscrapper import metrics, utils
+from hootscrapper.metrics import Registry
+from hootscrapper.scrapers import sec_edgar
+from hootscrapper.scrapers.sec_edgar import SECEdgarScraper
+from hootscrapper.storage import FilingStorage
+
+
+@pytest.fixture
+def recording():
+    """Enable the process-wide registry for one test."""
+    metrics.REGISTRY.reset()
+    metrics.enable()
+    yield metrics.REGISTRY
+    metrics.REGISTRY.enabled = False
+    metrics.REGISTRY.reset()
+
+
+def test_registry_records_only_when_enabled():
+    """Test a disabled registry drops updates and an enabled one renders them."""
+    registry = Registry()
+    registry.inc("hoot_rows_inserted_total", 5)
+    with registry.timer("hoot_parse_seconds", parser="lxml"):
+        pass
+    assert registry.snapshot()["counters"] == {}
+    assert registry.snapshot()["histograms"] == {}
+
+    registry.enabled = True
+    registry.inc("hoot_http_requests_total", status="200")
+    registry.inc("hoot_http_requests_total", 2, status="200")
+    for seconds in (0.002, 0.003, 0.2):
+        registry.observe("hoot_parse_seconds", seconds, parser="lxml")
+
+    snapshot = registry.snapshot()
+    assert snapshot["counters"] == {'hoot_http_requests_total{status="200"}': 3}
+    histogram = snapshot["histograms"]['hoot_parse_seconds{parser="lxml"}']
+    assert histogram["count"] == 3 and histogram["p50"] == 0.005 and histogram["max"] == 0.2
+
+    text = registry.to_prometheus()
+    assert "# TYPE hoot_parse_seconds histogram" in text
+    assert 'hoot_parse_seconds_bucket{parser="lxml",le="0.005"} 2' in text
+    assert 'hoot_parse_seconds_bucket{parser="lxml",le="+Inf"} 3' in text
+    assert 'hoot_http_requests_total{status="200"} 3' in text
+
+
+def test_scrape_and_insert_are_instrumented(edgar_server, monkeypatch, recording, tmp_path):
+    """Test fetches, retries, parsing and inserts all land in the report."""
+    monkeypatch.setattr(utils, "RETRY_BACKOFF", 0.01)
+    monkeypatch.setattr(sec_edgar, "SEC_CURRENT_URL", edgar_server.feed_url())
+    edgar_server.total = 150
+    edgar_server.failures["/cgi-bin/browse-edgar?action=getcurrent&start=0&count=100"] = [503]
+
+    filings = SECEdgarScraper(delay=0).scrape(limit=150)
+    with FilingStorage(str(tmp_path / "test.db")) as storage:
+        storage.insert_filings(filings + filings[:10])
+
+    report_path = tmp_path / "metrics.json"
+    recording.write_report(str(report_path), command="scrape")
+    report = json.loads(report_path.read_text())
+    counters = report["counters"]
+
+    assert report["command"] == "scrape"
+    assert counters["hoot_http_retries_total"] == 1
+    assert counters['hoot_http_requests_total{status="503"}'] == 1
+    assert counters["hoot_http_bytes_total"] > 0
+    assert counters['hoot_rows_parsed_total{parser="lxml"}'] == 150
+    assert counters["hoot_rows_inserted_total"] == 150
+    assert counters["hoot_rows_skipped_total"] == 10
+    assert report["histograms"]["hoot_http_request_seconds"]["count"] >= 3
+    assert report["histograms"]["hoot_ratelimit_wait_seconds"]["sum"] == 0
+    assert report["histograms"]["hoot_insert_batch_seconds"]["count"] == 1
@@ -1,6 +1,13 @@
 """Test SEC EDGAR parser."""
 
-from hootscrapper.scrapers.sec_edgar import Filing
+import re
+
+import pytest
+
+from hootscrapper.robots import RobotsCache
+from hootscrapper.scrapers import sec_edgar
+from hootscrapper.scrapers.sec_edgar import Filing, SECEdgarScraper
+from tests.helpers import feed_page
 
 
 def test_filing_dataclass():
@@ -19,3 +26,124 @@ def test_filing_dataclass():
     assert filing.company_name == "Test Corp"
     assert filing.filing_type == "10-K"
     assert filing.accession_number == "0001234567-26-000001"
+
+
+def _fake_feed(monkeypatch, total: int, truncate_first_row: bool = False) -> list:
+    """Serve a ``total``-row feed through make_request and record requested offsets."""
+    requested = []
+
+    class FakeResponse:
+        def __init__(self, content):
+            self.content = content
+
+    def fake_request(url, rate_limiter, headers=None, cache=None):
+        start = int(re.search(r"start=(\d+)", url).group(1))
+        requested.append(start)
+        page = feed_page(start, max(0, min(100, total - start)))
+        if truncate_first_row:
+            # Leave each page's first row with two columns, which the parser skips
+            page = page.replace(b"<td></td><td>2026-02-06</td><td></td>", b"", 1)
+        return FakeResponse(page)
+
+    monkeypatch.setattr(sec_edgar, "make_request", fake_request)
+    monkeypatch.setattr(RobotsCache, "can_fetch", lambda self, url: True)
+    return requested
+
+
+def test_scrape_follows_pagination(monkeypatch):
+    """Test that the scraper pages past the first 100 rows."""
+    requested = _fake_feed(monkeypatch, total=250)
+
+    scraper = SECEdgarScraper(delay=0)
+    filings = scraper.scrape(limit=1000)
+
+    assert len(filings) == 250
+    assert filings[1].cik == "1"
+    assert filings[-1].accession_number == "0000000249-26-000249"
+    assert requested == [0, 100, 200]
+    assert scraper.pages_fetched == 3
+
+
+def test_scrape_pages_past_a_skipped_row(monkeypatch):
+    """Test a full page with an unparseable row does not end the crawl."""
+    requested = _fake_feed(monkeypatch, total=250, truncate_first_row=True)
+
+    filings = SECEdgarScraper(delay=0).scrape(limit=1000)
+
+    assert requested == [0, 100, 200]
+    assert len(filings) == 247
+
+
+def test_scrape_stops_at_known_accession(monkeypatch):
+    """Test that the crawl stops at the first already-stored filing."""
+    requested = _fake_feed(monkeypatch, total=500)
+    known = {"0000000150-26-000150"}
+
+    scraper = SECEdgarScraper(delay=0)
+    filings = scraper.scrape(limit=500, known=lambda accs: known.intersection(accs))
+
+    assert len(filings) == 150
+    assert scraper.reached_known
+    assert requested == [0, 100]
+
+
+MESSY_PAGE = b"""<html><body>
+<table class="header"><tr><td>not this one</td></tr></table>
+<table class="tableFile2 summary" summary="Results">
+<tr><th>Form</th><th>Company</th><th></th><th>Filed</th><th></th></tr>
+<tr><td nowrap> 10-K/A </td>
+<td><a href="/cgi-bin/browse-edgar?action=getcompany&amp;CIK=0000320193&amp;accession-number=0000320193-26-000011">
+Apple <b>Inc.</b> &amp; Co</a> (Filer)</td><td>x</td><td>2026-02-06<br/></td><td>y</td></tr>
+<tr><td>too</td><td>short</td></tr>
+<tr><td>4</td><td>No Link Corp</td><td></td><td>2026-02-05</td><td></td></tr>
+<tr><td>8-K</td><td><a href="https://example.com/CIK=42">Abs</a></td><td></td><td>2026-02-04</td><td></td></tr>
+</table></body></html>"""
+
+
+@pytest.mark.parametrize("content", [MESSY_PAGE, feed_page(0, 100)])
+@pytest.mark.parametrize("limit", [2, 100])
+def test_lxml_parser_matches_bs4(content, limit):
+    """Test the lxml parser produces exactly the BeautifulSoup parser's output."""
+    fast = SECEdgarScraper(delay=0, parser="lxml")
+    slow = SECEdgarScraper(delay=0, parser="bs4")
+
+    expected = slow.parse_feed_page(content, limit, scraped_at="t")
+
+    assert fast.parse_feed_page(content, limit, scraped_at="t") == expected
+    assert len(expected[0]) > 0
+
+
+def test_messy_page_fields():
+    """Test entity decoding, nested markup and CIK/accession extraction."""
+    filings = SECEdgarScraper(delay=0).parse_page(MESSY_PAGE, 100, scraped_at="t")
+
+    assert filings[0].filing_type == "10-K/A"
+    assert filings[0].company_name == "AppleInc.& Co(Filer)"
+    assert filings[0].cik == "320193"
+    assert filings[0].accession_number == "0000320193-26-000011"
+    assert filings[1].document_url == ""
+    assert filings[2].cik == "42"
+
+
+def test_scrape_stops_at_cursor(monkeypatch):
+    """Test that paging and parsing end at the stored high-water mark."""
+    requested = _fake_feed(monkeypatch, total=500)
+
+    scraper = SECEdgarScraper(delay=0)
+    filings = scraper.scrape(limit=500, cursor=("0000000120-26-000120", "2026-02-06"))
+
+    assert len(filings) == 120
+    assert scraper.reached_known
+    assert requested == [0, 100]
+    assert scraper.pages_fetched == 2
+
+
+def test_scrape_stops_at_older_filing_date(monkeypatch):
+    """Test that a filing dated before the cursor ends the crawl."""
+    requested = _fake_feed(monkeypatch, total=300)
+
+    scraper = SECEdgarScraper(delay=0)
+    filings = scraper.scrape(limit=300, cursor=("unseen", "2026-02-07"))
+
+    assert filings == [] and scraper.reached_known
+    assert requested == [0] and scraper.pages_fetched == 1
@@ -0,0 +1,55 @@
+"""Test the robots.txt cache."""
+
+from hootscrapper import utils
+from hootscrapper.robots import RobotsCache
+from hootscrapper.utils import RateLimiter
+
+ROBOTS = b"User-agent: *\nDisallow: /private/\n"
+
+
+def test_policy_fetched_once_per_host(edgar_server):
+    """Test many checks against one host share a single fetch."""
+    edgar_server.routes["/robots.txt"] = ROBOTS
+    cache = RobotsCache(rate_limiter=RateLimiter(delay=0))
+
+    results = cache.can_fetch_many(
+        [f"{edgar_server.url}/public/{i}" for i in range(5)] + [f"{edgar_server.url}/private/x"]
+    )
+
+    assert list(results.values()) == [True] * 5 + [False]
+    assert edgar_server.requests.count("/robots.txt") == 1
+
+
+def test_policy_persisted_in_database(edgar_server, tmp_path):
+    """Test a second cache instance reuses the policy stored in SQLite."""
+    edgar_server.routes["/robots.txt"] = ROBOTS
+    db_path = str(tmp_path / "hoot.sqlite")
+
+    RobotsCache(db_path=db_path, rate_limiter=RateLimiter(delay=0)).policy(edgar_server.url)
+    fresh = RobotsCache(db_path=db_path, rate_limiter=RateLimiter(delay=0))
+
+    assert not fresh.can_fetch(f"{edgar_server.url}/private/x")
+    assert edgar_server.requests.count("/robots.txt") == 1
+
+
+def test_expired_policy_revalidated_with_etag(edgar_server):
+    """Test an expired entry is revalidated and a 304 keeps the cached policy."""
+    edgar_server.routes["/robots.txt"] = ROBOTS
+    edgar_server.headers["/robots.txt"] = {"ETag": '"v1"'}
+    cache = RobotsCache(ttl=0, rate_limiter=RateLimiter(delay=0))
+
+    assert not cache.can_fetch(f"{edgar_server.url}/private/x")
+    assert not cache.can_fetch(f"{edgar_server.url}/private/y")
+    assert edgar_server.requests.count("/robots.txt") == 2
+
+
+def test_missing_robots_allows_all_and_server_error_disallows(edgar_server, monkeypatch):
+    """Test a 404 robots.txt allows everything and a 5xx disallows everything."""
+    monkeypatch.setattr(utils, "RETRY_BACKOFF", 0.01)
+    cache = RobotsCache(rate_limiter=RateLimiter(delay=0))
+
+    assert cache.can_fetch(f"{edgar_server.url}/anything")
+
+    edgar_server.failures["/robots.txt"] = [503] * 10
+    down = RobotsCache(rate_limiter=RateLimiter(delay=0))
+    assert not down.can_fetch(f"{edgar_server.url}/anything")
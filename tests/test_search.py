@@ -0,0 +1,72 @@
+"""Test full-text search."""
+
+from hootscrapper.scrapers.sec_edgar import Filing
+from hootscrapper.search import match_expression, search
+from hootscrapper.storage import FilingStorage
+
+COMPANIES = [
+    ("Apple Inc.", "10-K"),
+    ("Apple Hospitality REIT", "8-K"),
+    ("Applied Materials Inc", "10-Q"),
+    ("Microsoft Corp", "10-K"),
+    ("Pineapple Energy", "8-K"),
+]
+
+
+def _storage(tmp_path) -> FilingStorage:
+    storage = FilingStorage(str(tmp_path / "hoot.sqlite"))
+    storage.insert_filings(
+        Filing(
+            cik=str(n),
+            company_name=name,
+            filing_type=filing_type,
+            filing_date=f"2026-02-0{n + 1}",
+            accession_number=f"{n:010d}-26-{n:06d}",
+            document_url="",
+            scraped_at="2026-02-06T00:00:00",
+        )
+        for n, (name, filing_type) in enumerate(COMPANIES)
+    )
+    return storage
+
+
+def test_prefix_search_is_ranked_and_paginated(tmp_path):
+    """Test prefix matches, whole-word matching and page boundaries."""
+    with _storage(tmp_path) as storage:
+        names = [r["company_name"] for r in search(storage, "appl").results]
+        assert set(names) == {"Apple Inc.", "Apple Hospitality REIT", "Applied Materials Inc"}
+
+        exact = search(storage, "apple", prefix=False)
+        assert {r["company_name"] for r in exact.results} == {
+            "Apple Inc.",
+            "Apple Hospitality REIT",
+        }
+
+        first = search(storage, "appl", page_size=2)
+        second = search(storage, "appl", page=2, page_size=2)
+        assert first.has_more and not second.has_more
+        assert len(first.results) == 2 and len(second.results) == 1
+
+        assert [r["company_name"] for r in search(storage, "apple 10-k").results] == ["Apple Inc."]
+
+
+def test_fuzzy_search_matches_misspellings(tmp_path):
+    """Test fuzzy mode finds close spellings from the index vocabulary."""
+    with _storage(tmp_path) as storage:
+        assert search(storage, "mircosoft", prefix=False).results == []
+        fuzzy = search(storage, "mircosoft", prefix=False, fuzzy=True)
+        assert [r["company_name"] for r in fuzzy.results] == ["Microsoft Corp"]
+
+
+def test_index_follows_updates_and_rebuilds_for_old_databases(tmp_path):
+    """Test triggers keep the index in sync and a missing index is rebuilt."""
+    with _storage(tmp_path) as storage:
+        with storage.conn:
+            storage.conn.execute("UPDATE filings SET company_name = 'Alphabet Inc' WHERE cik = '3'")
+            storage.conn.execute("DROP TABLE filings_fts_vocab")
+            storage.conn.execute("DROP TABLE filings_fts")
+        assert match_expression('Al"pha bet') == '"al"* AND "pha"* AND "bet"*'
+
+    with FilingStorage(str(tmp_path / "hoot.sqlite")) as storage:
+        assert [r["cik"] for r in search(storage, "alphabet").results] == ["3"]
+        assert search(storage, "microsoft").results == []
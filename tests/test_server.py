@@ -0,0 +1,121 @@
+"""Test the read-only HTTP API."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from contextlib import ExitStack
+from typing import Optional
+
+import pytest
+
+from hootscrapper import server as server_module
+from hootscrapper.scrapers.sec_edgar import Filing
+from hootscrapper.server import FilingServer
+from hootscrapper.storage import FilingStorage
+
+
+def _filing(n: int) -> Filing:
+    return Filing(
+        cik=str(n % 2),
+        company_name="Apple Inc" if n % 2 else "Microsoft Corp",
+        filing_type="8-K",
+        filing_date=f"2026-02-{n % 28 + 1:02d}",
+        accession_number=f"{n:010d}-26-{n:06d}",
+        document_url="",
+        scraped_at="2026-02-06T00:00:00",
+    )
+
+
+@pytest.fixture
+def api(tmp_path):
+    """Run the API over a small database; yields (base_url, writable storage)."""
+    db_path = str(tmp_path / "hoot.sqlite")
+    storage = FilingStorage(db_path)
+    storage.insert_filings(_filing(n) for n in range(50))
+
+    server = FilingServer(("127.0.0.1", 0), db_path, pool_size=2)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", storage, server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+    storage.close()
+
+
+def _get(url: str, headers: Optional[dict] = None):
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def test_filings_pages_stream_and_revalidate(api):
+    """Test JSON keyset pages, the NDJSON stream, ETags and the response cache."""
+    base, storage, server = api
+
+    status, headers, body = _get(f"{base}/filings?cik=1&limit=10")
+    page = json.loads(body)
+    assert status == 200 and len(page["filings"]) == 10 and page["next_cursor"]
+
+    rest = json.loads(_get(f"{base}/filings?cik=1&limit=100&after={page['next_cursor']}")[2])
+    assert len(rest["filings"]) == 15 and rest["next_cursor"] is None
+
+    lines = _get(f"{base}/filings?format=ndjson&type=8-K")[2].splitlines()
+    assert len(lines) == 50 and json.loads(lines[0])["filing_type"] == "8-K"
+    # Bad parameters are rejected before the stream starts
+    status, _, body = _get(f"{base}/filings?format=ndjson&after=bogus")
+    assert status == 400 and "error" in json.loads(body)
+    assert _get(f"{base}/filings?format=ndjson&limit=x")[0] == 400
+
+    assert _get(f"{base}/filings?cik=1&limit=10", {"If-None-Match": headers["ETag"]})[0] == 304
+    _get(f"{base}/filings?cik=1&limit=10")
+    assert server.cache.hits == 1
+
+    storage.insert_filings([_filing(101)])
+    status, fresh, _ = _get(f"{base}/filings?cik=1&limit=10", {"If-None-Match": headers["ETag"]})
+    assert status == 200 and fresh["ETag"] != headers["ETag"]
+
+
+def test_summary_search_and_errors(api):
+    """Test the summary and search endpoints and error statuses."""
+    base, _, _ = api
+
+    summary = json.loads(_get(f"{base}/summary")[2])
+    assert summary["total_filings"] == 50
+
+    results = json.loads(_get(f"{base}/search?q=micro&page_size=5")[2])
+    assert results["has_more"] and {r["company_name"] for r in results["results"]} == {
+        "Microsoft Corp"
+    }
+
+    assert _get(f"{base}/filings?after=bogus")[0] == 400
+    assert _get(f"{base}/nope")[0] == 404
+
+
+def test_streams_page_through_the_pool_and_busy_pool_fails_fast(api, monkeypatch):
+    """Test NDJSON streams hold no connection between pages and a busy pool returns 503."""
+    base, _, server = api
+    monkeypatch.setattr(server_module, "SERVE_STREAM_PAGE_SIZE", 7)
+
+    lines = server.stream_filings({"cik": ["1"]})
+    assert json.loads(next(lines))["cik"] == "1"
+    # A stream left unread borrows nothing
+    assert server.pool._idle.qsize() == 2
+    assert len(list(lines)) == 24
+    assert len(list(server.stream_filings({"limit": ["10"]}))) == 10
+
+    server.pool.timeout = 0.05
+    with ExitStack() as stack:
+        for _ in range(2):
+            stack.enter_context(server.pool.acquire())
+        status, _, body = _get(f"{base}/summary")
+        assert status == 503 and "busy" in json.loads(body)["error"]
+
+        # Health needs no connection and carries no validator to revalidate against
+        status, headers, _ = _get(f"{base}/health")
+        assert status == 200 and "ETag" not in headers
+    assert _get(f"{base}/summary")[0] == 200
@@ -0,0 +1,171 @@
+"""Test time-partitioned shards."""
+
+import sqlite3
+from datetime import date, datetime, timedelta
+
+from hootscrapper.models import Filing
+from hootscrapper.shards import SHARD_ID_SPAN, ShardedStorage, open_storage, shard_dates
+from hootscrapper.storage import FilingQuery, FilingStorage
+
+TODAY = datetime.utcnow().date()
+
+
+def _filings(count: int, start: int = 0, newest: date = TODAY) -> list:
+    """Filings nine days apart, going back up to 400 days; every 17th has no date."""
+    filings = []
+    for n in range(start, start + count):
+        filed = newest - timedelta(days=(n * 9) % 400)
+        filings.append(
+            Filing(
+                cik=str(100 + n % 5),
+                company_name=f"Corp {n % 5}",
+                filing_type=["8-K", "10-K", "4"][n % 3],
+                filing_date="" if n % 17 == 16 else filed.isoformat(),
+                accession_number=f"{100 + n % 5:010d}-{filed.year % 100:02d}-{n:06d}",
+                document_url=None,
+                scraped_at="2026-02-06T12:00:00",
+            )
+        )
+    return filings
+
+
+def _accessions(rows) -> list:
+    return [row["accession_number"] for row in rows]
+
+
+def test_sharded_reads_match_a_single_database(tmp_path):
+    """Test routing by quarter, merged summaries, cross-shard pagination and exports."""
+    assert shard_dates("2024Q4") == ("2024-10-01", "2024-12-31")
+    filings = _filings(60)
+    with FilingStorage(str(tmp_path / "single.db")) as single:
+        single.insert_filings(filings)
+        expected_all = single.get_all_filings()
+        expected_summary = single.get_summary(top=100)
+        expected_window = single.get_summary(days=30, top=100)
+        expected_query = _accessions(single.query(FilingQuery(filing_types=["4", "8-K"])))
+
+    path = str(tmp_path / "shards")
+    with ShardedStorage(path, period="quarter") as storage:
+        assert storage.insert_filings(filings) == 60
+        assert storage.insert_filings(filings[10:20]) == 0
+        keys = storage._keys()
+        assert len(keys) >= 5 and keys[0] == storage.hot_key() and keys[-1] == "undated"
+        rows = storage.get_all_filings()
+        # Each shard numbers its rows from its own base
+        assert min(row["id"] for row in rows) == SHARD_ID_SPAN + 1
+        assert [row["filing_date"] for row in rows] == [row["filing_date"] for row in expected_all]
+        assert set(_accessions(rows)) == set(_accessions(expected_all))
+
+    with open_storage(path, read_only=True) as storage:
+        assert isinstance(storage, ShardedStorage)
+        window = storage.get_summary(days=30, top=100)
+        # A recent window only opens the shards it overlaps
+        assert set(storage._shards) <= {storage.hot_key(), storage.hot_key(TODAY - timedelta(30))}
+        assert window["total_filings"] == expected_window["total_filings"]
+        assert window["filings_by_day"] == [tuple(r) for r in expected_window["filings_by_day"]]
+        summary = storage.get_summary(top=100)
+        assert summary["total_filings"] == expected_summary["total_filings"] == 60
+        assert dict(summary["top_filing_types"]) == dict(expected_summary["top_filing_types"])
+        assert dict(summary["top_companies"]) == dict(expected_summary["top_companies"])
+
+        pages, cursor = [], None
+        while True:
+            rows, cursor = storage.query_page(
+                FilingQuery(filing_types=["4", "8-K"]), after=cursor, page_size=7
+            )
+            pages.extend(rows)
+            if cursor is None:
+                break
+        assert _accessions(pages) == expected_query
+
+        known = [filings[0].accession_number, filings[16].accession_number, "0000000100-26-999999"]
+        assert storage.existing_accessions(known) == set(known[:2])
+
+    with ShardedStorage(path) as storage:
+        assert storage.export_to_csv(str(tmp_path / "all.csv"), since="last") == 60
+        assert storage.export_to_csv(str(tmp_path / "none.csv"), since="last") == 0
+        # A late filing in an old shard is still picked up
+        late = _filings(1, start=40)[0]
+        late.accession_number = "0000000999-25-000001"
+        storage.insert_filings([late])
+        assert storage.export_to_csv(str(tmp_path / "late.csv"), since="last") == 1
+
+
+def test_import_and_maintain_close_old_shards(tmp_path):
+    """Test importing a single database, closing finished shards and reopening one for a write."""
+    source = str(tmp_path / "hoot.sqlite")
+    newest = date(2025, 6, 30)
+    with FilingStorage(source) as single:
+        single.insert_filings(_filings(40, newest=newest))
+        single.set_cursor("sec-edgar", "0000000100-26-000000", TODAY.isoformat())
+        single.set_watermark("csv", 30)
+
+    path = str(tmp_path / "shards")
+    with ShardedStorage(path, period="year") as storage:
+        assert storage.import_database(source) == 40
+        assert storage.import_database(source) == 0
+        assert storage.get_cursor("sec-edgar")[0] == "0000000100-26-000000"
+        # Ids, and with them the export watermark, carry over
+        assert sorted(row["id"] for row in storage.get_all_filings()) == list(range(1, 41))
+        assert storage.export_to_csv(str(tmp_path / "new.csv"), since="last") == 10
+
+        today = date(2025, 7, 1)
+        assert storage.maintain(today, close_after_days=0) == ["2024"]
+        assert storage.maintain(today, close_after_days=0) == []
+        old_path = storage.shard_path("2024")
+        assert old_path.stat().st_mode & 0o222 == 0
+        assert not old_path.with_name(old_path.name + "-wal").exists()
+        states = {shard["key"]: shard["state"] for shard in storage.shards(today)}
+        assert states == {"2025": "hot", "2024": "closed", "undated": "open"}
+
+    with ShardedStorage(path, read_only=True) as storage:
+        assert storage.get_summary()["total_filings"] == 40
+        conn = sqlite3.connect(storage.shard_path("2024"))
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0]
+        conn.close()
+
+    with ShardedStorage(path) as storage:
+        late = _filings(1, start=30, newest=newest)[0]
+        assert late.filing_date.startswith("2024")
+        late.accession_number = "0000000999-25-000001"
+        assert storage.insert_filings([late]) == 1
+        assert storage.shards()[1]["state"] == "open"
+        assert storage.get_summary()["total_filings"] == 41
+
+
+def test_top_companies_merge_only_the_heads_of_shards(tmp_path, monkeypatch):
+    """Test a company leading no single shard still tops the merged summary."""
+    counts = {"2023": {"A": 5, "C": 4}, "2024": {"B": 5, "C": 4}, "2025": {"D": 5, "C": 4}}
+    filings = [
+        Filing(
+            cik=name,
+            company_name=name,
+            filing_type="8-K",
+            filing_date=f"{year}-06-01",
+            accession_number=f"{n:010d}-{year[2:]}-{i:06d}",
+            document_url=None,
+            scraped_at="2026-02-06T12:00:00",
+        )
+        for n, (year, companies) in enumerate(counts.items())
+        for name, count in companies.items()
+        for i in range(count * 10, count * 10 + count)
+    ]
+    with FilingStorage(str(tmp_path / "single.db")) as single:
+        single.insert_filings(filings)
+        expected = dict(single.get_summary(top=10)["top_companies"])
+
+    with ShardedStorage(str(tmp_path / "shards"), period="year") as storage:
+        storage.insert_filings(filings)
+        requested = []
+        get_summary = FilingStorage.get_summary
+
+        def spy(self, *args, **kwargs):
+            requested.append(kwargs.get("company_top"))
+            return get_summary(self, *args, **kwargs)
+
+        monkeypatch.setattr(FilingStorage, "get_summary", spy)
+        assert storage.get_summary(top=1)["top_companies"] == [("C", 12)]
+        # No shard was asked for all of its companies
+        assert -1 not in requested and max(requested) == 2
+        assert dict(storage.get_summary(top=10)["top_companies"]) == expected
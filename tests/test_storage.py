@@ -1,10 +1,16 @@
 """Test SQLite storage."""
 
+import csv
+import gzip
+import sqlite3
 import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
 
+import pytest
+
 from hootscrapper.scrapers.sec_edgar import Filing
-from hootscrapper.storage import FilingStorage
+from hootscrapper.storage import FilingQuery, FilingStorage
 
 
 def test_storage_insert_and_retrieve():
@@ -66,3 +72,223 @@ def test_storage_duplicate_handling():
 
         all_filings = storage.get_all_filings()
         assert len(all_filings) == 1
+
+
+def _filing(n: int, url: str = "https://www.sec.gov/test") -> Filing:
+    return Filing(
+        cik=str(n),
+        company_name=f"Corp {n}",
+        filing_type="8-K",
+        filing_date="2026-02-06",
+        accession_number=f"0000000000-26-{n:06d}",
+        document_url=url,
+        scraped_at="2026-02-06T00:00:00",
+    )
+
+
+def test_bulk_insert_counts_from_generator():
+    """Test chunked bulk insert from a generator reports exact counts."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = FilingStorage(str(Path(tmpdir) / "test.db"))
+        storage.insert_filings([_filing(n) for n in range(50)])
+
+        result = storage.bulk_insert((_filing(n) for n in range(25, 125)), batch_size=30)
+
+        assert (result.inserted, result.skipped, result.updated) == (75, 25, 0)
+        assert len(storage.get_all_filings()) == 125
+
+
+def test_bulk_insert_upsert_refreshes_existing_rows():
+    """Test upsert mode updates document_url of duplicates."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = FilingStorage(str(Path(tmpdir) / "test.db"))
+        storage.insert_filings([_filing(n) for n in range(10)])
+
+        result = storage.bulk_insert(
+            (_filing(n, url="https://www.sec.gov/new") for n in range(5, 15)), upsert=True
+        )
+
+        assert (result.inserted, result.updated) == (5, 5)
+        urls = {f["accession_number"]: f["document_url"] for f in storage.get_all_filings()}
+        assert urls["0000000000-26-000000"] == "https://www.sec.gov/test"
+        assert urls["0000000000-26-000007"] == "https://www.sec.gov/new"
+
+
+def test_scrape_cursor_only_moves_forward(tmp_path):
+    """Test a source's high-water mark is stored and never moves back."""
+    with FilingStorage(str(tmp_path / "test.db")) as storage:
+        assert storage.get_cursor("sec-edgar") is None
+
+        storage.set_cursor("sec-edgar", "0000000002-26-000002", "2026-02-06")
+        storage.set_cursor("sec-edgar", "0000000001-26-000001", "2026-02-05")
+
+        assert storage.get_cursor("sec-edgar") == ("0000000002-26-000002", "2026-02-06")
+        assert storage.get_cursor("sec-full-index") is None
+
+
+def test_storage_connection_profile_and_read_only():
+    """Test the pragma profile is applied and read-only mode rejects writes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "test.db")
+
+        with FilingStorage(db_path) as storage:
+            assert storage.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert storage.conn is storage.conn  # one long-lived connection
+            storage.insert_filings([_filing(1)])
+
+        with FilingStorage(db_path, read_only=True) as reader:
+            assert reader.get_summary()["total_filings"] == 1
+            with pytest.raises(sqlite3.OperationalError):
+                reader.insert_filings([_filing(2)])
+
+
+def test_export_streams_incremental_compressed_csv(tmp_path):
+    """Test gzip export and that --since last only exports new rows."""
+    with FilingStorage(str(tmp_path / "test.db")) as storage:
+        storage.insert_filings([_filing(n) for n in range(10)])
+
+        full = tmp_path / "full.csv.gz"
+        assert storage.export_to_csv(str(full), since="last") == 10
+        with gzip.open(full, "rt") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 10
+        assert rows[0]["accession_number"].startswith("0000000000-26-")
+
+        storage.insert_filings([_filing(n) for n in range(10, 13)])
+        # Full and timestamp exports leave the watermark alone
+        assert storage.export_to_csv(str(tmp_path / "all.csv")) == 13
+        assert storage.export_to_csv(str(tmp_path / "ts.csv"), since="2000-01-01") == 13
+        delta = tmp_path / "delta.csv"
+        assert storage.export_to_csv(str(delta), since="last") == 3
+        assert storage.export_to_csv(str(tmp_path / "empty.csv"), since="last") == 0
+        assert not (tmp_path / "empty.csv").exists()
+
+        with open(delta) as f:
+            assert [r["cik"] for r in csv.DictReader(f)] == ["10", "11", "12"]
+
+
+def test_query_filters_and_keyset_pages(tmp_path):
+    """Test filtered queries page with cursors and use the composite indexes."""
+    with FilingStorage(str(tmp_path / "test.db")) as storage:
+        storage.insert_filings(
+            Filing(
+                cik=str(n % 3),
+                company_name=f"Corp {n % 3}",
+                filing_type="8-K" if n % 2 else "10-Q",
+                filing_date=f"2025-{n % 12 + 1:02d}-15",
+                accession_number=f"{n:010d}-25-{n:06d}",
+                document_url="",
+                scraped_at="2025-12-31T00:00:00",
+            )
+            for n in range(120)
+        )
+        filters = FilingQuery(
+            cik="0000000001", filing_types=["8-K"], date_from="2025-07-01", date_to="2025-09-30"
+        )
+        expected = [
+            r["id"]
+            for r in storage.get_all_filings()
+            if r["cik"] == "1"
+            and r["filing_type"] == "8-K"
+            and "2025-07" <= r["filing_date"] < "2025-10"
+        ]
+
+        pages, after = [], None
+        while True:
+            rows, after = storage.query_page(filters, after=after, page_size=3)
+            pages.append([r["id"] for r in rows])
+            if after is None:
+                break
+
+        streamed = [r["id"] for r in storage.query(filters, batch_size=2)]
+        assert sorted(streamed) == sorted(expected) and len(streamed) == 10
+        assert [i for page in pages for i in page] == streamed
+        assert len(pages) == 4
+
+        dates = [r["filing_date"] for r in storage.query(FilingQuery(company="corp"), limit=50)]
+        assert len(dates) == 50 and dates == sorted(dates, reverse=True)
+
+        plan = " ".join(
+            row[-1]
+            for row in storage.conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM filings WHERE cik = ? AND filing_date >= ? "
+                "ORDER BY filing_date DESC, id DESC",
+                ("1", "2025-07-01"),
+            )
+        )
+        assert "idx_cik_filing_date" in plan and "TEMP B-TREE" not in plan
+
+
+def test_summary_counters_follow_writes_and_windows(tmp_path):
+    """Test counters match a full scan after inserts, updates, deletes and a rebuild."""
+    today = datetime.utcnow().date()
+    with FilingStorage(str(tmp_path / "test.db")) as storage:
+        storage.bulk_insert(
+            Filing(
+                cik=str(n % 8),  # two CIKs per company name
+                company_name=f"Corp {n % 4}",
+                filing_type=["8-K", "10-K", "4"][n % 3],
+                filing_date=(today - timedelta(days=n % 30)).isoformat(),
+                accession_number=f"{n:010d}-26-{n:06d}",
+                document_url="",
+                scraped_at="2026-02-06T00:00:00",
+            )
+            for n in range(300)
+        )
+        with storage.conn:
+            storage.conn.execute("UPDATE filings SET filing_type = '8-K/A' WHERE id <= 10")
+            storage.conn.execute("DELETE FROM filings WHERE id > 290")
+        storage.bulk_insert([_filing(0, url="https://www.sec.gov/new")], upsert=True)
+
+        def scanned(where: str = "", params: tuple = (), column: str = "filing_type") -> dict:
+            rows = storage.conn.execute(
+                f"SELECT {column}, COUNT(*) FROM filings {where} GROUP BY {column}", params
+            )
+            return dict(rows.fetchall())
+
+        summary = storage.get_summary(top=10)
+        assert summary["total_filings"] == 290
+        assert dict(summary["top_filing_types"]) == scanned()
+        assert dict(summary["top_companies"]) == scanned(column="company_name")
+
+        week = storage.get_summary(days=7)
+        since = (today - timedelta(days=6)).isoformat()
+        assert week["since"] == since
+        assert dict(week["top_filing_types"]) == scanned("WHERE filing_date >= ?", (since,))
+        assert len(week["filings_by_day"]) == 7
+
+        with storage.conn:
+            storage.conn.execute("DELETE FROM summary_by_type")
+        storage.rebuild_summary()
+        assert dict(storage.get_summary()["top_filing_types"]) == scanned()
+
+
+def test_company_counters_are_keyed_by_name(tmp_path):
+    """Test top companies walk the count index and old per-CIK counters are folded."""
+    db_path = str(tmp_path / "test.db")
+    with FilingStorage(db_path) as storage:
+        plan = " ".join(
+            row[-1]
+            for row in storage.conn.execute(
+                "EXPLAIN QUERY PLAN "
+                "SELECT company_name, count FROM summary_by_company ORDER BY count DESC LIMIT 10"
+            )
+        )
+        assert "idx_summary_by_company_count" in plan and "TEMP B-TREE" not in plan
+
+        # Recreate the counters as earlier versions kept them, one per (name, CIK)
+        with storage.conn:
+            storage.conn.execute("DROP TABLE summary_by_company")
+            storage.conn.execute(
+                "CREATE TABLE summary_by_company (company_name TEXT NOT NULL, cik TEXT NOT NULL,"
+                " count INTEGER NOT NULL, PRIMARY KEY (company_name, cik))"
+            )
+            storage.conn.executemany(
+                "INSERT INTO summary_by_company VALUES (?, ?, ?)",
+                [("Corp", "1", 2), ("Corp", "2", 3), ("Other", "3", 4)],
+            )
+
+    with FilingStorage(db_path) as storage:
+        assert storage.get_summary()["top_companies"] == [("Corp", 5), ("Other", 4)]
+        storage.bulk_insert([_filing(1)])
+        assert storage.get_summary()["top_companies"] == [("Corp", 5), ("Other", 4), ("Corp 1", 1)]
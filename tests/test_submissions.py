@@ -0,0 +1,136 @@
+"""Test the submissions JSON source and the watchlist scheduler."""
+
+import json
+import time
+import zipfile
+from datetime import date
+
+from hootscrapper.scrapers import sec_submissions
+from hootscrapper.scrapers.sec_submissions import SubmissionsSource, parse_columns
+from hootscrapper.storage import FilingStorage
+from hootscrapper.utils import RateLimiter
+from hootscrapper.watchlist import Watchlist, poll_interval
+
+
+def _document(cik: int, name: str, dates: list, files: list = ()) -> dict:
+    return {
+        "cik": str(cik),
+        "name": name,
+        "filings": {
+            "recent": {
+                "accessionNumber": [f"{cik:010d}-26-{i:06d}" for i in range(len(dates))],
+                "filingDate": dates,
+                "form": ["8-K"] * len(dates),
+                "primaryDocument": [f"doc{i}.htm" for i in range(len(dates))],
+            },
+            "files": list(files),
+        },
+    }
+
+
+def test_parse_columns_and_bulk_zip(tmp_path):
+    """Test columnar parsing, the since filter and paged history files in a zip."""
+    document = _document(320193, "Apple Inc.", ["2026-02-06", "2026-01-15", "2025-11-01"])
+    filings = list(parse_columns(document["filings"]["recent"], "320193", "Apple Inc."))
+    assert [f.filing_date for f in filings] == ["2026-02-06", "2026-01-15", "2025-11-01"]
+    assert filings[0].document_url.endswith("/edgar/data/320193/000032019326000000/doc0.htm")
+    assert (
+        len(list(parse_columns(document["filings"]["recent"], "1", "x", since="2026-01-01"))) == 2
+    )
+
+    older = {
+        "accessionNumber": ["0000320193-19-000001"],
+        "filingDate": ["2019-05-01"],
+        "form": ["10-Q"],
+    }
+    document["filings"]["files"] = [
+        {"name": "CIK0000320193-submissions-001.json", "filingTo": "2019-12-31"}
+    ]
+    path = tmp_path / "submissions.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("CIK0000320193.json", json.dumps(document))
+        archive.writestr("CIK0000320193-submissions-001.json", json.dumps(older))
+        archive.writestr(
+            "CIK0000789019.json", json.dumps(_document(789019, "MSFT", ["2026-02-01"]))
+        )
+
+    assert len(list(SubmissionsSource().iter_zip(str(path)))) == 4
+    history = list(SubmissionsSource(history=True).iter_zip(str(path), ciks=["320193"]))
+    assert [f.accession_number for f in history][-1] == "0000320193-19-000001"
+    assert history[-1].document_url.endswith("/edgar/data/320193/0000320193-19-000001.txt")
+
+
+def test_watchlist_polls_due_companies(edgar_server, monkeypatch, tmp_path):
+    """Test polling priority, incremental inserts, error handling and rescheduling."""
+    monkeypatch.setattr(sec_submissions, "SEC_SUBMISSIONS_URL", edgar_server.url + "/submissions")
+    edgar_server.routes["/submissions/CIK0000320193.json"] = json.dumps(
+        _document(320193, "Apple Inc.", ["2026-02-06", "2026-01-15"])
+    ).encode()
+    edgar_server.routes["/submissions/CIK0000789019.json"] = json.dumps(
+        _document(789019, "Microsoft Corp", ["2025-06-01"])
+    ).encode()
+
+    storage = FilingStorage(str(tmp_path / "test.db"))
+    watchlist = Watchlist(storage)
+    watchlist.add(["320193", "0000789019"])
+    watchlist.add(["999"], priority=5)  # not served: 404
+    source = SubmissionsSource(rate_limiter=RateLimiter(delay=0))
+
+    assert [row[0] for row in watchlist.due(10)] == ["999", "320193", "789019"]
+    result = watchlist.poll(source, max_requests=2)
+    assert (result.polled, result.errors, result.inserted) == (2, 1, 2)
+    assert [row[0] for row in watchlist.due(10)] == ["789019"]
+
+    result = watchlist.poll(source)
+    assert (result.polled, result.inserted) == (1, 1)
+    entries = {e["cik"]: e for e in watchlist.entries()}
+    assert entries["789019"]["company_name"] == "Microsoft Corp"
+    assert entries["320193"]["last_filing_date"] == "2026-02-06"
+    assert entries["999"]["last_error"]
+
+    # Nothing is due until the schedule says so; then unchanged companies insert nothing
+    assert watchlist.due(10) == []
+    assert watchlist.poll(source).polled == 0
+    assert watchlist.due(10, now=time.time() + 365 * 86400)
+    with storage.conn as conn:
+        conn.execute("UPDATE watchlist SET next_poll_at = 0")
+    result = watchlist.poll(source)
+    assert (result.polled, result.inserted, result.skipped) == (3, 0, 2)
+
+    # A missing history file fails that company only, and it is still rescheduled
+    history = [{"name": "CIK0000000042-submissions-001.json", "filingTo": "2025-12-31"}]
+    edgar_server.routes["/submissions/CIK0000000042.json"] = json.dumps(
+        _document(42, "Hist Corp", ["2026-02-06"], files=history)
+    ).encode()
+    watchlist.add(["42"])
+    result = watchlist.poll(SubmissionsSource(rate_limiter=RateLimiter(delay=0), history=True))
+    assert (result.polled, result.errors, result.inserted) == (1, 1, 0)
+    assert watchlist.due(10) == []
+
+    today = date(2026, 2, 6)
+    assert poll_interval(0, "2026-02-05", today, base=3600) == 3600
+    assert poll_interval(1, "2026-02-05", today, base=3600) == 1800
+    assert poll_interval(0, "2025-12-08", today, base=3600) > 8 * 3600
+    assert poll_interval(0, "2000-01-01", today, base=3600, max_interval=86400) == 86400
+
+
+def test_watchlist_first_poll_loads_history_of_stored_company(edgar_server, monkeypatch, tmp_path):
+    """Test a company with filings stored before it was added is still loaded in full."""
+    monkeypatch.setattr(sec_submissions, "SEC_SUBMISSIONS_URL", edgar_server.url + "/submissions")
+    document = _document(320193, "Apple Inc.", ["2026-02-06", "2026-01-15", "2025-11-01"])
+    edgar_server.routes["/submissions/CIK0000320193.json"] = json.dumps(document).encode()
+    source = SubmissionsSource(rate_limiter=RateLimiter(delay=0))
+
+    storage = FilingStorage(str(tmp_path / "test.db"))
+    storage.insert_filings(source.iter_document(document, since="2026-02-06"))
+    watchlist = Watchlist(storage)
+    watchlist.add(["320193"])
+    assert watchlist.entries()[0]["last_filing_date"] == "2026-02-06"
+
+    result = watchlist.poll(source)
+    assert (result.polled, result.errors, result.inserted, result.skipped) == (1, 0, 2, 1)
+
+    with storage.conn as conn:
+        conn.execute("UPDATE watchlist SET next_poll_at = 0")
+    assert (watchlist.poll(source).inserted, watchlist.due(10)) == (0, [])
+    storage.close()
@@ -0,0 +1,47 @@
+"""Test the polling daemon."""
+
+import json
+import os
+import signal
+import threading
+
+from hootscrapper.scrapers import sec_edgar
+from hootscrapper.scrapers.sec_edgar import SECEdgarScraper
+from hootscrapper.storage import FilingStorage
+from hootscrapper.watch import Watcher, next_interval
+
+
+def test_next_interval_adapts_within_bounds():
+    """Test busy cycles shorten the interval and quiet ones lengthen it."""
+    assert next_interval(40, 5, 5, 300) == 20
+    assert next_interval(40, 250, 5, 300) == 5
+    assert next_interval(40, 0, 5, 300) == 60
+    assert next_interval(250, 0, 5, 300) == 300
+
+
+def test_watch_polls_incrementally_and_stops_on_sigterm(edgar_server, monkeypatch, tmp_path):
+    """Test cycles insert only new filings and SIGTERM exits cleanly."""
+    edgar_server.total = 150
+    monkeypatch.setattr(sec_edgar, "SEC_CURRENT_URL", edgar_server.feed_url())
+    status_path = tmp_path / "status.json"
+
+    with FilingStorage(str(tmp_path / "hoot.sqlite")) as storage:
+        watcher = Watcher(
+            storage,
+            SECEdgarScraper(delay=0),
+            min_interval=0.01,
+            max_interval=0.05,
+            status_path=str(status_path),
+        )
+        assert watcher.poll() == 150
+        assert watcher.poll() == 0
+
+        timer = threading.Timer(0.3, os.kill, (os.getpid(), signal.SIGTERM))
+        timer.start()
+        status = watcher.run()
+        timer.join()
+
+        assert status["state"] == "stopped" and status["cycles"] >= 1
+        assert status["total_new"] == 0 and status["errors"] == 0
+        assert json.loads(status_path.read_text())["state"] == "stopped"
+        assert storage.get_summary()["total_filings"] == 150